@@ -0,0 +1,103 @@
+"""
+Aggregate Cube Module - Pre-aggregated counts, sums and extremes over the main result dimensions
+Author: Aditya Kumar
+
+One groupby pass over the student rows produces a cube with one row per
+observed (college, course, semester, status) combination. Every roll-up the
+dashboard needs (per college, per course, overall) is then a groupby over
+the cube, which has a few hundred rows even for university-wide data.
+"""
+
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+CUBE_DIMENSIONS = ["College Name", "Course", "Semester", "Status"]
+
+# Additive measures roll up with sum; extremes with min/max
+CUBE_SUM_MEASURES = ["Students", "SGPA Count", "SGPA Sum", "CGPA Count", "CGPA Sum"]
+CUBE_MIN_MEASURES = ["SGPA Min", "CGPA Min"]
+CUBE_MAX_MEASURES = ["SGPA Max", "CGPA Max"]
+
+
+def build_cube(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Aggregates student rows into the cube.
+
+    Rows with a missing dimension value are kept (as a missing key), so
+    totals over the cube always match the frame.
+
+    Args:
+        df: Results frame
+
+    Returns:
+        DataFrame with the CUBE_DIMENSIONS present in `df` plus the
+        Students, SGPA/CGPA Count, Sum, Min and Max measures
+    """
+    dimensions = [column for column in CUBE_DIMENSIONS if column in df.columns]
+    sgpa = df["Current SGPA"]
+    cgpa = df["CGPA"] if "CGPA" in df.columns else pd.Series(np.nan, index=df.index)
+    rows = pd.DataFrame({
+        **{column: df[column] for column in dimensions},
+        "SGPA": sgpa,
+        "CGPA": cgpa,
+    })
+    if not dimensions:
+        rows["_all"] = 0
+        dimensions = ["_all"]
+    cube = rows.groupby(dimensions, observed=True, dropna=False).agg(**{
+        "Students": ("SGPA", "size"),
+        "SGPA Count": ("SGPA", "count"),
+        "SGPA Sum": ("SGPA", "sum"),
+        "SGPA Min": ("SGPA", "min"),
+        "SGPA Max": ("SGPA", "max"),
+        "CGPA Count": ("CGPA", "count"),
+        "CGPA Sum": ("CGPA", "sum"),
+        "CGPA Min": ("CGPA", "min"),
+        "CGPA Max": ("CGPA", "max"),
+    }).reset_index()
+    return cube.drop(columns="_all", errors="ignore")
+
+
+def rollup(cube: pd.DataFrame, by: Optional[List[str]] = None, dropna: bool = True) -> pd.DataFrame:
+    """
+    Rolls the cube up to the `by` dimensions (all students when empty).
+
+    Args:
+        cube: Output of `build_cube`
+        by: Dimensions to keep
+        dropna: Drop groups whose key is missing, like a plain groupby
+
+    Returns:
+        DataFrame with the `by` columns and Students, Passed, Failed,
+        Pass Rate %, Avg/Max/Min SGPA and Avg/Max/Min CGPA
+    """
+    by = list(by or [])
+    if "Status" in cube.columns:
+        passed = cube["Students"].where(cube["Status"] == "PASS", 0)
+        failed = cube["Students"].where(cube["Status"] == "FAIL", 0)
+    else:
+        passed = failed = pd.Series(0, index=cube.index)
+    measures = cube[CUBE_SUM_MEASURES + CUBE_MIN_MEASURES + CUBE_MAX_MEASURES].assign(Passed=passed, Failed=failed)
+
+    aggregations = {
+        **{measure: "sum" for measure in CUBE_SUM_MEASURES + ["Passed", "Failed"]},
+        **{measure: "min" for measure in CUBE_MIN_MEASURES},
+        **{measure: "max" for measure in CUBE_MAX_MEASURES},
+    }
+    if by:
+        rolled = measures.groupby([cube[column] for column in by], observed=True, dropna=dropna).agg(aggregations)
+        rolled = rolled.reset_index()
+    else:
+        rolled = measures.agg(aggregations).to_frame().T
+        rolled = rolled.astype({measure: "int64" for measure in ["Students", "SGPA Count", "CGPA Count", "Passed", "Failed"]})
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        rolled["Pass Rate %"] = rolled["Passed"] / rolled["Students"] * 100
+        rolled["Avg SGPA"] = rolled["SGPA Sum"] / rolled["SGPA Count"].where(rolled["SGPA Count"] > 0)
+        rolled["Avg CGPA"] = rolled["CGPA Sum"] / rolled["CGPA Count"].where(rolled["CGPA Count"] > 0)
+    return rolled[by + [
+        "Students", "Passed", "Failed", "Pass Rate %",
+        "Avg SGPA", "SGPA Max", "SGPA Min", "Avg CGPA", "CGPA Max", "CGPA Min",
+    ]].rename(columns={"SGPA Max": "Max SGPA", "SGPA Min": "Min SGPA", "CGPA Max": "Max CGPA", "CGPA Min": "Min CGPA"})
@@ -3,14 +3,198 @@ BEU API Scraper Module - Fetches student results using the official BEU API
 Author: Aditya Kumar
 """
 
+import asyncio
 import requests
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List, Dict, Optional
+from typing import Awaitable, Callable, Iterator, List, Dict, Optional, Set, Tuple
 import json
 
+import aiohttp
+
+from fetch_coordinator import get_fetch_coordinator
+from http_pool import DEFAULT_HEADERS, get_session, pool_trace_config
+from instrumentation import count, span
+from rate_limit import get_host_bucket
+from result_cache import get_result_cache
+from retry_policy import (
+    DEFAULT_RETRY_POLICY, RETRYABLE_STATUSES, RetryBudget, RetryPolicy,
+    get_circuit_breaker, is_client_error, parse_retry_after
+)
+
 BASE_URL = "https://www.beu-bih.ac.in/backend/v1/result/get-result"
 
+SEM_ROMANS = {
+    1: "I", 2: "II", 3: "III", 4: "IV",
+    5: "V", 6: "VI", 7: "VII", 8: "VIII"
+}
+
+# Outcomes of a single lookup
+FOUND = "found"
+MISSING = "missing"
+FAILED = "failed"
+
+# Probing: consecutive missing students that mark the end of a range
+DEFAULT_MISS_STREAK = 25
+
+# Lateral entry: numbers start at 901 and are discovered rather than assumed
+LE_START = 901
+LE_LAST = 999
+DEFAULT_LE_MISS_STREAK = 5
+
+# Async engine defaults: many requests in flight, throttled per host
+DEFAULT_ASYNC_CONCURRENCY = 200
+DEFAULT_RATE_PER_HOST = 20.0
+
+
+def build_result_url(
+    registration_no: str,
+    semester: str,
+    batch: int,
+    exam_month: str,
+    exam_year: int,
+    base_url: str = BASE_URL
+) -> str:
+    """Builds the get-result URL for one student."""
+    return f"{base_url}?year={batch}&redg_no={registration_no}&semester={semester}&exam_held={exam_month}/{exam_year}"
+
+
+def build_registration_list(
+    reg_start: int,
+    reg_end: int,
+    branch: str,
+    college: str,
+    batch: int
+) -> List[Tuple[str, int]]:
+    """Generates (registration_no, api_batch) pairs for a range of regular students."""
+    return [
+        (f"{batch}{branch}{college}{reg:03d}", batch)
+        for reg in range(int(reg_start), int(reg_end) + 1)
+    ]
+
+
+def build_lateral_list(
+    branch: str,
+    college: str,
+    batch: int,
+    first: int = LE_START,
+    last: int = LE_LAST
+) -> List[Tuple[str, int]]:
+    """Generates (registration_no, api_batch) pairs for LE numbers first..last (batch year +1)."""
+    le_batch = batch + 1
+    return [
+        (f"{le_batch}{branch}{college}{reg:03d}", le_batch)
+        for reg in range(first, last + 1)
+    ]
+
+
+def fetch_result_status(
+    registration_no: str,
+    semester: str,
+    batch: int,
+    exam_month: str,
+    exam_year: int,
+    retries: int = 3,
+    timeout: int = 15,
+    base_url: str = BASE_URL,
+    use_cache: bool = True,
+    retry_policy: Optional[RetryPolicy] = None,
+    retry_budget: Optional[RetryBudget] = None
+) -> Tuple[str, Optional[Dict]]:
+    """
+    Looks up one student and reports the outcome along with the payload.
+    Arguments are the same as `fetch_single_result`, plus:
+    
+    Args:
+        retry_policy: Backoff between attempts (default: jittered exponential)
+        retry_budget: Shared per-run cap on retries; None means unlimited
+    
+    Returns:
+        (FOUND, payload), (MISSING, None) when the API has no such student,
+        or (FAILED, None) when the request itself kept failing
+    """
+    exam_held = f"{exam_month}/{exam_year}"
+    if use_cache:
+        cache = get_result_cache()
+        cached = cache.get(registration_no, semester, exam_held)
+        if cached is not None:
+            count("cache.hits")
+            return FOUND, cached
+        if cache.is_missing(registration_no, semester, exam_held):
+            count("cache.hits")
+            return MISSING, None
+        count("cache.misses")
+    
+    url = build_result_url(registration_no, semester, batch, exam_month, exam_year, base_url)
+    policy = retry_policy or DEFAULT_RETRY_POLICY
+    breaker = get_circuit_breaker(url)
+    coordinator = get_fetch_coordinator()
+    
+    # Always at least one attempt, so a lookup can never fall through without an outcome
+    attempts = max(1, retries)
+    
+    def request() -> Tuple[str, Optional[Dict]]:
+        for attempt in range(attempts):
+            retry_after = None
+            try:
+                # Blocks while the breaker is open, so no worker keeps hammering a struggling server
+                breaker.wait_sync()
+                
+                # Polite delay to avoid overwhelming the server
+                with span("fetch.polite_sleep"):
+                    time.sleep(0.5)
+                
+                if retry_budget is not None:
+                    retry_budget.record_request()
+                count("requests")
+                
+                # Shared keep-alive session: reuses TCP/TLS connections across the run
+                with coordinator.slot(), span("fetch.request", engine="threaded"):
+                    response = get_session().get(url, timeout=timeout)
+                count("bytes.received", len(response.content))
+                if is_client_error(response.status_code):
+                    # The request itself was refused: retrying cannot help, and the host answered fine
+                    breaker.record_success()
+                    count("requests.failed")
+                    print(f"Registration {registration_no} rejected with HTTP {response.status_code}")
+                    return FAILED, None
+                if response.status_code in RETRYABLE_STATUSES:
+                    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                response.raise_for_status()
+                
+                data = response.json()
+                breaker.record_success()
+                
+                # Check if response is successful
+                if data.get("status") == 200 and data.get("data"):
+                    if use_cache:
+                        get_result_cache().put(registration_no, semester, exam_held, data["data"])
+                    return FOUND, data["data"]
+                else:
+                    if use_cache:
+                        get_result_cache().mark_missing(registration_no, semester, exam_held)
+                    return MISSING, None
+                    
+            except requests.exceptions.RequestException as e:
+                breaker.record_failure()
+                count("requests.failed")
+                if attempt < attempts - 1 and (retry_budget is None or retry_budget.try_spend()):
+                    count("retries")
+                    with span("fetch.backoff"):
+                        time.sleep(policy.delay(attempt, retry_after))
+                else:
+                    print(f"Failed to fetch registration {registration_no} after {attempt + 1} attempts: {e}")
+                    return FAILED, None
+            except json.JSONDecodeError:
+                breaker.record_failure()
+                print(f"Invalid JSON response for {registration_no}")
+                return FAILED, None
+        
+    # Sessions asking for the same student at the same time share one request
+    with span("fetch.lookup", engine="threaded"):
+        return coordinator.run(url, request)
+
+
 def fetch_single_result(
     registration_no: str,
     semester: str,
@@ -18,7 +202,9 @@ def fetch_single_result(
     exam_month: str,
     exam_year: int,
     retries: int = 3,
-    timeout: int = 15
+    timeout: int = 15,
+    base_url: str = BASE_URL,
+    use_cache: bool = True
 ) -> Optional[Dict]:
     """
     Fetches a single student's result from the BEU API.
@@ -31,42 +217,120 @@ def fetch_single_result(
         exam_year: Year of exam (e.g., 2025)
         retries: Number of retry attempts
         timeout: Request timeout in seconds
+        base_url: API endpoint (overridable for local testing)
+        use_cache: Serve/store the payload (and known-missing students) in the local cache
     
     Returns:
         Dictionary with student result data or None if failed
     """
-    url = f"{BASE_URL}?year={batch}&redg_no={registration_no}&semester={semester}&exam_held={exam_month}/{exam_year}"
+    return fetch_result_status(
+        registration_no, semester, batch, exam_month, exam_year,
+        retries=retries, timeout=timeout, base_url=base_url, use_cache=use_cache
+    )[1]
+
+
+def iter_probe_registrations(
+    executor: ThreadPoolExecutor,
+    registrations: List[Tuple[str, int]],
+    fetch_status: Callable[[str, int], Tuple[str, Optional[Dict]]],
+    miss_streak: int = DEFAULT_MISS_STREAK,
+    window: int = 8
+) -> Iterator[Tuple[str, Optional[Dict]]]:
+    """
+    Fetches registrations in ascending windows and yields (status, payload)
+    per lookup, stopping once `miss_streak` consecutive students are reported
+    missing, i.e. past the end of a dense range. Failed requests neither
+    extend nor break the streak.
+    
+    Args:
+        executor: Pool to run lookups on
+        registrations: (registration_no, api_batch) pairs in ascending order
+        fetch_status: Callable returning (status, payload) for one pair
+        miss_streak: Consecutive misses that end the scan
+        window: Lookups submitted together per step
+    """
+    streak = 0
+    for i in range(0, len(registrations), window):
+        chunk = registrations[i:i + window]
+        for status, payload in executor.map(lambda pair: fetch_status(*pair), chunk):
+            if status == FOUND:
+                streak = 0
+            elif status == MISSING:
+                streak += 1
+            yield status, payload
+        if streak >= miss_streak:
+            break
+
+
+def probe_registrations(
+    executor: ThreadPoolExecutor,
+    registrations: List[Tuple[str, int]],
+    fetch_status: Callable[[str, int], Tuple[str, Optional[Dict]]],
+    miss_streak: int = DEFAULT_MISS_STREAK,
+    window: int = 8
+) -> List[Dict]:
+    """Runs `iter_probe_registrations` and returns the payloads of students found."""
+    return [
+        payload
+        for status, payload in iter_probe_registrations(executor, registrations, fetch_status, miss_streak, window)
+        if status == FOUND
+    ]
+
+
+def discover_lateral_results(
+    executor: ThreadPoolExecutor,
+    branch: str,
+    college: str,
+    batch: int,
+    fetch_status: Callable[[str, int], Tuple[str, Optional[Dict]]],
+    miss_streak: int = DEFAULT_LE_MISS_STREAK,
+    window: int = 4,
+    use_cache: bool = True
+) -> List[Dict]:
+    """
+    Finds lateral entry students by scanning upward from 901 until
+    `miss_streak` consecutive numbers are missing.
     
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-        'Accept': 'application/json',
-    }
+    The highest LE number found is remembered per (batch, branch, college),
+    so later runs fetch up to that bound directly and only probe beyond it.
     
-    for attempt in range(retries):
-        try:
-            # Polite delay to avoid overwhelming the server
-            time.sleep(0.5)
-            
-            response = requests.get(url, headers=headers, timeout=timeout)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            # Check if response is successful
-            if data.get("status") == 200 and data.get("data"):
-                return data["data"]
-            else:
-                return None
-                
-        except requests.exceptions.RequestException as e:
-            if attempt < retries - 1:
-                time.sleep(1 * (2 ** attempt))  # Exponential backoff
-            else:
-                print(f"Failed to fetch registration {registration_no} after {retries} attempts: {e}")
-                return None
-        except json.JSONDecodeError:
-            print(f"Invalid JSON response for {registration_no}")
-            return None
+    Args:
+        executor: Pool to run lookups on
+        branch: Branch code
+        college: College code
+        batch: Regular batch year (LE students are batch+1)
+        fetch_status: Callable returning (status, payload) for one pair
+        miss_streak: Consecutive misses that end the scan
+        window: Lookups submitted together per probing step
+        use_cache: Read and update the remembered LE bound (when False,
+            probing starts at 901 and nothing is stored)
+    
+    Returns:
+        Payloads of the LE students that were found
+    """
+    cache = get_result_cache() if use_cache else None
+    known = (cache.get_le_bound(batch, branch, college) if cache is not None else None) or (LE_START - 1)
+    found_numbers = []
+    
+    def tracking_status(full_reg: str, api_batch: int) -> Tuple[str, Optional[Dict]]:
+        status, payload = fetch_status(full_reg, api_batch)
+        if status == FOUND:
+            found_numbers.append(int(full_reg[-3:]))
+        return status, payload
+    
+    results = []
+    if known >= LE_START:
+        known_range = build_lateral_list(branch, college, batch, LE_START, known)
+        for status, payload in executor.map(lambda pair: tracking_status(*pair), known_range):
+            if status == FOUND:
+                results.append(payload)
+    results += probe_registrations(
+        executor, build_lateral_list(branch, college, batch, known + 1), tracking_status, miss_streak, window
+    )
+    
+    if cache is not None and found_numbers and max(found_numbers) > known:
+        cache.set_le_bound(batch, branch, college, max(found_numbers))
+    return results
 
 
 def fetch_all_results(
@@ -79,7 +343,10 @@ def fetch_all_results(
     exam_month: str,
     exam_year: int,
     include_lateral: bool = False,
-    max_workers: int = 4
+    max_workers: int = 4,
+    base_url: str = BASE_URL,
+    use_cache: bool = True,
+    le_miss_streak: int = DEFAULT_LE_MISS_STREAK
 ) -> List[Dict]:
     """
     Fetches results for a range of registration numbers using multi-threading.
@@ -98,42 +365,47 @@ def fetch_all_results(
         exam_year: Year of exam
         include_lateral: Whether to include lateral entry students
         max_workers: Number of parallel threads
+        base_url: API endpoint (overridable for local testing)
+        use_cache: Serve/store payloads in the local result cache
+        le_miss_streak: Consecutive missing LE numbers that end LE discovery
     
     Returns:
         List of student result dictionaries
     """
     results = []
-    registration_numbers = []
     
     # Generate regular student registration numbers: BB + RRR + CCC + SSS(3 digits)
-    for reg in range(int(start_reg), int(end_reg) + 1):
-        full_reg = f"{batch}{branch}{college}{reg:03d}"  # Exactly 11 digits total
-        registration_numbers.append(full_reg)
+    registration_numbers = [full_reg for full_reg, _ in build_registration_list(start_reg, end_reg, branch, college, batch)]
+    retry_budget = RetryBudget()
     
-    # Add lateral entry students if requested (batch year +1, student numbers 901-930)
-    if include_lateral:
-        le_batch = batch + 1
-        for reg in range(901, 931):  # LE students 901-930
-            full_reg = f"{le_batch}{branch}{college}{reg:03d}"
-            registration_numbers.append(full_reg)
+    def fetch_status(full_reg: str, api_batch: int) -> Tuple[str, Optional[Dict]]:
+        # This entry point has always queried LE students with the regular batch year
+        return fetch_result_status(
+            full_reg, semester, batch, exam_month, exam_year,
+            base_url=base_url, use_cache=use_cache, retry_budget=retry_budget
+        )
+    
+    # Make sure the shared pool has a connection per worker
+    get_session(pool_size=max_workers)
     
     # Fetch results using thread pool
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
         futures = {
-            executor.submit(
-                fetch_single_result,
-                reg_no,
-                semester,
-                batch,
-                exam_month,
-                exam_year
-            ): reg_no for reg_no in registration_numbers
+            executor.submit(fetch_status, reg_no, batch): reg_no
+            for reg_no in registration_numbers
         }
         
         for future in as_completed(futures):
-            result = future.result()
-            if result:
+            status, result = future.result()
+            if status == FOUND:
                 results.append(result)
+        
+        # Lateral entry students (batch year +1, numbers from 901 upward)
+        if include_lateral:
+            results += discover_lateral_results(
+                executor, branch, college, batch, fetch_status, le_miss_streak, window=max_workers,
+                use_cache=use_cache
+            )
     
     return results
 
@@ -148,7 +420,13 @@ def fetch_semester_results(
     include_lateral: bool = False,
     exam_month: str = "July",
     exam_year: int = 2025,
-    max_workers: int = 4
+    max_workers: int = 4,
+    base_url: str = BASE_URL,
+    use_cache: bool = True,
+    probe: bool = False,
+    miss_streak: int = DEFAULT_MISS_STREAK,
+    le_miss_streak: int = DEFAULT_LE_MISS_STREAK,
+    skip_registrations: Optional[Set[str]] = None
 ) -> List[Dict]:
     """
     Fetches results for a range of students in a specific semester.
@@ -167,50 +445,437 @@ def fetch_semester_results(
         exam_month: Month of exam
         exam_year: Year of exam
         max_workers: Number of parallel threads
+        base_url: API endpoint (overridable for local testing)
+        use_cache: Serve/store payloads in the local result cache
+        probe: Scan the regular range in order and stop after `miss_streak`
+            consecutive missing students
+        miss_streak: Consecutive misses that end a probed range
+        le_miss_streak: Consecutive missing LE numbers that end LE discovery
+        skip_registrations: Full registration numbers the caller already has;
+            they are not requested (but count as found while probing) and
+            are left out of the returned list
     
     Returns:
         List of semester results
     """
-    sem_romans = {
-        1: "I", 2: "II", 3: "III", 4: "IV",
-        5: "V", 6: "VI", 7: "VII", 8: "VIII"
-    }
+    return list(iter_semester_results(
+        reg_start, reg_end, branch, college, semester, batch,
+        include_lateral=include_lateral,
+        exam_month=exam_month,
+        exam_year=exam_year,
+        max_workers=max_workers,
+        base_url=base_url,
+        use_cache=use_cache,
+        probe=probe,
+        miss_streak=miss_streak,
+        le_miss_streak=le_miss_streak,
+        skip_registrations=skip_registrations
+    ))
+
+
+def iter_semester_results(
+    reg_start: int,
+    reg_end: int,
+    branch: str,
+    college: str,
+    semester: int,
+    batch: int,
+    include_lateral: bool = False,
+    exam_month: str = "July",
+    exam_year: int = 2025,
+    max_workers: int = 4,
+    base_url: str = BASE_URL,
+    use_cache: bool = True,
+    probe: bool = False,
+    miss_streak: int = DEFAULT_MISS_STREAK,
+    le_miss_streak: int = DEFAULT_LE_MISS_STREAK,
+    skip_registrations: Optional[Set[str]] = None,
+    on_progress: Optional[Callable[[int, int], None]] = None
+) -> Iterator[Dict]:
+    """
+    Streaming version of `fetch_semester_results`: yields each student's
+    result as soon as its request completes instead of building a list.
     
-    results = []
+    Takes the same arguments as `fetch_semester_results`, plus:
+        on_progress: Called as on_progress(done, total) after every regular
+            lookup (total is the size of the range; probing may stop early)
     
-    # Fetch results using thread pool
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = {}
+    Closing the generator early cancels lookups that have not started yet.
+    
+    Yields:
+        Semester result dictionaries
+    """
+    registrations = build_registration_list(reg_start, reg_end, branch, college, batch)
+    get_session(pool_size=max_workers)
+    retry_budget = RetryBudget()
+    held = skip_registrations or set()
+    
+    # LE students carry their own batch year in the pair
+    def fetch_status(full_reg: str, api_batch: int) -> Tuple[str, Optional[Dict]]:
+        if full_reg in held:
+            return FOUND, None  # already in the caller's dataset
+        return fetch_result_status(
+            full_reg, SEM_ROMANS[semester], api_batch, exam_month, exam_year,
+            base_url=base_url, use_cache=use_cache, retry_budget=retry_budget
+        )
+    
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        if probe:
+            outcomes = iter_probe_registrations(executor, registrations, fetch_status, miss_streak, window=max_workers * 2)
+        else:
+            futures = [executor.submit(fetch_status, full_reg, api_batch) for full_reg, api_batch in registrations]
+            outcomes = (future.result() for future in as_completed(futures))
         
-        # Regular students use batch year
-        for reg in range(int(reg_start), int(reg_end) + 1):
-            full_reg = f"{batch}{branch}{college}{reg:03d}"
-            futures[executor.submit(
-                fetch_single_result,
-                full_reg,
-                sem_romans[semester],
-                batch,
-                exam_month,
-                exam_year
-            )] = full_reg
+        for done, (status, payload) in enumerate(outcomes, start=1):
+            if on_progress:
+                on_progress(done, len(registrations))
+            if status == FOUND and payload is not None:
+                yield payload
         
-        # LE students use batch+1 year and start from 901
         if include_lateral:
-            le_batch = batch + 1
-            for reg in range(901, 931):  # LE students 901-930
-                full_reg = f"{le_batch}{branch}{college}{reg:03d}"
-                futures[executor.submit(
-                    fetch_single_result,
+            for payload in discover_lateral_results(
+                executor, branch, college, batch, fetch_status, le_miss_streak, window=max_workers,
+                use_cache=use_cache
+            ):
+                if payload is not None:
+                    yield payload
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+# ============================================================================
+# ASYNC ENGINE
+# ============================================================================
+
+async def fetch_result_status_async(
+    session: aiohttp.ClientSession,
+    registration_no: str,
+    semester: str,
+    batch: int,
+    exam_month: str,
+    exam_year: int,
+    rate_per_host: float = DEFAULT_RATE_PER_HOST,
+    retries: int = 3,
+    timeout: int = 15,
+    base_url: str = BASE_URL,
+    use_cache: bool = True,
+    retry_policy: Optional[RetryPolicy] = None,
+    retry_budget: Optional[RetryBudget] = None
+) -> Tuple[str, Optional[Dict]]:
+    """
+    Async counterpart of `fetch_result_status`.
+
+    Instead of a fixed sleep before every request, each attempt takes a token
+    from the per-host bucket, so throughput is bounded by `rate_per_host`
+    rather than by how many workers happen to be sleeping.
+    """
+    exam_held = f"{exam_month}/{exam_year}"
+    if use_cache:
+        cache = get_result_cache()
+        cached = cache.get(registration_no, semester, exam_held)
+        if cached is not None:
+            count("cache.hits")
+            return FOUND, cached
+        if cache.is_missing(registration_no, semester, exam_held):
+            count("cache.hits")
+            return MISSING, None
+        count("cache.misses")
+    
+    url = build_result_url(registration_no, semester, batch, exam_month, exam_year, base_url)
+    bucket = get_host_bucket(url, rate_per_host)
+    policy = retry_policy or DEFAULT_RETRY_POLICY
+    breaker = get_circuit_breaker(url)
+    coordinator = get_fetch_coordinator()
+    
+    attempts = max(1, retries)
+    
+    async def request() -> Tuple[str, Optional[Dict]]:
+        for attempt in range(attempts):
+            retry_after = None
+            try:
+                await breaker.wait_async()
+                with span("fetch.rate_limit_wait"):
+                    await bucket.acquire_async()
+                
+                if retry_budget is not None:
+                    retry_budget.record_request()
+                count("requests")
+                
+                async with coordinator.slot_async():
+                    with span("fetch.request", engine="async"):
+                        async with session.get(url, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                            if is_client_error(response.status):
+                                breaker.record_success()
+                                count("requests.failed")
+                                print(f"Registration {registration_no} rejected with HTTP {response.status}")
+                                return FAILED, None
+                            if response.status in RETRYABLE_STATUSES:
+                                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                            response.raise_for_status()
+                            body = await response.read()
+                count("bytes.received", len(body))
+                data = json.loads(body)
+                breaker.record_success()
+                
+                if data.get("status") == 200 and data.get("data"):
+                    if use_cache:
+                        get_result_cache().put(registration_no, semester, exam_held, data["data"])
+                    return FOUND, data["data"]
+                else:
+                    if use_cache:
+                        get_result_cache().mark_missing(registration_no, semester, exam_held)
+                    return MISSING, None
+            
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                breaker.record_failure()
+                count("requests.failed")
+                if attempt < attempts - 1 and (retry_budget is None or retry_budget.try_spend()):
+                    count("retries")
+                    with span("fetch.backoff"):
+                        await asyncio.sleep(policy.delay(attempt, retry_after))
+                else:
+                    print(f"Failed to fetch registration {registration_no} after {attempt + 1} attempts: {e}")
+                    return FAILED, None
+            except json.JSONDecodeError:
+                breaker.record_failure()
+                print(f"Invalid JSON response for {registration_no}")
+                return FAILED, None
+        
+    # Sessions asking for the same student at the same time share one request
+    with span("fetch.lookup", engine="async"):
+        return await coordinator.run_async(url, request)
+
+
+async def fetch_single_result_async(
+    session: aiohttp.ClientSession,
+    registration_no: str,
+    semester: str,
+    batch: int,
+    exam_month: str,
+    exam_year: int,
+    rate_per_host: float = DEFAULT_RATE_PER_HOST,
+    retries: int = 3,
+    timeout: int = 15,
+    base_url: str = BASE_URL,
+    use_cache: bool = True
+) -> Optional[Dict]:
+    """Async counterpart of `fetch_single_result`, throttled by the per-host token bucket."""
+    status, payload = await fetch_result_status_async(
+        session, registration_no, semester, batch, exam_month, exam_year,
+        rate_per_host=rate_per_host, retries=retries, timeout=timeout,
+        base_url=base_url, use_cache=use_cache
+    )
+    return payload
+
+
+async def probe_registrations_async(
+    registrations: List[Tuple[str, int]],
+    fetch_status: Callable[[str, int], Awaitable[Tuple[str, Optional[Dict]]]],
+    miss_streak: int = DEFAULT_MISS_STREAK,
+    window: int = 40
+) -> List[Dict]:
+    """Async counterpart of `probe_registrations`: same stopping rule, one window at a time."""
+    results = []
+    streak = 0
+    for i in range(0, len(registrations), window):
+        fetched = await asyncio.gather(
+            *(fetch_status(full_reg, api_batch) for full_reg, api_batch in registrations[i:i + window])
+        )
+        for status, payload in fetched:
+            if status == FOUND:
+                results.append(payload)
+                streak = 0
+            elif status == MISSING:
+                streak += 1
+        if streak >= miss_streak:
+            break
+    return results
+
+
+async def discover_lateral_results_async(
+    branch: str,
+    college: str,
+    batch: int,
+    fetch_status: Callable[[str, int], Awaitable[Tuple[str, Optional[Dict]]]],
+    miss_streak: int = DEFAULT_LE_MISS_STREAK,
+    window: int = 10,
+    use_cache: bool = True
+) -> List[Dict]:
+    """Async counterpart of `discover_lateral_results`, sharing its cached LE bounds."""
+    cache = get_result_cache() if use_cache else None
+    known = (cache.get_le_bound(batch, branch, college) if cache is not None else None) or (LE_START - 1)
+    found_numbers = []
+    
+    async def tracking_status(full_reg: str, api_batch: int) -> Tuple[str, Optional[Dict]]:
+        status, payload = await fetch_status(full_reg, api_batch)
+        if status == FOUND:
+            found_numbers.append(int(full_reg[-3:]))
+        return status, payload
+    
+    results = []
+    if known >= LE_START:
+        fetched = await asyncio.gather(
+            *(tracking_status(*pair) for pair in build_lateral_list(branch, college, batch, LE_START, known))
+        )
+        results += [payload for status, payload in fetched if status == FOUND]
+    results += await probe_registrations_async(
+        build_lateral_list(branch, college, batch, known + 1), tracking_status, miss_streak, window
+    )
+    
+    if cache is not None and found_numbers and max(found_numbers) > known:
+        cache.set_le_bound(batch, branch, college, max(found_numbers))
+    return results
+
+
+async def fetch_semester_results_async(
+    reg_start: int,
+    reg_end: int,
+    branch: str,
+    college: str,
+    semester: int,
+    batch: int,
+    include_lateral: bool = False,
+    exam_month: str = "July",
+    exam_year: int = 2025,
+    max_concurrency: int = DEFAULT_ASYNC_CONCURRENCY,
+    rate_per_host: float = DEFAULT_RATE_PER_HOST,
+    base_url: str = BASE_URL,
+    use_cache: bool = True,
+    probe: bool = False,
+    miss_streak: int = DEFAULT_MISS_STREAK,
+    le_miss_streak: int = DEFAULT_LE_MISS_STREAK,
+    skip_registrations: Optional[Set[str]] = None,
+    on_progress: Optional[Callable[[int, int], None]] = None
+) -> List[Dict]:
+    """
+    Asyncio version of `fetch_semester_results` with the same arguments and
+    return value, so callers can switch engines freely.
+    
+    Args:
+        max_concurrency: Maximum number of requests in flight at once
+        rate_per_host: Requests per second allowed against one host
+        on_progress: Called as on_progress(done, total) after every regular lookup
+        (remaining arguments as in `fetch_semester_results`)
+    
+    Returns:
+        List of semester results
+    """
+    registrations = build_registration_list(reg_start, reg_end, branch, college, batch)
+    semaphore = asyncio.Semaphore(max_concurrency)
+    retry_budget = RetryBudget()
+    held = skip_registrations or set()
+    connector = aiohttp.TCPConnector(limit=max_concurrency)
+    
+    async with aiohttp.ClientSession(
+        connector=connector,
+        headers=DEFAULT_HEADERS,
+        trace_configs=[pool_trace_config()]
+    ) as session:
+        async def bounded_fetch(full_reg: str, api_batch: int) -> Tuple[str, Optional[Dict]]:
+            if full_reg in held:
+                return FOUND, None  # already in the caller's dataset
+            async with semaphore:
+                return await fetch_result_status_async(
+                    session,
                     full_reg,
-                    sem_romans[semester],
-                    le_batch,  # Use LE batch year for API call
+                    SEM_ROMANS[semester],
+                    api_batch,
                     exam_month,
-                    exam_year
-                )] = full_reg
+                    exam_year,
+                    rate_per_host=rate_per_host,
+                    base_url=base_url,
+                    use_cache=use_cache,
+                    retry_budget=retry_budget
+                )
         
-        for future in as_completed(futures):
-            result = future.result()
-            if result:
-                results.append(result)
+        done = 0
+        
+        async def counted_fetch(full_reg: str, api_batch: int) -> Tuple[str, Optional[Dict]]:
+            nonlocal done
+            outcome = await bounded_fetch(full_reg, api_batch)
+            done += 1
+            if on_progress:
+                on_progress(done, len(registrations))
+            return outcome
+        
+        if probe:
+            window = max(1, min(max_concurrency, int(rate_per_host) * 2))
+            results = await probe_registrations_async(registrations, counted_fetch, miss_streak, window)
+        else:
+            fetched = await asyncio.gather(
+                *(counted_fetch(full_reg, api_batch) for full_reg, api_batch in registrations)
+            )
+            results = [payload for status, payload in fetched if status == FOUND]
+        
+        if include_lateral:
+            results += await discover_lateral_results_async(
+                branch, college, batch, bounded_fetch, le_miss_streak, window=max(1, le_miss_streak * 2),
+                use_cache=use_cache
+            )
     
-    return results
+    return [payload for payload in results if payload is not None]
+
+
+async def fetch_semesters_async(
+    reg_start: int,
+    reg_end: int,
+    branch: str,
+    college: str,
+    batch: int,
+    exam_sessions: Dict[int, Tuple[str, int]],
+    include_lateral: bool = False,
+    max_concurrency: int = DEFAULT_ASYNC_CONCURRENCY,
+    rate_per_host: float = DEFAULT_RATE_PER_HOST,
+    base_url: str = BASE_URL,
+    use_cache: bool = True,
+    probe: bool = False,
+    miss_streak: int = DEFAULT_MISS_STREAK,
+    le_miss_streak: int = DEFAULT_LE_MISS_STREAK,
+    on_progress: Optional[Callable[[int, int], None]] = None
+) -> Dict[int, List[Dict]]:
+    """
+    Fetches several semesters of one cohort concurrently (for semester
+    histories, see `data_processor.build_student_history`).
+    
+    All semesters share the per-host rate limit and split `max_concurrency`
+    between them, so the total load matches a single-semester fetch.
+    
+    Args:
+        exam_sessions: Semester number -> (exam month, exam year) it was held in
+        on_progress: Called as on_progress(done, total) over all semesters
+        (remaining arguments as in `fetch_semester_results_async`)
+    
+    Returns:
+        Semester number -> list of results for that semester
+    """
+    semesters = sorted(exam_sessions)
+    per_semester = max(1, max_concurrency // max(1, len(semesters)))
+    total = (int(reg_end) - int(reg_start) + 1) * len(semesters)
+    done_by_semester = dict.fromkeys(semesters, 0)
+    
+    def semester_progress(semester: int) -> Callable[[int, int], None]:
+        def report(done: int, _total: int):
+            done_by_semester[semester] = done
+            if on_progress:
+                on_progress(sum(done_by_semester.values()), total)
+        return report
+    
+    fetched = await asyncio.gather(*(
+        fetch_semester_results_async(
+            reg_start, reg_end, branch, college, semester, batch,
+            include_lateral=include_lateral,
+            exam_month=exam_sessions[semester][0],
+            exam_year=exam_sessions[semester][1],
+            max_concurrency=per_semester,
+            rate_per_host=rate_per_host,
+            base_url=base_url,
+            use_cache=use_cache,
+            probe=probe,
+            miss_streak=miss_streak,
+            le_miss_streak=le_miss_streak,
+            on_progress=semester_progress(semester)
+        )
+        for semester in semesters
+    ))
+    return dict(zip(semesters, fetched))
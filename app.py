@@ -6,8 +6,8 @@ Description: Single Streamlit app with toggle between legacy scraper and new API
 
 import streamlit as st
 import pandas as pd
+import asyncio
 import os
-import io
 from datetime import datetime
 from PIL import Image
 
@@ -32,77 +32,8 @@ if "version" not in st.session_state:
 # COMMON CONFIGURATION
 # ============================================================================
 
-branch_codes = {
-    "105": "Computer Science Engineering (CSE)",
-    "101": "Civil Engineering (CE)",
-    "102": "Mechanical Engineering (ME)",
-    "103": "Electrical Engineering (EE)",
-    "110": "Electrical and Electronics Engineering (EEE)",
-    "155": "CSE (IoT)"
-}
-
-college_codes = {
-    "110": "Gaya College of Engineering, Gaya",
-    "108": "Bhagalpur College of Engineering, Bhagalpur",
-    "107": "Muzaffarpur Institute of Technology, Muzaffarpur",
-    "109": "Nalanda College of Engineering, Nalanda",
-    "111": "Darbhanga College of Engineering, Darbhanga",
-    "113": "Motihari College Of Engineering, Mothihari",
-    "117": "Lok Nayak Jai Prakash Institute of Technology, Chhapra",
-    "124": "Sershah Engineering College, Sasaram, Rohtas",
-    "125": "Rashtrakavi Ramdhari Singh Dinkar College of Engineering, Begusarai",
-    "126": "Bakhtiyarpur College of Engineering, Patna",
-    "127": "Sitamarhi Institute of Technology, Sitamarhi",
-    "128": "B.P. Mandal College of Engineering, Madhepura",
-    "129": "Katihar Engineering of College, Katihar",
-    "130": "Supaul College of Engineering, Supaul",
-    "131": "Purnea College of Engineering, Purnea",
-    "132": "Saharsa College of Engineering, Saharsa",
-    "133": "Government Engineering College, Jamui",
-    "134": "Government Engineering College, Banka",
-    "135": "Government Engineering College, Vaishali",
-    "141": "Government Engineering College, Nawada",
-    "142": "Government Engineering College, Kishanganj",
-    "144": "Government Engineering College, Munger",
-    "145": "Government Engineering College, Sheohar",
-    "146": "Government Engineering College, West Champaran",
-    "147": "Government Engineering College, Aurangabad",
-    "148": "Government Engineering College, Kaimur",
-    "149": "Government Engineering College, Gopalganj",
-    "150": "Government Engineering College, Madhubani",
-    "151": "Government Engineering College, Siwan",
-    "152": "Government Engineering College, Jehanabad",
-    "153": "Government Engineering College, Arwal",
-    "154": "Government Engineering College, Khagaria",
-    "155": "Government Engineering College, Buxar",
-    "156": "Government Engineering College, Bhojpur",
-    "157": "Government Engineering College, Sheikhpura",
-    "158": "Government Engineering College, Lakhisarai",
-    "159": "Government Engineering College, Samastipur",
-    "165": "Shri Phanishwar Nath Renu Engineering College, Araria",
-    "102": "Vidya Vihar Institute of Technology, Purnia",
-    "103": "Netaji Subhash Institute of Technology, Patna",
-    "106": "Sityog Institute of Technology, Aurangabad",
-    "115": "Azmet Institute of Technology, Kishanganj",
-    "118": "Buddha Institute of Technology, Gaya",
-    "119": "Adwaita Mission Institute of Technology, Banka",
-    "121": "Moti Babu Institute of Technology, Forbesganj",
-    "122": "Exalt College of Engineering & Technology, Vaishali",
-    "123": "Siwan Engineering & Technical Institute, Siwan",
-    "136": "Mother's Institute of Technology, Bihta, Patna",
-    "139": "R.P. Sharma Institute of Technology, Patna",
-    "140": "Maulana Azad College of Engineering & Technology, Patna"
-}
-
-sem_words = {
-    1: "1st", 2: "2nd", 3: "3rd", 4: "4th",
-    5: "5th", 6: "6th", 7: "7th", 8: "8th"
-}
-
-sem_romans = {
-    1: "I", 2: "II", 3: "III", 4: "IV",
-    5: "V", 6: "VI", 7: "VII", 8: "VIII"
-}
+from beu_codes import branch_codes, college_codes, sem_words, sem_romans
+from instrumentation import span, timed
 
 # ============================================================================
 # HELPER FUNCTIONS
@@ -126,6 +57,151 @@ def get_statistics_summary(df):
         "Avg CGPA": avg_cgpa
     }
 
+PAGE_SIZES = [25, 50, 100, 250, 500]
+
+def show_fetch_jobs(polling):
+    """
+    Lists background fetch jobs with their progress and Cancel/Open buttons.
+    Meant to run as a fragment that refreshes itself while jobs are active.
+    
+    Args:
+        polling: Whether any job was active when the fragment was set up
+    """
+    manager = get_job_manager()
+    jobs = manager.jobs()
+    st.markdown("### 🧵 Background Jobs")
+    icons = {QUEUED: "⏳", DONE: "✅", FAILED: "❌", CANCELLED: "🚫"}
+    for job in jobs:
+        col1, col2 = st.columns([4, 1])
+        with col1:
+            if job.status == RUNNING:
+                st.progress(
+                    job.fraction,
+                    text=f"**{job.label}** · checked {job.done} of {job.total} · {job.found} found · {job.elapsed:.0f}s"
+                )
+            else:
+                details = f" · {job.message}" if job.message else ""
+                st.markdown(f"{icons[job.status]} **{job.label}** · {job.status}{details}")
+            st.caption(f"Job {job.id}")
+        with col2:
+            if job.active:
+                st.button("Cancel", key=f"cancel_job_{job.id}", on_click=manager.cancel, args=(job.id,), use_container_width=True)
+            elif job.status == DONE and job.df is not None and len(job.df) > 0:
+                if st.button("Open", key=f"open_job_{job.id}", use_container_width=True):
+                    st.session_state.df_v2 = job.df
+                    st.session_state.subjects_v2 = job.subjects
+                    st.session_state.pop("memory_v2", None)
+                    st.rerun()
+    
+    # Polling is set up per full run; rerun the app once jobs start or stop
+    if polling != any(job.active for job in jobs):
+        st.rerun()
+
+
+def show_performance_panel():
+    """Shows recorded spans, counters, latency histograms and the JSON trace download."""
+    recorder = get_recorder()
+    counters = recorder.counters()
+    
+    col1, col2, col3, col4, col5 = st.columns(5)
+    col1.metric("Requests", int(counters.get("requests", 0)))
+    col2.metric("Retries", int(counters.get("retries", 0)))
+    col3.metric("Cache hits", int(counters.get("cache.hits", 0)))
+    col4.metric("Cache misses", int(counters.get("cache.misses", 0)))
+    col5.metric("Received", f"{counters.get('bytes.received', 0) / 1e6:.2f} MB")
+    
+    summary = recorder.summary()
+    if summary.empty:
+        st.caption("No spans recorded yet. Fetch or browse results with recording on.")
+    else:
+        st.dataframe(summary.round(2), use_container_width=True, hide_index=True)
+        span_name = st.selectbox("Latency histogram", options=summary["Span"].tolist(), key="perf_histogram_v2")
+        st.bar_chart(recorder.histogram(span_name), x="Bucket", y="Calls")
+    
+    analytics = analytics_cache_stats()
+    pool = pool_stats()
+    shared = get_fetch_coordinator().stats()
+    st.caption(
+        f"Analytics cache: {analytics['hits']} hits / {analytics['misses']} misses · "
+        f"HTTP pool: {pool['connections_opened']} connections, {pool['connections_reused']} reused · "
+        f"Coordinator: {shared['coalesced']} lookups shared"
+    )
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        st.download_button(
+            "📥 Download JSON trace",
+            data=recorder.export_trace,
+            file_name=f"beulytics_trace_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+            mime="application/json",
+            use_container_width=True,
+            key="download_trace_v2"
+        )
+    with col2:
+        st.button("🗑️ Reset measurements", on_click=recorder.reset, use_container_width=True, key="reset_trace_v2")
+
+
+EXAM_MONTHS = ["January", "February", "March", "April", "May", "June", "July", "August", "September", "October", "November", "December"]
+
+
+def default_exam_sessions(semester, exam_month, exam_year):
+    """
+    Editable table of exam sessions for semesters 1-8, guessed from one
+    known session: each earlier semester is assumed six months earlier,
+    each later one six months later. Semesters up to `semester` are included.
+    
+    Args:
+        semester: Semester whose session is known
+        exam_month: Its exam month
+        exam_year: Its exam year
+    
+    Returns:
+        DataFrame with Include, Semester, Exam Month and Exam Year columns
+    """
+    known = int(exam_year) * 12 + EXAM_MONTHS.index(exam_month)
+    rows = []
+    for sem in range(1, 9):
+        year, month = divmod(known + (sem - int(semester)) * 6, 12)
+        rows.append({"Include": sem <= semester, "Semester": sem, "Exam Month": EXAM_MONTHS[month], "Exam Year": year})
+    return pd.DataFrame(rows)
+
+
+@timed("render.table")
+def show_paginated_table(df, columns, key, positions=None):
+    """
+    Shows one page of `df[columns]` instead of the whole frame, so only the
+    visible rows are serialized and sent to the browser.
+    
+    Args:
+        df: Frame to display
+        columns: Columns to show
+        key: Widget key prefix (one per table)
+        positions: Optional row positions (e.g. from a FilterIndex query) in display order
+    """
+    total = len(df) if positions is None else len(positions)
+    page_size = PAGE_SIZES[1]
+    page = 1
+    
+    if total > PAGE_SIZES[0]:
+        col1, col2, col3 = st.columns([1, 1, 2])
+        with col1:
+            page_size = st.selectbox("Rows per page", options=PAGE_SIZES, index=1, key=f"{key}_page_size")
+        pages = max(1, -(-total // page_size))
+        # Filters may have shrunk the result; keep the stored page in range
+        if st.session_state.get(f"{key}_page", 1) > pages:
+            st.session_state[f"{key}_page"] = pages
+        with col2:
+            page = st.number_input("Page", min_value=1, max_value=pages, step=1, key=f"{key}_page")
+        with col3:
+            st.caption(f"Rows {(page - 1) * page_size + 1}-{min(page * page_size, total)} of {total} · page {page} of {pages}")
+    
+    start, stop = (page - 1) * page_size, page * page_size
+    if positions is None:
+        page_df = df[columns].iloc[start:stop]
+    else:
+        page_df = df[columns].take(positions[start:stop])
+    st.dataframe(page_df, use_container_width=True, hide_index=True)
+
 # ============================================================================
 # HEADER
 # ============================================================================
@@ -179,7 +255,7 @@ st.markdown("---")
 # ============================================================================
 
 if st.session_state.version == "v1":
-    from scraper import fetch_all_results
+    from scraper import fetch_all_results, discover_lateral_results
     from analytics import show_analytics
     
     st.header("📊 BEU Result Fetcher & Analyzer (v1 - Legacy)")
@@ -222,14 +298,12 @@ if st.session_state.version == "v1":
                     results = fetch_all_results(url_primary, int(start_full_reg_no), int(end_full_reg_no))
                     if semester > 2 and is_lateral == "Yes":
                         le_start_full_reg_no = f"{reg_batch+1}{branch}{college}901"
-                        le_end_full_reg_no = f"{reg_batch+1}{branch}{college}930"
-                        le_results = fetch_all_results(url_primary, int(le_start_full_reg_no), int(le_end_full_reg_no))
+                        le_results = discover_lateral_results(url_primary, int(le_start_full_reg_no), reg_batch, branch, college)
                 else:
                     results = fetch_all_results(url_secondary, int(start_full_reg_no), int(end_full_reg_no))
                     if semester > 2 and is_lateral == "Yes":
                         le_start_full_reg_no = f"{reg_batch+1}{branch}{college}901"
-                        le_end_full_reg_no = f"{reg_batch+1}{branch}{college}930"
-                        le_results = fetch_all_results(url_secondary, int(le_start_full_reg_no), int(le_end_full_reg_no))
+                        le_results = discover_lateral_results(url_secondary, int(le_start_full_reg_no), reg_batch, branch, college)
                 
                 if results:
                     df = pd.DataFrame(results)
@@ -258,9 +332,91 @@ if st.session_state.version == "v1":
 # ============================================================================
 
 else:
-    from api_scraper import fetch_semester_results
-    from data_processor import process_api_response
-    from enhanced_analytics import show_enhanced_analytics
+    from api_scraper import (
+        iter_semester_results, fetch_semester_results_async, fetch_semesters_async,
+        DEFAULT_RATE_PER_HOST, DEFAULT_MISS_STREAK
+    )
+    from http_pool import configure_pool, pool_stats, pool_stats_since, DEFAULT_POOL_SIZE
+    from fetch_coordinator import configure_coordinator, get_fetch_coordinator, DEFAULT_MAX_OUTBOUND
+    from result_cache import get_result_cache
+    from retry_policy import breaker_snapshots, OPEN, HALF_OPEN
+    from data_processor import (
+        process_api_response, IncrementalResultProcessor, build_subject_table,
+        compact_results, memory_report, merge_results, merge_subject_tables, registration_numbers,
+        build_student_history
+    )
+    from enhanced_analytics import show_enhanced_analytics, show_semester_progression, analytics_cache_stats
+    from result_store import get_result_store, slice_key
+    from filter_index import get_filter_index
+    from exporter import build_export, export_file_name, export_mime
+    from fetch_jobs import get_job_manager, QUEUED, RUNNING, DONE, FAILED, CANCELLED
+    from instrumentation import enable as enable_tracing, get_recorder, is_enabled as tracing_enabled
+    
+    with st.sidebar:
+        st.markdown("### 💾 Result Cache")
+        cache_stats = get_result_cache().stats()
+        st.caption(
+            f"{cache_stats['entries']} results cached ({cache_stats['bytes'] / 1024:.0f} KB), "
+            f"{cache_stats['missing']} known-missing · "
+            f"{cache_stats['hits']} hits / {cache_stats['misses']} misses"
+        )
+        if st.button("🗑️ Clear Cache", key="clear_cache_v2"):
+            get_result_cache().clear()
+            st.rerun()
+        
+        st.markdown("### 📂 Saved Datasets")
+        saved = get_result_store().slices()
+        if saved.empty:
+            st.caption("Fetched results are saved here automatically")
+        else:
+            labels = {
+                i: f"Batch {row.batch} · Sem {row.semester} · {row.exam} · "
+                   f"{branch_codes.get(row.branch, row.branch)} · {college_codes.get(row.college, row.college)} "
+                   f"({row.students} students)"
+                for i, row in saved.iterrows()
+            }
+            chosen = st.multiselect(
+                "Load saved results",
+                options=list(labels),
+                format_func=labels.get,
+                key="saved_slices_v2"
+            )
+            if st.button("📂 Load", key="load_saved_v2", disabled=not chosen):
+                keys = saved.loc[chosen, ["batch", "semester", "exam", "branch", "college"]].to_dict("records")
+                st.session_state.df_v2 = get_result_store().load_slices(keys)
+                st.session_state.subjects_v2 = get_result_store().load_slices(keys, table="subjects")
+                st.session_state.pop("memory_v2", None)
+                st.rerun()
+        
+        st.markdown("### 🚦 API Health")
+        breakers = breaker_snapshots()
+        if not breakers:
+            st.caption("No requests made yet")
+        for host, breaker in breakers.items():
+            if breaker["state"] == OPEN:
+                st.error(f"🔴 {host}: paused for {breaker['paused_for']:.0f}s (error rate {breaker['error_rate']:.0%})")
+            elif breaker["state"] == HALF_OPEN:
+                st.warning(f"🟡 {host}: testing recovery")
+            else:
+                st.caption(
+                    f"🟢 {host}: healthy · error rate {breaker['error_rate']:.0%} "
+                    f"over {breaker['recent_requests']} requests · tripped {breaker['times_opened']}x"
+                )
+        coordinator_stats = get_fetch_coordinator().stats()
+        st.caption(
+            f"🤝 Shared by all users: {coordinator_stats['outbound']}/{coordinator_stats['max_outbound']} requests "
+            f"in flight · {coordinator_stats['coalesced']} lookups served by another user's request"
+        )
+        
+        st.markdown("### ⏱️ Performance")
+        st.checkbox(
+            "Record performance trace",
+            value=tracing_enabled(),
+            key="perf_trace_v2",
+            # Only an actual toggle changes the process-wide setting
+            on_change=lambda: enable_tracing(st.session_state.perf_trace_v2),
+            help="Times fetching, processing and rendering for every user of this server; see ⏱️ Performance below the results"
+        )
     
     st.header("📊 BEU Results Analyzer (v2 - Official API)")
     st.markdown("*Fetches results from the official BEU API*")
@@ -272,7 +428,7 @@ else:
             reg_start = st.number_input("Start Reg No. (e.g., 1)", min_value=1, max_value=999, value=1, key="reg_start_v2")
             reg_end = st.number_input("End Reg No. (e.g., 50)", min_value=1, max_value=999, value=50, key="reg_end_v2")
             branch = st.selectbox("Branch", options=list(branch_codes.keys()), format_func=lambda x: branch_codes[x], key="branch_v2")
-            exam_month = st.selectbox("Exam Month", options=["January", "February", "March", "April", "May", "June", "July", "August", "September", "October", "November", "December"], index=6, key="exam_month_v2")
+            exam_month = st.selectbox("Exam Month", options=EXAM_MONTHS, index=6, key="exam_month_v2")
         
         with col2:
             college = st.selectbox("College", options=list(college_codes.keys()), format_func=lambda x: college_codes[x], key="college_v2")
@@ -282,34 +438,263 @@ else:
             exam_year = st.number_input("Exam Year", min_value=2020, max_value=2030, value=2025, key="exam_year_v2")
         
         include_le = st.checkbox("Include LE (Lateral Entry) Students", value=False, key="include_le_v2")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            fetch_engine = st.radio(
+                "Fetch Engine",
+                options=["Async (fast)", "Threaded (classic)"],
+                horizontal=True,
+                key="fetch_engine_v2"
+            )
+        with col2:
+            rate_per_host = st.slider(
+                "Max requests per second (async)",
+                min_value=1.0, max_value=100.0, value=DEFAULT_RATE_PER_HOST, step=1.0,
+                key="rate_per_host_v2"
+            )
+        use_cache = st.checkbox(
+            "Use local result cache (skip students already fetched)",
+            value=True,
+            key="use_cache_v2"
+        )
+        col1, col2 = st.columns(2)
+        with col1:
+            probe_range = st.checkbox(
+                "Smart range probing (stop at the end of the class)",
+                value=False,
+                key="probe_range_v2",
+                help="Scans registration numbers in order and stops after a run of missing students"
+            )
+        with col2:
+            miss_streak = st.number_input(
+                "Stop after N consecutive missing students",
+                min_value=5, max_value=200, value=DEFAULT_MISS_STREAK,
+                key="miss_streak_v2"
+            )
+        pool_size = st.number_input(
+            "Connection pool size (keep-alive connections per host)",
+            min_value=1, max_value=256, value=DEFAULT_POOL_SIZE,
+            key="pool_size_v2",
+            help="The pool is shared by every session and only grows; a smaller value keeps the current size"
+        )
+        max_outbound = st.number_input(
+            "Max requests in flight (all users of this server)",
+            min_value=1, max_value=512, value=DEFAULT_MAX_OUTBOUND,
+            key="max_outbound_v2",
+            help="Caps concurrent requests to BEU across every session; identical lookups are always shared"
+        )
+        merge_saved = st.checkbox(
+            "Only fetch students missing from the saved dataset (merge into it)",
+            value=False,
+            key="merge_saved_v2",
+            help="Students already saved for this class are not requested again; new ones are appended"
+        )
+        run_in_background = st.checkbox(
+            "Run in background (keeps going while you use the app; results are saved)",
+            value=False,
+            key="run_background_v2",
+            help="Uses the threaded engine; follow, cancel and open the job under 🧵 Background Jobs"
+        )
         submitted_v2 = st.form_submit_button("🔍 Fetch Results")
     
     if submitted_v2:
         if reg_start > reg_end:
             st.error("Start Reg No. cannot be greater than End Reg No.")
+        elif run_in_background:
+            configure_pool(int(pool_size))
+            configure_coordinator(int(max_outbound))
+            job_id = get_job_manager().submit(
+                label=f"Sem {semester} · {branch_codes[branch]} · {college_codes[college]} · {reg_start}-{reg_end}",
+                reg_start=reg_start, reg_end=reg_end, branch=branch, college=college,
+                semester=semester, batch=batch, include_lateral=include_le,
+                exam_month=exam_month, exam_year=exam_year, use_cache=use_cache,
+                probe=probe_range, miss_streak=int(miss_streak), merge_saved=merge_saved
+            )
+            st.success(f"🧵 Queued background job {job_id}")
         else:
-            with st.spinner("Fetching results from official BEU API..."):
-                try:
-                    results = fetch_semester_results(
-                        reg_start, 
-                        reg_end, 
-                        branch, 
-                        college, 
-                        semester, 
-                        batch, 
-                        include_lateral=include_le,
-                        exam_month=exam_month,
-                        exam_year=exam_year
+            progress_bar = st.progress(0.0, text="Fetching results from official BEU API...")
+            
+            def show_progress(done, total):
+                progress_bar.progress(done / total, text=f"Checked {done} of {total} registration numbers...")
+            
+            try:
+                configure_pool(int(pool_size))
+                configure_coordinator(int(max_outbound))
+                pool_before = pool_stats()
+                existing_df = existing_subjects = None
+                if merge_saved:
+                    stored = get_result_store().find(
+                        **slice_key(batch, branch, college, semester, exam_month, exam_year)
                     )
-                    
-                    if results and len(results) > 0:
+                    if stored:
+                        existing_df = get_result_store().load_slices(stored)
+                        existing_subjects = get_result_store().load_slices(stored, table="subjects")
+                held = registration_numbers(existing_df)
+                if fetch_engine.startswith("Async"):
+                    with span("pipeline.fetch", engine="async"):
+                        results = asyncio.run(fetch_semester_results_async(
+                            reg_start,
+                            reg_end,
+                            branch,
+                            college,
+                            semester,
+                            batch,
+                            include_lateral=include_le,
+                            exam_month=exam_month,
+                            exam_year=exam_year,
+                            rate_per_host=rate_per_host,
+                            use_cache=use_cache,
+                            probe=probe_range,
+                            miss_streak=int(miss_streak),
+                            skip_registrations=held,
+                            on_progress=show_progress
+                        ))
+                    with span("pipeline.process", engine="async"):
                         df = process_api_response(results)
-                        st.session_state.df_v2 = df
-                        st.success(f"✅ Fetched {len(df)} student records successfully!")
+                        subjects = build_subject_table(results)
+                else:
+                    # Stream results into the frame and show the table as it grows
+                    processor = IncrementalResultProcessor(chunk_size=25)
+                    partial_table = st.empty()
+                    with span("pipeline.fetch", engine="threaded"):
+                        for result in iter_semester_results(
+                            reg_start, 
+                            reg_end, 
+                            branch, 
+                            college, 
+                            semester, 
+                            batch, 
+                            include_lateral=include_le,
+                            exam_month=exam_month,
+                            exam_year=exam_year,
+                            use_cache=use_cache,
+                            probe=probe_range,
+                            miss_streak=int(miss_streak),
+                            skip_registrations=held,
+                            on_progress=show_progress
+                        ):
+                            if processor.add(result):
+                                partial_table.dataframe(
+                                    processor.frame[["Registration No.", "Student Name", "Current SGPA", "CGPA", "Status"]],
+                                    use_container_width=True,
+                                    hide_index=True
+                                )
+                    partial_table.empty()
+                    df = processor.frame
+                    subjects = processor.subjects
+                
+                progress_bar.empty()
+                if existing_df is not None:
+                    # Only the new students were processed; append them to the saved ones
+                    compact_df = merge_results(existing_df, df)
+                    subjects = merge_subject_tables(existing_subjects, subjects)
+                    report = memory_report(compact_df)
+                else:
+                    compact_df = compact_results(df)
+                    report = memory_report(compact_df, baseline=df)
+                if len(compact_df) > 0:
+                    st.session_state.df_v2 = compact_df
+                    st.session_state.subjects_v2 = subjects
+                    st.session_state.memory_v2 = report
+                    if existing_df is not None:
+                        st.success(
+                            f"✅ Added {len(df)} new student records to {len(held)} saved ones "
+                            f"({len(compact_df)} in total)"
+                        )
                     else:
-                        st.warning("⚠️ No results found. Please verify your inputs.")
-                except Exception as e:
-                    st.error(f"❌ Error fetching results: {str(e)}")
+                        st.success(f"✅ Fetched {len(df)} student records successfully!")
+                    try:
+                        get_result_store().save(
+                            compact_df, subjects,
+                            batch=batch, branch=branch, college=college, semester=semester,
+                            exam_month=exam_month, exam_year=exam_year
+                        )
+                    except Exception as e:
+                        st.warning(f"⚠️ Could not save results to the local dataset: {str(e)}")
+                    stats = pool_stats_since(pool_before)
+                    st.caption(
+                        f"🔌 {stats['requests_sent']} requests over {stats['connections_opened']} connections "
+                        f"({stats['connections_reused']} reused)"
+                    )
+                else:
+                    st.warning("⚠️ No results found. Please verify your inputs.")
+            except Exception as e:
+                progress_bar.empty()
+                st.error(f"❌ Error fetching results: {str(e)}")
+    
+    if get_job_manager().jobs():
+        jobs_polling = any(job.active for job in get_job_manager().jobs())
+        st.fragment(show_fetch_jobs, run_every=2 if jobs_polling else None)(jobs_polling)
+    
+    # Semester history: the same students over several semesters
+    with st.expander("📚 Semester History (fetch several semesters at once)"):
+        st.caption(
+            "Uses the range, branch, college, batch and options last submitted with 🔍 Fetch Results. "
+            "Semesters are fetched concurrently with the async engine; check the exam session of each one."
+        )
+        with st.form("history_form_v2"):
+            sessions = st.data_editor(
+                default_exam_sessions(semester, exam_month, exam_year),
+                column_config={
+                    "Include": st.column_config.CheckboxColumn("Include"),
+                    "Semester": st.column_config.NumberColumn("Semester", disabled=True),
+                    "Exam Month": st.column_config.SelectboxColumn("Exam Month", options=EXAM_MONTHS, required=True),
+                    "Exam Year": st.column_config.NumberColumn("Exam Year", min_value=2020, max_value=2035, step=1, required=True),
+                },
+                hide_index=True,
+                use_container_width=True,
+                key="history_sessions_v2"
+            )
+            fetch_history = st.form_submit_button("📚 Fetch Semester History")
+    
+    if fetch_history:
+        chosen = sessions[sessions["Include"]]
+        if chosen.empty:
+            st.error("Select at least one semester.")
+        elif reg_start > reg_end:
+            st.error("Start Reg No. cannot be greater than End Reg No.")
+        else:
+            history_progress = st.progress(0.0, text="Fetching semester history...")
+            
+            def show_history_progress(done, total):
+                history_progress.progress(done / total, text=f"Checked {done} of {total} semester results...")
+            
+            try:
+                results_by_semester = asyncio.run(fetch_semesters_async(
+                    reg_start,
+                    reg_end,
+                    branch,
+                    college,
+                    batch,
+                    {int(row["Semester"]): (row["Exam Month"], int(row["Exam Year"])) for _, row in chosen.iterrows()},
+                    include_lateral=include_le,
+                    rate_per_host=rate_per_host,
+                    use_cache=use_cache,
+                    probe=probe_range,
+                    miss_streak=int(miss_streak),
+                    on_progress=show_history_progress
+                ))
+                history = build_student_history(results_by_semester)
+                history_progress.empty()
+                if len(history) > 0:
+                    st.session_state.history_v2 = history
+                    st.success(f"✅ Built semester history for {len(history)} students over {len(chosen)} semesters")
+                else:
+                    st.warning("⚠️ No results found for the selected semesters. Please verify the exam sessions.")
+            except Exception as e:
+                history_progress.empty()
+                st.error(f"❌ Error fetching semester history: {str(e)}")
+    
+    if "history_v2" in st.session_state:
+        history = st.session_state.history_v2
+        show_semester_progression(history)
+        with st.expander("📋 Per-student SGPA history and trends"):
+            sgpa_history = history.sgpa_frame()
+            show_paginated_table(sgpa_history, list(sgpa_history.columns), key="v2_history_view")
+            trends = history.trends()
+            show_paginated_table(trends, list(trends.columns), key="v2_trend_view")
+        st.markdown("---")
     
     # Display results if available
     if "df_v2" in st.session_state:
@@ -321,7 +706,7 @@ else:
         # TAB 1: ANALYTICS
         with tab1:
             st.subheader("📊 Analytics Dashboard")
-            show_enhanced_analytics(df)
+            show_enhanced_analytics(df, st.session_state.get("subjects_v2"))
         
         # TAB 2: DATA VIEW
         with tab2:
@@ -335,14 +720,23 @@ else:
             )
             
             if cols_to_display:
-                st.dataframe(df[cols_to_display], use_container_width=True, hide_index=True)
+                show_paginated_table(df, cols_to_display, key="v2_data_view")
             else:
                 st.info("Please select at least one column to display.")
+            
+            if "memory_v2" in st.session_state:
+                report = st.session_state.memory_v2
+                label = f"🧮 Memory: {report['Bytes'].sum() / 1024:,.0f} KB"
+                if "Baseline Bytes" in report.columns:
+                    label += f" (was {report['Baseline Bytes'].sum() / 1024:,.0f} KB before compaction)"
+                with st.expander(label):
+                    st.dataframe(report, use_container_width=True)
         
         # TAB 3: FILTER & SORT
         with tab3:
             st.subheader("🔍 Filter & Sort")
             
+            filter_index = get_filter_index(df)
             col1, col2 = st.columns(2)
             
             with col1:
@@ -350,7 +744,7 @@ else:
                 
                 selected_colleges = st.multiselect(
                     "Filter by College",
-                    options=df["College Name"].unique().tolist() if "College Name" in df.columns else [],
+                    options=filter_index.values("College Name"),
                     default=None,
                     key="college_filter_v2"
                 )
@@ -379,39 +773,29 @@ else:
                     key="sort_option_v2"
                 )
             
-            # Apply filters and sorting (outside columns for proper reactivity)
-            filtered_df = df.copy()
-            
-            if selected_colleges:
-                filtered_df = filtered_df[filtered_df["College Name"].isin(selected_colleges)]
-            
-            if selected_status:
-                filtered_df = filtered_df[filtered_df["Status"].isin(selected_status)]
-            
-            filtered_df = filtered_df[
-                (filtered_df["Current SGPA"] >= sgpa_range[0]) &
-                (filtered_df["Current SGPA"] <= sgpa_range[1])
-            ]
-            
-            # Sort (handle NaN values properly)
-            if sort_option == "SGPA High to Low":
-                filtered_df = filtered_df.sort_values(by="Current SGPA", ascending=False, na_position='last').reset_index(drop=True)
-            elif sort_option == "SGPA Low to High":
-                filtered_df = filtered_df.sort_values(by="Current SGPA", ascending=True, na_position='last').reset_index(drop=True)
-            elif sort_option == "CGPA High to Low":
-                filtered_df = filtered_df.sort_values(by="CGPA", ascending=False, na_position='last').reset_index(drop=True)
-            elif sort_option == "CGPA Low to High":
-                filtered_df = filtered_df.sort_values(by="CGPA", ascending=True, na_position='last').reset_index(drop=True)
-            elif sort_option == "Name (A-Z)":
-                filtered_df = filtered_df.sort_values(by="Student Name", ascending=True).reset_index(drop=True)
-            elif sort_option == "Registration No.":
-                filtered_df = filtered_df.sort_values(by="Registration No.", ascending=True).reset_index(drop=True)
+            # Apply filters and sorting (outside columns for proper reactivity).
+            # The index answers with row positions; only the shown columns are copied.
+            sort_keys = {
+                "SGPA High to Low": "sgpa_desc",
+                "SGPA Low to High": "sgpa_asc",
+                "CGPA High to Low": "cgpa_desc",
+                "CGPA Low to High": "cgpa_asc",
+                "Name (A-Z)": "name",
+                "Registration No.": "regno",
+            }
+            positions = filter_index.query(
+                colleges=selected_colleges,
+                statuses=selected_status,
+                sgpa_range=sgpa_range,
+                sort_by=sort_keys[sort_option]
+            )
             
-            st.markdown(f"### Results: {len(filtered_df)} records")
-            st.dataframe(
-                filtered_df[["Registration No.", "Student Name", "College Name", "Current SGPA", "CGPA", "Status"]],
-                use_container_width=True,
-                hide_index=True
+            st.markdown(f"### Results: {len(positions)} records")
+            show_paginated_table(
+                filter_index.df,
+                ["Registration No.", "Student Name", "College Name", "Current SGPA", "CGPA", "Status"],
+                key="v2_filter_view",
+                positions=positions
             )
         
         # TAB 4: EXPORT
@@ -420,45 +804,28 @@ else:
             
             st.markdown("### Download Formats")
             
-            col1, col2, col3 = st.columns(3)
+            compress_export = st.checkbox(
+                "Gzip CSV/JSON downloads",
+                value=False,
+                help="Much smaller files for large datasets; Excel files are already compressed",
+                key="compress_export_v2"
+            )
+            st.caption("Files are generated when you click a download button.")
             
-            with col1:
-                csv_data = df.to_csv(index=False)
-                st.download_button(
-                    label="📥 Download CSV",
-                    data=csv_data,
-                    file_name=f"beu_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime="text/csv",
-                    use_container_width=True,
-                    key="download_csv_v2"
-                )
+            export_stem = f"beu_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            export_buttons = [("csv", "📥 Download CSV"), ("xlsx", "📥 Download Excel"), ("json", "📥 Download JSON")]
             
-            with col2:
-                # Generate Excel file in memory
-                excel_buffer = io.BytesIO()
-                with pd.ExcelWriter(excel_buffer, engine='openpyxl') as excel_writer:
-                    df.to_excel(excel_writer, sheet_name='Results', index=False)
-                excel_data = excel_buffer.getvalue()
-                
-                st.download_button(
-                    label="📥 Download Excel",
-                    data=excel_data,
-                    file_name=f"beu_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
-                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                    use_container_width=True,
-                    key="download_excel_v2"
-                )
-            
-            with col3:
-                json_data = df.to_json(orient='records', indent=2)
-                st.download_button(
-                    label="📥 Download JSON",
-                    data=json_data,
-                    file_name=f"beu_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-                    mime="application/json",
-                    use_container_width=True,
-                    key="download_json_v2"
-                )
+            for column, (fmt, label) in zip(st.columns(3), export_buttons):
+                with column:
+                    st.download_button(
+                        label=label,
+                        # Deferred: built in chunks only when this button is clicked
+                        data=lambda fmt=fmt: build_export(df, fmt, compress=compress_export),
+                        file_name=export_file_name(export_stem, fmt, compress_export),
+                        mime=export_mime(fmt, compress_export),
+                        use_container_width=True,
+                        key=f"download_{fmt}_v2"
+                    )
             
             st.markdown("---")
             st.markdown("### Summary Statistics")
@@ -477,6 +844,10 @@ else:
             with col3:
                 st.metric("Avg SGPA", stats["Avg SGPA"])
                 st.metric("Avg CGPA", stats["Avg CGPA"])
+    
+    if tracing_enabled() or get_recorder().spans():
+        with st.expander("⏱️ Performance", expanded=tracing_enabled()):
+            show_performance_panel()
 
 # ============================================================================
 # FOOTER
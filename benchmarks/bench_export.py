@@ -0,0 +1,60 @@
+"""
+Export Benchmark - Eager in-memory exports vs the chunked exporter
+Author: Aditya Kumar
+
+Run from the repository root:
+    python -m benchmarks.bench_export --sizes 10000 50000
+"""
+
+import argparse
+import io
+import time
+import tracemalloc
+
+import pandas as pd
+
+from benchmarks.synthetic import make_cohort
+from data_processor import compact_results, normalize_results
+from exporter import build_export
+
+
+def eager(df, fmt):
+    """What the Export tab built on every rerun before the exporter."""
+    if fmt == "csv":
+        return df.to_csv(index=False)
+    if fmt == "json":
+        return df.to_json(orient="records", indent=2)
+    buffer = io.BytesIO()
+    with pd.ExcelWriter(buffer, engine="openpyxl") as excel_writer:
+        df.to_excel(excel_writer, sheet_name="Results", index=False)
+    return buffer.getvalue()
+
+
+def measure(func):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del result
+    return elapsed, peak / 1e6
+
+
+def run(sizes, formats):
+    print(f"{'students':>10}{'format':>8}{'eager s':>9}{'eager MB':>10}{'chunked s':>11}{'chunked MB':>12}{'gzip s':>8}")
+    for n in sizes:
+        df = compact_results(normalize_results(make_cohort(n)))
+        for fmt in formats:
+            eager_s, eager_mb = measure(lambda: eager(df, fmt))
+            chunked_s, chunked_mb = measure(lambda: build_export(df, fmt))
+            gzip_s = measure(lambda: build_export(df, fmt, compress=True))[0] if fmt != "xlsx" else float("nan")
+            print(f"{n:>10}{fmt:>8}{eager_s:>9.2f}{eager_mb:>10.1f}{chunked_s:>11.2f}{chunked_mb:>12.1f}{gzip_s:>8.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare eager exports with the chunked exporter")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 50000])
+    parser.add_argument("--formats", nargs="+", default=["csv", "json", "xlsx"])
+    args = parser.parse_args()
+    run(args.sizes, args.formats)
@@ -0,0 +1,53 @@
+"""
+Fetch Benchmark - Threaded vs asyncio engine against the local mock API
+Author: Aditya Kumar
+
+Run from the repository root:
+    python -m benchmarks.bench_fetch --students 100 --latency 0.05
+"""
+
+import argparse
+import asyncio
+import time
+
+from api_scraper import fetch_semester_results, fetch_semester_results_async
+from benchmarks.mock_beu_api import MockBEUServer
+
+
+def run(students: int, latency: float, rate: float, concurrency: int, include_lateral: bool):
+    common = dict(
+        reg_start=1, reg_end=students, branch="105", college="110",
+        semester=3, batch=23, include_lateral=include_lateral,
+        exam_month="July", exam_year=2025,
+        use_cache=False,  # synthetic payloads must never land in the real cache
+    )
+
+    with MockBEUServer(latency=latency, max_student=students) as server:
+        start = time.perf_counter()
+        threaded = fetch_semester_results(**common, base_url=server.result_url)
+        threaded_time = time.perf_counter() - start
+        threaded_requests = server.requests_served
+
+        start = time.perf_counter()
+        async_results = asyncio.run(fetch_semester_results_async(
+            **common, max_concurrency=concurrency, rate_per_host=rate, base_url=server.result_url
+        ))
+        async_time = time.perf_counter() - start
+        async_requests = server.requests_served - threaded_requests
+
+    same = sorted(r["redg_no"] for r in threaded) == sorted(r["redg_no"] for r in async_results)
+    print(f"{'engine':<10}{'requests':>10}{'results':>10}{'seconds':>10}{'req/s':>10}")
+    print(f"{'threaded':<10}{threaded_requests:>10}{len(threaded):>10}{threaded_time:>10.2f}{threaded_requests / threaded_time:>10.1f}")
+    print(f"{'async':<10}{async_requests:>10}{len(async_results):>10}{async_time:>10.2f}{async_requests / async_time:>10.1f}")
+    print(f"speedup: {threaded_time / async_time:.1f}x, identical results: {same}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare threaded and async fetch engines")
+    parser.add_argument("--students", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.05, help="Mock server latency per request (s)")
+    parser.add_argument("--rate", type=float, default=200.0, help="Async per-host requests/second")
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--lateral", action="store_true", help="Include LE students 901-930")
+    args = parser.parse_args()
+    run(args.students, args.latency, args.rate, args.concurrency, args.lateral)
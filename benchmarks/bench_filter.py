@@ -0,0 +1,60 @@
+"""
+Filter Benchmark - Copy/mask/sort filtering vs the bitmap FilterIndex
+Author: Aditya Kumar
+
+Run from the repository root:
+    python -m benchmarks.bench_filter --sizes 10000 50000 100000
+"""
+
+import argparse
+import time
+
+from benchmarks.synthetic import make_cohort
+from data_processor import compact_results, normalize_results
+from filter_index import FilterIndex
+
+SHOWN = ["Registration No.", "Student Name", "College Name", "Current SGPA", "CGPA", "Status"]
+
+
+def masked(df, statuses, sgpa_range):
+    """What the Filter & Sort tab did on every rerun before the index."""
+    filtered = df.copy()
+    filtered = filtered[filtered["Status"].isin(statuses)]
+    filtered = filtered[(filtered["Current SGPA"] >= sgpa_range[0]) & (filtered["Current SGPA"] <= sgpa_range[1])]
+    return filtered.sort_values(by="Current SGPA", ascending=False, na_position="last").reset_index(drop=True)[SHOWN]
+
+
+def best_of(func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(sizes, repeat: int):
+    print(f"{'students':>10}{'build ms':>10}{'masked ms':>11}{'index ms':>10}{'speedup':>9}")
+    for n in sizes:
+        df = compact_results(normalize_results(make_cohort(n)))
+        statuses, sgpa_range = ["PASS", "FAIL"], (6.0, 9.0)
+
+        start = time.perf_counter()
+        index = FilterIndex(df)
+        index.order("sgpa_desc")
+        build = time.perf_counter() - start
+
+        plain = best_of(lambda: masked(df, statuses, sgpa_range), repeat)
+        indexed = best_of(
+            lambda: index.take(index.query(statuses=statuses, sgpa_range=sgpa_range, sort_by="sgpa_desc"), SHOWN),
+            repeat
+        )
+        print(f"{n:>10}{build * 1000:>10.1f}{plain * 1000:>11.2f}{indexed * 1000:>10.2f}{plain / indexed:>8.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare masked filtering with the filter index")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 50000, 100000])
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per method; the best is reported")
+    args = parser.parse_args()
+    run(args.sizes, args.repeat)
@@ -0,0 +1,60 @@
+"""
+History Benchmark - Per-semester frames vs the student x semester matrices
+Author: Aditya Kumar
+
+Run from the repository root:
+    python -m benchmarks.bench_history --sizes 1000 10000 --semesters 6
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from benchmarks.synthetic import SEM_ROMANS, make_cohort
+from data_processor import build_student_history, process_api_response
+
+
+def per_semester_frames(results_by_semester):
+    """One results frame per semester, joined on Registration No., slope per student."""
+    merged = None
+    for semester, payloads in sorted(results_by_semester.items()):
+        frame = process_api_response(payloads)[["Registration No.", "Student Name", "Current SGPA"]]
+        frame = frame.rename(columns={"Current SGPA": f"Semester {semester} SGPA"})
+        merged = frame if merged is None else merged.merge(frame, on=["Registration No.", "Student Name"], how="outer")
+    sgpa = merged.filter(like="SGPA")
+    x = np.arange(1, sgpa.shape[1] + 1)
+    merged["SGPA Trend"] = sgpa.apply(
+        lambda row: np.polyfit(x[row.notna()], row.dropna(), 1)[0] if row.notna().sum() >= 2 else np.nan, axis=1
+    )
+    return merged
+
+
+def matrices(results_by_semester):
+    history = build_student_history(results_by_semester)
+    return history.trends(), history.semester_summary()
+
+
+def timed(func, *args) -> float:
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def run(sizes, semesters: int):
+    print(f"{'students':>10}{'semesters':>11}{'frames s':>10}{'matrix s':>10}{'speedup':>9}")
+    for n in sizes:
+        results_by_semester = {
+            semester: make_cohort(n, semester=SEM_ROMANS[semester - 1]) for semester in range(1, semesters + 1)
+        }
+        frames = timed(per_semester_frames, results_by_semester)
+        matrix = timed(matrices, results_by_semester)
+        print(f"{n:>10}{semesters:>11}{frames:>10.2f}{matrix:>10.2f}{frames / matrix:>8.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare per-semester frames with the semester history matrices")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--semesters", type=int, default=6)
+    args = parser.parse_args()
+    run(args.sizes, args.semesters)
@@ -0,0 +1,47 @@
+"""
+Normalize Benchmark - Row-by-row vs batched payload normalization
+Author: Aditya Kumar
+
+Run from the repository root:
+    python -m benchmarks.bench_normalize --sizes 1000 10000 50000
+"""
+
+import argparse
+import time
+
+from pandas.testing import assert_frame_equal
+
+from benchmarks.synthetic import make_cohort
+from data_processor import normalize_results, process_student_results_rowwise
+
+
+def run(sizes, repeat: int):
+    print(f"{'students':>10}{'row-wise s':>12}{'batched s':>12}{'speedup':>10}{'identical':>11}")
+    for n in sizes:
+        payloads = make_cohort(n)
+        timings = {}
+        frames = {}
+        for name, normalize in (("rowwise", process_student_results_rowwise), ("batched", normalize_results)):
+            best = float("inf")
+            for _ in range(repeat):
+                start = time.perf_counter()
+                frames[name] = normalize(payloads)
+                best = min(best, time.perf_counter() - start)
+            timings[name] = best
+        try:
+            assert_frame_equal(frames["rowwise"], frames["batched"], check_exact=True)
+            identical = True
+        except AssertionError:
+            identical = False
+        print(
+            f"{n:>10}{timings['rowwise']:>12.3f}{timings['batched']:>12.3f}"
+            f"{timings['rowwise'] / timings['batched']:>9.1f}x{str(identical):>11}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare row-wise and batched normalization")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per size; the best is reported")
+    args = parser.parse_args()
+    run(args.sizes, args.repeat)
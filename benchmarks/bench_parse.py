@@ -0,0 +1,72 @@
+"""
+Parse Benchmark - Compares the HTML parser backends on result pages
+Author: Aditya Kumar
+
+Run from the repository root:
+    python -m benchmarks.bench_parse --pages 300
+    python -m benchmarks.bench_parse --save sample_pages     # write the generated pages
+    python -m benchmarks.bench_parse --pages-dir sample_pages   # benchmark saved pages
+"""
+
+import argparse
+import glob
+import os
+import time
+from typing import List
+
+from benchmarks.synthetic import make_missing_page, make_result_page
+from html_parsers import PARSERS
+
+
+def generate_pages(n: int) -> List[str]:
+    """`n` synthetic pages, every tenth one a "no record" page."""
+    return [
+        make_missing_page() if i % 10 == 9 else make_result_page(f"23105110{i % 999 + 1:03d}")
+        for i in range(n)
+    ]
+
+
+def load_pages(directory: str) -> List[str]:
+    pages = []
+    for path in sorted(glob.glob(os.path.join(directory, "*.html"))):
+        with open(path, encoding="utf-8", errors="replace") as f:
+            pages.append(f.read())
+    return pages
+
+
+def run(pages: List[str], repeat: int):
+    reference = [PARSERS["bs4"](page) for page in pages]
+    print(f"{len(pages)} pages, {sum(map(len, pages)) / len(pages) / 1024:.1f} KB average")
+    print(f"{'parser':<8}{'pages/s':>12}{'ms/page':>10}{'speedup':>10}{'identical':>11}")
+
+    baseline = None
+    for name, parse in PARSERS.items():
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            parsed = [parse(page) for page in pages]
+            best = min(best, time.perf_counter() - start)
+        baseline = baseline or best
+        identical = parsed == reference
+        print(
+            f"{name:<8}{len(pages) / best:>12.0f}{best / len(pages) * 1000:>10.2f}"
+            f"{baseline / best:>9.1f}x{str(identical):>11}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark HTML parser backends")
+    parser.add_argument("--pages", type=int, default=200, help="Number of synthetic pages to generate")
+    parser.add_argument("--pages-dir", help="Directory of saved .html result pages to use instead")
+    parser.add_argument("--save", help="Write the generated pages to this directory and exit")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per parser; the best is reported")
+    args = parser.parse_args()
+
+    if args.save:
+        os.makedirs(args.save, exist_ok=True)
+        for i, page in enumerate(generate_pages(args.pages)):
+            with open(os.path.join(args.save, f"page_{i:04d}.html"), "w", encoding="utf-8") as f:
+                f.write(page)
+        print(f"Wrote {args.pages} pages to {args.save}")
+    else:
+        run(load_pages(args.pages_dir) if args.pages_dir else generate_pages(args.pages), args.repeat)
@@ -0,0 +1,54 @@
+"""
+Schema Benchmark - Memory and groupby cost of the plain vs compact result frame
+Author: Aditya Kumar
+
+Run from the repository root:
+    python -m benchmarks.bench_schema --sizes 1000 10000 50000
+"""
+
+import argparse
+import time
+
+import pandas as pd
+
+from benchmarks.synthetic import make_cohort
+from data_processor import compact_results, memory_report, normalize_results
+
+
+def college_stats(df: pd.DataFrame) -> pd.DataFrame:
+    """The aggregation behind the college-wise analytics tab."""
+    return df.assign(Passed=df["Status"] == "PASS").groupby("College Name", observed=True).agg(
+        students=("Registration No.", "count"),
+        avg_sgpa=("Current SGPA", "mean"),
+        passed=("Passed", "sum"),
+    )
+
+
+def best_of(func, frame: pd.DataFrame, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(frame)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(sizes, repeat: int):
+    print(f"{'students':>10}{'plain MB':>10}{'compact MB':>12}{'saved':>8}{'plain ms':>10}{'compact ms':>12}")
+    for n in sizes:
+        plain = normalize_results(make_cohort(n))
+        compact = compact_results(plain)
+        report = memory_report(compact, baseline=plain)
+        before, after = report["Baseline Bytes"].sum(), report["Bytes"].sum()
+        print(
+            f"{n:>10}{before / 1e6:>10.1f}{after / 1e6:>12.1f}{(1 - after / before) * 100:>7.0f}%"
+            f"{best_of(college_stats, plain, repeat) * 1000:>10.1f}{best_of(college_stats, compact, repeat) * 1000:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare plain and compact result frames")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per aggregation; the best is reported")
+    args = parser.parse_args()
+    run(args.sizes, args.repeat)
@@ -0,0 +1,55 @@
+"""
+Sessions Benchmark - Several app sessions fetching the same class at once
+Author: Aditya Kumar
+
+Each simulated session runs the async engine in its own thread and event
+loop, as Streamlit does. With the fetch coordinator, identical lookups are
+shared, so the server sees roughly one request per student however many
+sessions ask.
+
+Run from the repository root:
+    python -m benchmarks.bench_sessions --sessions 1 4 8 --students 60
+"""
+
+import argparse
+import asyncio
+import threading
+import time
+
+from api_scraper import fetch_semester_results_async
+from benchmarks.mock_beu_api import MockBEUServer
+from fetch_coordinator import get_fetch_coordinator
+
+
+def run(sessions_list, students: int, latency: float, rate: float):
+    print(f"{'sessions':>10}{'requests':>10}{'naive':>8}{'coalesced':>11}{'seconds':>9}")
+    for sessions in sessions_list:
+        with MockBEUServer(latency=latency, max_student=students) as server:
+            coalesced_before = get_fetch_coordinator().stats()["coalesced"]
+
+            def session():
+                asyncio.run(fetch_semester_results_async(
+                    1, students, "105", "110", 3, 23,
+                    rate_per_host=rate, base_url=server.result_url,
+                    use_cache=False  # synthetic payloads must never land in the real cache
+                ))
+
+            threads = [threading.Thread(target=session) for _ in range(sessions)]
+            start = time.perf_counter()
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            elapsed = time.perf_counter() - start
+            coalesced = get_fetch_coordinator().stats()["coalesced"] - coalesced_before
+            print(f"{sessions:>10}{server.requests_served:>10}{sessions * students:>8}{coalesced:>11}{elapsed:>9.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure request coalescing across concurrent sessions")
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--students", type=int, default=60)
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--rate", type=float, default=100.0)
+    args = parser.parse_args()
+    run(args.sessions, args.students, args.latency, args.rate)
@@ -0,0 +1,215 @@
+"""
+Mock BEU API - Local stand-in for /backend/v1/result/get-result and the legacy .aspx result pages
+Author: Aditya Kumar
+
+Usage:
+    with MockBEUServer(latency=0.05, max_student=60) as server:
+        fetch_semester_results(..., base_url=server.result_url)
+        scraper.fetch_all_results(server.legacy_url, 23105110001, 23105110060)
+
+Or run standalone:
+    python -m benchmarks.mock_beu_api --port 8765 --latency 0.05 --error-rate 0.02 --missing-rate 0.1
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qs, urlsplit
+
+from benchmarks.synthetic import SEM_ROMANS, make_missing_page, make_payload, make_result_page
+
+RESULT_PATH = "/backend/v1/result/get-result"
+
+# Any path ending in .aspx is answered like the old portal, e.g.
+# /ResultsBTech3rdSem2023_B2022Results.aspx?Sem=III&RegNo=23105110001
+LEGACY_PATH = "/ResultsBTech3rdSem2023_B2022Results.aspx"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, like the real server
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status: int, body: dict):
+        raw = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(raw)))
+        self.end_headers()
+        self.wfile.write(raw)
+
+    def _send_html(self, status: int, html: str):
+        raw = html.encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(raw)))
+        self.end_headers()
+        self.wfile.write(raw)
+
+    def do_GET(self):
+        server: "MockBEUServer" = self.server.mock
+        parts = urlsplit(self.path)
+        server.record_request()
+        if server.latency:
+            time.sleep(server.latency)
+
+        query = {k: v[0] for k, v in parse_qs(parts.query).items()}
+        if parts.path.endswith(".aspx"):
+            self._legacy_page(server, query)
+            return
+        if parts.path != RESULT_PATH:
+            self._send_json(404, {"status": 404, "message": "Not Found"})
+            return
+        if server.should_fail():
+            self._send_json(503, {"status": 503, "message": "Service Unavailable"})
+            return
+
+        redg_no = query.get("redg_no", "")
+        if not server.student_exists(redg_no):
+            self._send_json(200, {"status": 404, "message": "No Record Found", "data": None})
+            return
+
+        payload = make_payload(redg_no, query.get("semester", "III"), query.get("exam_held", "July/2025"))
+        self._send_json(200, {"status": 200, "message": "Result found", "data": payload})
+
+    def _legacy_page(self, server: "MockBEUServer", query: dict):
+        if server.should_fail():
+            self._send_html(503, "<html><body><h1>Service Unavailable</h1></body></html>")
+            return
+        redg_no = query.get("RegNo", "")
+        if not server.student_exists(redg_no):
+            self._send_html(200, make_missing_page())
+            return
+        semester = query.get("Sem", "III")
+        semesters = SEM_ROMANS.index(semester) + 1 if semester in SEM_ROMANS else 3
+        self._send_html(200, make_result_page(redg_no, semesters))
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024  # must be set before listen(), i.e. on the class
+
+
+class MockBEUServer:
+    """
+    Threaded HTTP server that answers get-result requests with synthetic
+    payloads, and legacy .aspx requests with synthetic result pages.
+
+    Args:
+        latency: Seconds to wait before answering each request
+        max_student: Regular students 1..max_student exist
+        max_lateral: LE students 901..max_lateral exist
+        port: Port to bind (0 picks a free one)
+        error_rate: Share of requests answered with 503 (drawn from a seeded
+            generator, so a run with the same requests fails the same way)
+        missing_rate: Share of registration numbers in range that have no
+            result (dropouts), making the range sparse; the same numbers are
+            missing on every run with the same seed
+        seed: Seed for errors and missing numbers
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.05,
+        max_student: int = 60,
+        max_lateral: int = 915,
+        port: int = 0,
+        error_rate: float = 0.0,
+        missing_rate: float = 0.0,
+        seed: int = 0
+    ):
+        self.latency = latency
+        self.max_student = max_student
+        self.max_lateral = max_lateral
+        self.error_rate = error_rate
+        self.missing_rate = missing_rate
+        self.seed = seed
+        self.requests_served = 0
+        self.errors_served = 0
+        self._errors = random.Random(seed)
+        self._count_lock = threading.Lock()
+        self._httpd = _Server(("127.0.0.1", port), _Handler)
+        self._httpd.mock = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def result_url(self) -> str:
+        return f"{self.base}{RESULT_PATH}"
+
+    @property
+    def legacy_url(self) -> str:
+        """Prefix for `scraper.fetch_all_results`; the registration number is appended."""
+        return f"{self.base}{LEGACY_PATH}?Sem=III&RegNo="
+
+    def record_request(self):
+        with self._count_lock:
+            self.requests_served += 1
+
+    def should_fail(self) -> bool:
+        """Decides whether the current request gets an error response."""
+        if not self.error_rate:
+            return False
+        with self._count_lock:
+            failed = self._errors.random() < self.error_rate
+            self.errors_served += failed
+        return failed
+
+    def student_exists(self, redg_no: str) -> bool:
+        if len(redg_no) != 11 or not redg_no.isdigit():
+            return False
+        number = int(redg_no[-3:])
+        if number >= 901:
+            exists = number <= self.max_lateral
+        else:
+            exists = 1 <= number <= self.max_student
+        if exists and self.missing_rate:
+            exists = random.Random(f"{self.seed}:{redg_no}").random() >= self.missing_rate
+        return exists
+
+    def start(self) -> "MockBEUServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "MockBEUServer":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the mock BEU result API")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--max-student", type=int, default=60)
+    parser.add_argument("--max-lateral", type=int, default=915)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests answered with 503")
+    parser.add_argument("--missing-rate", type=float, default=0.0, help="Share of registration numbers without a result")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    server = MockBEUServer(
+        args.latency, args.max_student, args.max_lateral, args.port,
+        error_rate=args.error_rate, missing_rate=args.missing_rate, seed=args.seed
+    )
+    print(f"Mock BEU API listening on {server.result_url}")
+    print(f"Legacy result pages at {server.legacy_url}<registration no>")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
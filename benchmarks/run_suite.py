@@ -0,0 +1,277 @@
+"""
+Benchmark Suite - Fetch, processing, analytics and export timings per cohort size, tracked over runs
+Author: Aditya Kumar
+
+Run from the repository root:
+    python -m benchmarks.run_suite                                   # 100, 1k, 10k and 100k students
+    python -m benchmarks.run_suite --sizes 100 1000 --stages process analytics
+    python -m benchmarks.run_suite --error-rate 0.02 --missing-rate 0.1   # flaky server, sparse ranges
+    python -m benchmarks.run_suite --trend                           # earlier runs side by side
+
+Every run is appended to benchmarks/history.jsonl (one JSON record with the
+commit, library versions and settings) and compared with the last earlier
+run that used the same settings.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import time
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+import scraper
+from aggregate_cube import build_cube
+from api_scraper import fetch_semester_results_async
+from benchmarks.mock_beu_api import MockBEUServer
+from benchmarks.synthetic import make_cohort
+from data_processor import build_subject_table, compact_results, get_statistics_summary, process_student_results
+from enhanced_analytics import (
+    compute_category_counts, compute_group_stats, compute_pass_fail, compute_subject_grade_counts,
+    compute_top_performers
+)
+from exporter import build_export
+
+DEFAULT_SIZES = [100, 1000, 10000, 100000]
+
+STAGES = ["fetch.api", "fetch.legacy", "process", "analytics", "export.csv", "export.json", "export.xlsx"]
+
+# Largest cohort a stage runs at unless --full is given: fetches make one
+# localhost request per student, and Excel exports are written cell by cell
+STAGE_LIMITS = {"fetch.api": 10000, "fetch.legacy": 1000, "export.xlsx": 10000}
+
+# Regular registration numbers fetched per college code (LE numbers start at 901)
+STUDENTS_PER_COLLEGE = 900
+
+HISTORY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "history.jsonl")
+
+
+def college_blocks(n: int, first_college: int = 110) -> Iterator[Tuple[str, int]]:
+    """Splits `n` students into (college code, students) blocks the mock server can serve."""
+    block = 0
+    while n > 0:
+        count = min(n, STUDENTS_PER_COLLEGE)
+        yield f"{first_college + block:03d}", count
+        n -= count
+        block += 1
+
+
+def fetch_api(server: MockBEUServer, n: int, args) -> int:
+    async def fetch_blocks() -> int:
+        found = 0
+        for college, count in college_blocks(n):
+            results = await fetch_semester_results_async(
+                1, count, "105", college, 3, 23,
+                exam_month="July", exam_year=2025,
+                max_concurrency=args.concurrency, rate_per_host=args.rate,
+                base_url=server.result_url,
+                use_cache=False  # synthetic payloads must never land in the real cache
+            )
+            found += len(results)
+        return found
+
+    return asyncio.run(fetch_blocks())
+
+
+def fetch_legacy(server: MockBEUServer, n: int, args) -> int:
+    found = 0
+    for college, count in college_blocks(n):
+        first = int(f"23105{college}001")
+        results = scraper.fetch_all_results(
+            server.legacy_url, first, first + count - 1, io_workers=16, rate=args.rate, retries=3
+        )
+        found += len(results)
+    return found
+
+
+def run_analytics(df: pd.DataFrame, subjects: pd.DataFrame):
+    """Every aggregate behind the analytics dashboard, uncached."""
+    cube = build_cube(df)
+    compute_group_stats(cube, "College Name")
+    compute_group_stats(cube, "Course")
+    compute_pass_fail(cube)
+    compute_category_counts(df)
+    compute_top_performers(df)
+    compute_subject_grade_counts(df, subjects)
+    get_statistics_summary(df)
+
+
+def best_of(func: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_fetch(stage: str, n: int, args) -> Dict:
+    """One fetch of `n` students from a fresh mock server (fetches are not repeated)."""
+    fetch = fetch_api if stage == "fetch.api" else fetch_legacy
+    with MockBEUServer(
+        latency=args.latency, max_student=STUDENTS_PER_COLLEGE, max_lateral=0,
+        error_rate=args.error_rate, missing_rate=args.missing_rate, seed=args.seed
+    ) as server:
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):  # per-student retry and "no data" messages
+            found = fetch(server, n, args)
+        seconds = time.perf_counter() - start
+        return {"seconds": seconds, "found": found, "requests": server.requests_served, "errors": server.errors_served}
+
+
+def run_size(n: int, stages: List[str], args) -> List[Dict]:
+    results = []
+
+    def record(stage: str, measured: Dict):
+        measured = {"stage": stage, "students": n, **measured}
+        measured["per_second"] = n / measured["seconds"] if measured["seconds"] else None
+        results.append(measured)
+        print(f"{stage:<14}{n:>9}{measured['seconds']:>11.3f}{measured['per_second']:>13.0f}")
+
+    for stage in (s for s in stages if s.startswith("fetch.")):
+        if args.full or n <= STAGE_LIMITS.get(stage, n):
+            record(stage, run_fetch(stage, n, args))
+
+    local = [s for s in stages if not s.startswith("fetch.") and (args.full or n <= STAGE_LIMITS.get(s, n))]
+    if not local:
+        return results
+
+    payloads = make_cohort(n)
+    df = compact_results(process_student_results(payloads))
+    subjects = build_subject_table(payloads)
+    for stage in local:
+        if stage == "process":
+            seconds = best_of(lambda: process_student_results(payloads), args.repeat)
+        elif stage == "analytics":
+            seconds = best_of(lambda: run_analytics(df, subjects), args.repeat)
+        else:
+            fmt = stage.split(".", 1)[1]
+            seconds = best_of(lambda: build_export(df, fmt), 1 if fmt == "xlsx" else args.repeat)
+        record(stage, {"seconds": seconds})
+    return results
+
+
+def git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=10,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def load_history(path: str) -> List[Dict]:
+    if not os.path.exists(path):
+        return []
+    runs = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                runs.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue  # a run interrupted while writing
+    return runs
+
+
+def append_history(path: str, run: Dict):
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(run) + "\n")
+
+
+def compare(run: Dict, history: List[Dict]):
+    """Prints the change of every result against its latest earlier measurement with the same settings."""
+    before = {}
+    for previous in reversed(history):
+        if previous.get("settings") == run["settings"]:
+            for r in previous["results"]:
+                before.setdefault((r["stage"], r["students"]), (r["seconds"], previous))
+    matched = [(r, before[(r["stage"], r["students"])]) for r in run["results"] if (r["stage"], r["students"]) in before]
+    if not matched:
+        print("\nNo earlier run with the same settings to compare with")
+        return
+    print("\nCompared with earlier runs with the same settings:")
+    print(f"{'stage':<14}{'students':>9}{'before s':>11}{'now s':>11}{'change':>9}  earlier run")
+    for r, (old, previous) in matched:
+        change = (r["seconds"] - old) / old * 100 if old else 0.0
+        print(
+            f"{r['stage']:<14}{r['students']:>9}{old:>11.3f}{r['seconds']:>11.3f}{change:>+8.1f}%  "
+            f"{previous['timestamp']} {previous.get('commit') or ''}"
+        )
+
+
+def show_trend(history: List[Dict], last: int):
+    """Seconds per stage and size over the last `last` runs, oldest first."""
+    rows = [
+        {"run": f"{run['timestamp']} {run.get('commit') or ''}".strip(), **result}
+        for run in history[-last:]
+        for result in run["results"]
+    ]
+    if not rows:
+        print("No runs recorded yet")
+        return
+    table = pd.DataFrame(rows).pivot_table(
+        index=["stage", "students"], columns="run", values="seconds", aggfunc="first", sort=False
+    )
+    with pd.option_context("display.width", 200, "display.max_columns", None, "display.float_format", "{:.3f}".format):
+        print(table.sort_index(level=["stage", "students"]))
+
+
+def run(args):
+    if args.trend:
+        show_trend(load_history(args.history), args.last)
+        return
+
+    settings = {
+        key: getattr(args, key)
+        for key in ("latency", "error_rate", "missing_rate", "seed", "rate", "concurrency", "repeat")
+    }
+    print(f"{'stage':<14}{'students':>9}{'seconds':>11}{'students/s':>13}")
+    results = []
+    for n in args.sizes:
+        results += run_size(n, args.stages, args)
+
+    record = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "machine": platform.platform(),
+        "cpus": os.cpu_count(),
+        "settings": settings,
+        "results": results,
+    }
+    history = load_history(args.history)
+    compare(record, history)
+    if not args.no_save:
+        append_history(args.history, record)
+        print(f"\nRun saved to {args.history}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the benchmark suite and track results over time")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=STAGES)
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per in-process stage; the best is reported")
+    parser.add_argument("--full", action="store_true", help="Run every stage at every size (see STAGE_LIMITS)")
+    parser.add_argument("--latency", type=float, default=0.01, help="Mock server latency per request (s)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests answered with 503")
+    parser.add_argument("--missing-rate", type=float, default=0.0, help="Share of registration numbers without a result")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--rate", type=float, default=2000.0, help="Requests/second allowed against the mock server")
+    parser.add_argument("--concurrency", type=int, default=64, help="Async requests in flight")
+    parser.add_argument("--history", default=HISTORY_PATH, help="JSON-lines file runs are appended to")
+    parser.add_argument("--no-save", action="store_true", help="Do not record this run")
+    parser.add_argument("--trend", action="store_true", help="Show recorded runs instead of running")
+    parser.add_argument("--last", type=int, default=8, help="Runs shown by --trend")
+    run(parser.parse_args())
@@ -0,0 +1,177 @@
+"""
+Synthetic Payload Generator - Builds get-result payloads shaped like the real API
+Author: Aditya Kumar
+"""
+
+import random
+from typing import Dict, List
+
+SEM_ROMANS = ["I", "II", "III", "IV", "V", "VI", "VII", "VIII"]
+
+GRADES = ["A+", "A", "B", "C", "D", "E", "F"]
+
+THEORY_SUBJECTS = [
+    ("100302", "ANALOG ELECTRONIC CIRCUITS"),
+    ("100304", "DATA STRUCTURE & ALGORITHMS"),
+    ("100311", "MATHEMATICS-III (DIFFERENTIAL CALCULUS)"),
+    ("100313", "OBJECT ORIENTED PROGRAMMING USING C++"),
+    ("100314", "TECHNICAL WRITING"),
+    ("100301", "BIOLOGY FOR ENGINEERS"),
+]
+
+PRACTICAL_SUBJECTS = [
+    ("100302P", "Analog Electronics Circuits Laboratory"),
+    ("100304P", "DATA STRUCTURE & ALGORITHMS"),
+    ("100313P", "OBJECT ORIENTED PROGRAMMING USING C++"),
+    ("100399P", "Internship"),
+]
+
+COLLEGES = {
+    "110": "GAYA COLLEGE OF ENGINEERING, GAYA",
+    "108": "BHAGALPUR COLLEGE OF ENGINEERING, BHAGALPUR",
+    "107": "MUZAFFARPUR INSTITUTE OF TECHNOLOGY, MUZAFFARPUR",
+}
+
+COURSES = {
+    "105": "COMPUTER SCIENCE & ENGINEERING",
+    "101": "CIVIL ENGINEERING",
+    "102": "MECHANICAL ENGINEERING",
+}
+
+
+def _subject(rng: random.Random, code: str, name: str, ese_max: int, ia_max: int, credit: str) -> Dict:
+    ese = rng.randint(ese_max // 3, ese_max)
+    ia = rng.randint(ia_max // 2, ia_max)
+    total = ese + ia
+    # Sprinkle the NULL/NE markers the real API sends for absent components
+    if rng.random() < 0.02:
+        return {"code": code, "name": name, "ese": "NE", "ia": str(ia), "total": "NULL", "grade": "F", "credit": credit}
+    percent = total * 100 // (ese_max + ia_max)
+    grade = GRADES[min(len(GRADES) - 1, max(0, (99 - percent) // 10))] if percent >= 40 else "F"
+    return {"code": code, "name": name, "ese": str(ese), "ia": str(ia), "total": str(total), "grade": grade, "credit": credit}
+
+
+def make_payload(redg_no: str, semester: str = "III", exam_held: str = "July/2025") -> Dict:
+    """
+    Builds one student's `data` object. Output is deterministic per
+    registration number, so repeated fetches of the same student agree.
+    """
+    rng = random.Random(int(redg_no))
+    redg_no = str(redg_no)
+    course_code = redg_no[2:5]
+    college_code = redg_no[5:8]
+    sem_index = SEM_ROMANS.index(semester) if semester in SEM_ROMANS else 2
+    is_lateral = int(redg_no[-3:]) >= 900
+
+    theory = [_subject(rng, code, name, 70, 30, "3.00") for code, name in THEORY_SUBJECTS[:rng.choice([4, 5, 5, 6])]]
+    practical = [_subject(rng, code, name, 30, 20, "2.00") for code, name in PRACTICAL_SUBJECTS]
+
+    sgpa: List = [None] * 8
+    for i in range(sem_index + 1):
+        sgpa[i] = "NULL" if is_lateral and i < 2 else f"{rng.uniform(4.5, 9.8):.2f}"
+    fail_any = "FAIL" if any(s["grade"] == "F" for s in theory + practical) else "PASS"
+
+    return {
+        "semester": semester,
+        "exam_held": exam_held,
+        "redg_no": int(redg_no),
+        "name": f"STUDENT {redg_no[-3:]}",
+        "father_name": f"FATHER {redg_no[-3:]}",
+        "mother_name": f"MOTHER {redg_no[-3:]}",
+        "college_code": int(college_code),
+        "college_name": COLLEGES.get(college_code, f"COLLEGE {college_code}"),
+        "course_code": int(course_code),
+        "course": COURSES.get(course_code, f"COURSE {course_code}"),
+        "examYear": 2000 + int(redg_no[:2]) + 1,
+        "theorySubjects": theory,
+        "practicalSubjects": practical,
+        "sgpa": sgpa,
+        "cgpa": "NULL" if is_lateral else f"{rng.uniform(5.0, 9.5):.2f}",
+        "fail_any": fail_any,
+    }
+
+
+def make_cohort(n: int, batch: int = 23, branch: str = "105", college: str = "110", semester: str = "III") -> List[Dict]:
+    """Builds `n` payloads with consecutive registration numbers, moving to the next college code every 999."""
+    payloads = []
+    for i in range(n):
+        block, reg = divmod(i, 999)
+        code = f"{int(college) + block:03d}"
+        payloads.append(make_payload(f"{batch}{branch}{code}{reg + 1:03d}", semester))
+    return payloads
+
+
+def make_result_page(redg_no: str, semesters: int = 3) -> str:
+    """
+    Builds a legacy-portal (ASP.NET) result page for one student, with the
+    `ContentPlaceHolder1_*` labels, the GridView3 semester table and a
+    realistic amount of surrounding markup and view state.
+    """
+    rng = random.Random(int(redg_no))
+    redg_no = str(redg_no)
+    suffix = redg_no[-3:]
+    view_state = "".join(rng.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/") for _ in range(12000))
+    sgpas = [f"{rng.uniform(4.5, 9.8):.2f}" for _ in range(semesters)]
+    cgpa = f"{sum(float(s) for s in sgpas) / len(sgpas):.2f}"
+
+    headers = "".join(f'<th scope="col">{roman}</th>' for roman in SEM_ROMANS) + '<th scope="col">Cur. CGPA</th>'
+    cells = "".join(
+        f"<td>{sgpas[i]}</td>" if i < semesters else "<td>&nbsp;</td>"
+        for i in range(len(SEM_ROMANS))
+    ) + f"<td>{cgpa}</td>"
+    subject_rows = "\n".join(
+        f'<tr><td>{code}</td><td>{name.replace("&", "&amp;")}</td><td>{rng.randint(20, 70)}</td>'
+        f'<td>{rng.randint(10, 30)}</td><td>{rng.choice(GRADES)}</td><td>3</td></tr>'
+        for code, name in THEORY_SUBJECTS
+    )
+
+    return f"""<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.0 Transitional//EN" "http://www.w3.org/TR/xhtml1/DTD/xhtml1-transitional.dtd">
+<html xmlns="http://www.w3.org/1999/xhtml">
+<head><title>Bihar Engineering University, Patna - Result</title>
+<link href="css/style.css" rel="stylesheet" type="text/css" />
+<script type="text/javascript">function printDiv() {{ window.print(); }}</script>
+</head>
+<body>
+<form method="post" action="./ResultsBTech{semesters}Sem2023_B2022.aspx?Sem=III&amp;RegNo={redg_no}" id="form1">
+<div class="aspNetHidden">
+<input type="hidden" name="__VIEWSTATE" id="__VIEWSTATE" value="{view_state}" />
+<input type="hidden" name="__VIEWSTATEGENERATOR" id="__VIEWSTATEGENERATOR" value="5C1B4B27" />
+</div>
+<div id="printdiv">
+<table id="ContentPlaceHolder1_DataList1" cellspacing="0" style="width:100%;border-collapse:collapse;">
+  <tr><td>
+    <table class="style1">
+      <tr><td>Registration No:</td><td><span id="ContentPlaceHolder1_DataList1_RegistrationNoLabel_0">{redg_no}</span></td></tr>
+      <tr><td>Student Name:</td><td><span id="ContentPlaceHolder1_DataList1_StudentNameLabel_0">
+        STUDENT {suffix}</span></td></tr>
+      <tr><td>Father's Name:</td><td><span id="ContentPlaceHolder1_DataList1_FatherNameLabel_0">FATHER {suffix} &amp; FAMILY</span></td></tr>
+      <tr><td>Mother's Name:</td><td><span id="ContentPlaceHolder1_DataList1_MotherNameLabel_0">MOTHER <!-- legacy -->{suffix}</span></td></tr>
+      <tr><td>College Name:</td><td><span id="ContentPlaceHolder1_DataList1_CollegeNameLabel_0">{COLLEGES.get(redg_no[5:8], "COLLEGE")}</span></td></tr>
+    </table>
+  </td></tr>
+</table>
+<table id="ContentPlaceHolder1_GridView1" class="table" cellspacing="0" rules="all" border="1">
+  <tr><th scope="col">Subject Code</th><th scope="col">Subject Name</th><th scope="col">ESE</th><th scope="col">IA</th><th scope="col">Grade</th><th scope="col">Credit</th></tr>
+{subject_rows}
+</table>
+<table id="ContentPlaceHolder1_DataList5" cellspacing="0">
+  <tr><td>SGPA: <span id="ContentPlaceHolder1_DataList5_GROSSTHEORYTOTALLabel_0"> {sgpas[-1]} </span></td></tr>
+</table>
+<table id="ContentPlaceHolder1_GridView3" class="table" cellspacing="0" rules="all" border="1">
+  <tr>{headers}</tr>
+  <tr>{cells}</tr>
+</table>
+</div>
+</form>
+</body>
+</html>
+"""
+
+
+def make_missing_page() -> str:
+    """The page the portal serves for a registration number with no result."""
+    return """<!DOCTYPE html>
+<html><head><title>Result</title></head>
+<body><form id="form1"><div id="printdiv"><span id="ContentPlaceHolder1_Label1">No Record Found !!!</span></div></form></body>
+</html>
+"""
@@ -0,0 +1,76 @@
+"""
+BEU Codes Module - Branch, college and semester code tables shared by the app and CLI tools
+Author: Aditya Kumar
+"""
+
+branch_codes = {
+    "105": "Computer Science Engineering (CSE)",
+    "101": "Civil Engineering (CE)",
+    "102": "Mechanical Engineering (ME)",
+    "103": "Electrical Engineering (EE)",
+    "110": "Electrical and Electronics Engineering (EEE)",
+    "155": "CSE (IoT)"
+}
+
+college_codes = {
+    "110": "Gaya College of Engineering, Gaya",
+    "108": "Bhagalpur College of Engineering, Bhagalpur",
+    "107": "Muzaffarpur Institute of Technology, Muzaffarpur",
+    "109": "Nalanda College of Engineering, Nalanda",
+    "111": "Darbhanga College of Engineering, Darbhanga",
+    "113": "Motihari College Of Engineering, Mothihari",
+    "117": "Lok Nayak Jai Prakash Institute of Technology, Chhapra",
+    "124": "Sershah Engineering College, Sasaram, Rohtas",
+    "125": "Rashtrakavi Ramdhari Singh Dinkar College of Engineering, Begusarai",
+    "126": "Bakhtiyarpur College of Engineering, Patna",
+    "127": "Sitamarhi Institute of Technology, Sitamarhi",
+    "128": "B.P. Mandal College of Engineering, Madhepura",
+    "129": "Katihar Engineering of College, Katihar",
+    "130": "Supaul College of Engineering, Supaul",
+    "131": "Purnea College of Engineering, Purnea",
+    "132": "Saharsa College of Engineering, Saharsa",
+    "133": "Government Engineering College, Jamui",
+    "134": "Government Engineering College, Banka",
+    "135": "Government Engineering College, Vaishali",
+    "141": "Government Engineering College, Nawada",
+    "142": "Government Engineering College, Kishanganj",
+    "144": "Government Engineering College, Munger",
+    "145": "Government Engineering College, Sheohar",
+    "146": "Government Engineering College, West Champaran",
+    "147": "Government Engineering College, Aurangabad",
+    "148": "Government Engineering College, Kaimur",
+    "149": "Government Engineering College, Gopalganj",
+    "150": "Government Engineering College, Madhubani",
+    "151": "Government Engineering College, Siwan",
+    "152": "Government Engineering College, Jehanabad",
+    "153": "Government Engineering College, Arwal",
+    "154": "Government Engineering College, Khagaria",
+    "155": "Government Engineering College, Buxar",
+    "156": "Government Engineering College, Bhojpur",
+    "157": "Government Engineering College, Sheikhpura",
+    "158": "Government Engineering College, Lakhisarai",
+    "159": "Government Engineering College, Samastipur",
+    "165": "Shri Phanishwar Nath Renu Engineering College, Araria",
+    "102": "Vidya Vihar Institute of Technology, Purnia",
+    "103": "Netaji Subhash Institute of Technology, Patna",
+    "106": "Sityog Institute of Technology, Aurangabad",
+    "115": "Azmet Institute of Technology, Kishanganj",
+    "118": "Buddha Institute of Technology, Gaya",
+    "119": "Adwaita Mission Institute of Technology, Banka",
+    "121": "Moti Babu Institute of Technology, Forbesganj",
+    "122": "Exalt College of Engineering & Technology, Vaishali",
+    "123": "Siwan Engineering & Technical Institute, Siwan",
+    "136": "Mother's Institute of Technology, Bihta, Patna",
+    "139": "R.P. Sharma Institute of Technology, Patna",
+    "140": "Maulana Azad College of Engineering & Technology, Patna"
+}
+
+sem_words = {
+    1: "1st", 2: "2nd", 3: "3rd", 4: "4th",
+    5: "5th", 6: "6th", 7: "7th", 8: "8th"
+}
+
+sem_romans = {
+    1: "I", 2: "II", 3: "III", 4: "IV",
+    5: "V", 6: "VI", 7: "VII", 8: "VIII"
+}
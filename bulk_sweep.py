@@ -0,0 +1,292 @@
+"""
+Bulk Sweep Module - University-wide result sweep across colleges and branches
+Author: Aditya Kumar
+
+Fetches one semester for every (college, branch) class on a bounded worker
+pool. Every finished lookup is appended to a checkpoint file, keyed by the
+sweep session (batch, semester, exam month and year) as well as college,
+branch, API batch and registration number, so an interrupted multi-hour run
+picks up where it stopped and one checkpoint file can hold several sweeps.
+
+Usage:
+    python bulk_sweep.py --batch 23 --semester 3 --exam-month July --exam-year 2025
+    python bulk_sweep.py --batch 23 --semester 3 --colleges 110 108 --branches 105
+"""
+
+import argparse
+import json
+import os
+import queue
+import threading
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+from api_scraper import (
+    fetch_result_status, BASE_URL, SEM_ROMANS, FOUND, MISSING,
+    DEFAULT_MISS_STREAK, DEFAULT_LE_MISS_STREAK, LE_START, LE_LAST
+)
+from beu_codes import branch_codes, college_codes
+from retry_policy import RetryBudget
+
+DEFAULT_WORKERS = 8
+DEFAULT_CHECKPOINT = "sweep_checkpoint.jsonl"
+DEFAULT_OUTPUT = "sweep_results.jsonl"
+
+# Fields identifying one sweep (batch, semester, exam month, exam year)
+SESSION_FIELDS = ("batch", "semester", "exam_month", "exam_year")
+
+SweepSession = Tuple[int, int, str, int]
+
+
+def sweep_session(args: argparse.Namespace) -> SweepSession:
+    """The session key of a sweep run."""
+    return (args.batch, args.semester, args.exam_month, args.exam_year)
+
+
+class SweepCheckpoint:
+    """
+    Append-only JSONL log of finished keys.
+
+    Each line carries the session fields (batch, semester, exam_month,
+    exam_year) plus one of: a finished lookup {"college", "branch",
+    "api_batch", "reg", "status"}, a finished segment {"college", "branch",
+    "api_batch", "segment_done": true} or a finished class {"college",
+    "branch", "class_done": true}. The API batch separates the regular and
+    LE segments, whose numbers overlap (901-999). Failed lookups are never
+    recorded, and a segment or class with a failed lookup is not marked
+    finished, so they are retried on resume. Lines without session fields
+    (older checkpoints) are ignored.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.statuses: Dict[Tuple[int, int, str, int, str, str, int, int], str] = {}
+        self.finished_segments: Set[Tuple[int, int, str, int, str, str, int]] = set()
+        self.finished_classes: Set[Tuple[int, int, str, int, str, str]] = set()
+        self._lock = threading.Lock()
+
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # torn last line from a killed run
+                    if any(field not in entry for field in SESSION_FIELDS):
+                        continue
+                    key = (*(entry[field] for field in SESSION_FIELDS), entry["college"], entry["branch"])
+                    if entry.get("class_done"):
+                        self.finished_classes.add(key)
+                    elif entry.get("segment_done"):
+                        self.finished_segments.add((*key, entry["api_batch"]))
+                    elif "api_batch" in entry:
+                        self.statuses[(*key, entry["api_batch"], entry["reg"])] = entry["status"]
+        self._file = open(path, "a", encoding="utf-8")
+
+    def _append(self, entry: Dict):
+        with self._lock:
+            self._file.write(json.dumps(entry) + "\n")
+            self._file.flush()
+
+    def status(self, session: SweepSession, college: str, branch: str, api_batch: int, reg: int) -> Optional[str]:
+        return self.statuses.get((*session, college, branch, api_batch, reg))
+
+    def is_finished(self, session: SweepSession, college: str, branch: str) -> bool:
+        return (*session, college, branch) in self.finished_classes
+
+    def is_segment_finished(self, session: SweepSession, college: str, branch: str, api_batch: int) -> bool:
+        return (*session, college, branch, api_batch) in self.finished_segments
+
+    def record(self, session: SweepSession, college: str, branch: str, api_batch: int, reg: int, status: str):
+        self.statuses[(*session, college, branch, api_batch, reg)] = status
+        self._append({
+            **dict(zip(SESSION_FIELDS, session)),
+            "college": college, "branch": branch, "api_batch": api_batch, "reg": reg, "status": status,
+        })
+
+    def finish_segment(self, session: SweepSession, college: str, branch: str, api_batch: int):
+        self.finished_segments.add((*session, college, branch, api_batch))
+        self._append({
+            **dict(zip(SESSION_FIELDS, session)),
+            "college": college, "branch": branch, "api_batch": api_batch, "segment_done": True,
+        })
+
+    def finish_class(self, session: SweepSession, college: str, branch: str):
+        self.finished_classes.add((*session, college, branch))
+        self._append({**dict(zip(SESSION_FIELDS, session)), "college": college, "branch": branch, "class_done": True})
+
+    def close(self):
+        self._file.close()
+
+
+class SweepProgress:
+    """Thread-safe counters plus a throughput-based ETA."""
+
+    def __init__(self, total_classes: int, already_done: int):
+        self.total_classes = total_classes
+        self.classes_done = already_done
+        self.requests = 0
+        self.found = 0
+        self.started = time.monotonic()
+        self._resumed_from = already_done
+        self._lock = threading.Lock()
+
+    def add(self, requests: int = 0, found: int = 0, classes: int = 0):
+        with self._lock:
+            self.requests += requests
+            self.found += found
+            self.classes_done += classes
+
+    def eta_seconds(self) -> Optional[float]:
+        finished_now = self.classes_done - self._resumed_from
+        if finished_now <= 0:
+            return None
+        elapsed = time.monotonic() - self.started
+        return elapsed / finished_now * (self.total_classes - self.classes_done)
+
+    def line(self) -> str:
+        elapsed = time.monotonic() - self.started
+        eta = self.eta_seconds()
+        eta_text = "--:--" if eta is None else time.strftime("%H:%M:%S", time.gmtime(eta))
+        rate = self.requests / elapsed if elapsed else 0.0
+        return (
+            f"classes {self.classes_done}/{self.total_classes} | students {self.found} | "
+            f"requests {self.requests} ({rate:.1f}/s) | ETA {eta_text}"
+        )
+
+
+def sweep_class(
+    college: str,
+    branch: str,
+    args: argparse.Namespace,
+    checkpoint: SweepCheckpoint,
+    progress: SweepProgress,
+    write_result,
+    retry_budget: Optional[RetryBudget] = None
+):
+    """
+    Probes one class: regular numbers from 1, then LE numbers from 901.
+    Segments (and the class) are only marked finished when none of their
+    lookups failed; otherwise a resumed sweep probes them again.
+    """
+    semester = SEM_ROMANS[args.semester]
+    session = sweep_session(args)
+
+    segments = [
+        (range(args.reg_start, args.reg_end + 1), args.batch, args.miss_streak),
+    ]
+    if args.lateral:
+        segments.append((range(LE_START, LE_LAST + 1), args.batch + 1, args.le_miss_streak))
+
+    class_failed = False
+    for numbers, api_batch, miss_streak in segments:
+        if checkpoint.is_segment_finished(session, college, branch, api_batch):
+            continue
+        streak = 0
+        segment_failed = False
+        for reg in numbers:
+            if streak >= miss_streak:
+                break
+            status = checkpoint.status(session, college, branch, api_batch, reg)
+            if status is None:
+                full_reg = f"{api_batch}{branch}{college}{reg:03d}"
+                status, payload = fetch_result_status(
+                    full_reg, semester, api_batch, args.exam_month, args.exam_year,
+                    base_url=args.base_url, use_cache=args.use_cache,
+                    retry_budget=retry_budget
+                )
+                progress.add(requests=1)
+                if status == FOUND:
+                    write_result(payload)
+                    progress.add(found=1)
+                if status in (FOUND, MISSING):
+                    checkpoint.record(session, college, branch, api_batch, reg, status)
+            segment_failed |= status not in (FOUND, MISSING)
+            streak = 0 if status == FOUND else streak + (status == MISSING)
+        if segment_failed:
+            class_failed = True
+        else:
+            checkpoint.finish_segment(session, college, branch, api_batch)
+
+    if class_failed:
+        print(f"\nClass {college}/{branch} has failed lookups; they are retried when the sweep is resumed")
+        return
+    checkpoint.finish_class(session, college, branch)
+    progress.add(classes=1)
+
+
+def run_sweep(args: argparse.Namespace):
+    colleges: List[str] = args.colleges or list(college_codes)
+    branches: List[str] = args.branches or list(branch_codes)
+    checkpoint = SweepCheckpoint(args.checkpoint)
+
+    classes = [(c, b) for c in colleges for b in branches]
+    session = sweep_session(args)
+    pending = [(c, b) for c, b in classes if not checkpoint.is_finished(session, c, b)]
+    progress = SweepProgress(len(classes), len(classes) - len(pending))
+    print(f"Sweeping {len(classes)} classes ({len(pending)} pending) with {args.workers} workers")
+
+    work: "queue.Queue[Tuple[str, str]]" = queue.Queue()
+    for key in pending:
+        work.put(key)
+
+    retry_budget = RetryBudget()
+    output_lock = threading.Lock()
+    output = open(args.output, "a", encoding="utf-8")
+
+    def write_result(payload: Dict):
+        with output_lock:
+            output.write(json.dumps(payload) + "\n")
+            output.flush()
+
+    def worker():
+        while True:
+            try:
+                college, branch = work.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                sweep_class(college, branch, args, checkpoint, progress, write_result, retry_budget)
+            except Exception as e:
+                print(f"\nClass {college}/{branch} stopped early: {e}")
+
+    threads = [threading.Thread(target=worker, daemon=True) for _ in range(args.workers)]
+    for t in threads:
+        t.start()
+
+    try:
+        while any(t.is_alive() for t in threads):
+            print("\r" + progress.line(), end="", flush=True)
+            time.sleep(args.report_every)
+    except KeyboardInterrupt:
+        print("\nInterrupted - progress is checkpointed, rerun the same command to resume.")
+    finally:
+        print("\r" + progress.line())
+        checkpoint.close()
+        output.close()
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Sweep BEU results across colleges and branches")
+    parser.add_argument("--batch", type=int, required=True, help="Batch year, 2 digits (e.g. 23)")
+    parser.add_argument("--semester", type=int, required=True, choices=range(1, 9))
+    parser.add_argument("--exam-month", default="July")
+    parser.add_argument("--exam-year", type=int, default=2025)
+    parser.add_argument("--colleges", nargs="*", help="College codes (default: all)")
+    parser.add_argument("--branches", nargs="*", help="Branch codes (default: all)")
+    parser.add_argument("--reg-start", type=int, default=1)
+    parser.add_argument("--reg-end", type=int, default=999)
+    parser.add_argument("--miss-streak", type=int, default=DEFAULT_MISS_STREAK)
+    parser.add_argument("--no-lateral", dest="lateral", action="store_false", help="Skip LE students")
+    parser.add_argument("--le-miss-streak", type=int, default=DEFAULT_LE_MISS_STREAK)
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    parser.add_argument("--checkpoint", default=DEFAULT_CHECKPOINT)
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="JSONL file receiving raw payloads")
+    parser.add_argument("--base-url", default=BASE_URL, help="API endpoint (e.g. a local mock)")
+    parser.add_argument("--no-cache", dest="use_cache", action="store_false", help="Bypass the local result cache")
+    parser.add_argument("--report-every", type=float, default=2.0, help="Seconds between progress lines")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    run_sweep(parse_args())
@@ -3,9 +3,122 @@ Data Processing Module - Transforms API responses into structured DataFrames
 Author: Aditya Kumar
 """
 
+import re
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Optional
+from itertools import chain
+from typing import List, Dict, Optional, Tuple
+
+from instrumentation import timed
+
+
+NULL_MARKERS = {"NULL", "NE", "N/A", "-", ""}
+
+# Rows buffered by IncrementalResultProcessor before they become a frame chunk
+DEFAULT_CHUNK_SIZE = 100
+
+
+def _safe_int(value, default=None):
+    try:
+        if value is None:
+            return default
+        s = str(value).strip()
+        if s.upper() in NULL_MARKERS:
+            return default
+        return int(float(s))
+    except Exception:
+        return default
+
+
+def _safe_float(value, default=None):
+    try:
+        if value is None:
+            return default
+        s = str(value).strip()
+        if s.upper() in NULL_MARKERS:
+            return default
+        return float(s)
+    except Exception:
+        return default
+
+
+def _latest_numeric_sgpa(sgpa_list: Optional[List]) -> float:
+    """Return the latest numeric SGPA from the list or NaN if none."""
+    if not sgpa_list:
+        return float("nan")
+    # iterate reversed and find first value that can be converted to float
+    for v in reversed(sgpa_list):
+        if v is None:
+            continue
+        s = str(v).strip()
+        if s.upper() in NULL_MARKERS:
+            continue
+        try:
+            return float(s)
+        except Exception:
+            continue
+    return float("nan")
+
+
+def _student_row(student_data: Dict) -> Dict:
+    """Flattens one API payload into a DataFrame row."""
+    # Calculate GPA from theory and practical subjects
+    theory_subjects = student_data.get("theorySubjects", []) or []
+    practical_subjects = student_data.get("practicalSubjects", []) or []
+    all_subjects = theory_subjects + practical_subjects
+
+    sgpa_list = student_data.get("sgpa") or []
+    current_sgpa = _latest_numeric_sgpa(sgpa_list)
+
+    # If CGPA is NULL/None, use the latest SGPA value
+    cgpa_val = _safe_float(student_data.get("cgpa"), default=float("nan"))
+    if pd.isna(cgpa_val):
+        cgpa_val = current_sgpa
+
+    row = {
+        "Registration No.": str(student_data.get("redg_no", "")),
+        "Student Name": student_data.get("name", ""),
+        "Father's Name": student_data.get("father_name", ""),
+        "Mother's Name": student_data.get("mother_name", ""),
+        "College Code": str(student_data.get("college_code", "")),
+        "College Name": student_data.get("college_name", ""),
+        "Course Code": str(student_data.get("course_code", "")),
+        "Course": student_data.get("course", ""),
+        "Semester": student_data.get("semester", ""),
+        "Exam Held": student_data.get("exam_held", ""),
+        "Current SGPA": current_sgpa,
+        "CGPA": cgpa_val,
+        "Status": student_data.get("fail_any", "PASS"),
+        "Total Subjects": len(all_subjects),
+        "Theory Subjects": len(theory_subjects),
+        "Practical Subjects": len(practical_subjects),
+    }
+
+    # Add subject details as separate columns (safe parsing)
+    for idx, subject in enumerate(theory_subjects):
+        row[f"Theory_{idx+1}_Name"] = subject.get("name", "")
+        row[f"Theory_{idx+1}_Grade"] = subject.get("grade", "")
+        row[f"Theory_{idx+1}_Total"] = _safe_int(subject.get("total"), default=None)
+        row[f"Theory_{idx+1}_Credit"] = _safe_float(subject.get("credit"), default=None)
+
+    for idx, subject in enumerate(practical_subjects):
+        row[f"Practical_{idx+1}_Name"] = subject.get("name", "")
+        row[f"Practical_{idx+1}_Grade"] = subject.get("grade", "")
+        row[f"Practical_{idx+1}_Total"] = _safe_int(subject.get("total"), default=None)
+        row[f"Practical_{idx+1}_Credit"] = _safe_float(subject.get("credit"), default=None)
+
+    return row
+
+
+@timed("process.rows_to_frame")
+def _rows_to_frame(processed_data: List[Dict]) -> pd.DataFrame:
+    df = pd.DataFrame(processed_data)
+    # Ensure numeric columns are proper dtype
+    if "Current SGPA" in df.columns:
+        df["Current SGPA"] = pd.to_numeric(df["Current SGPA"], errors="coerce")
+    if "CGPA" in df.columns:
+        df["CGPA"] = pd.to_numeric(df["CGPA"], errors="coerce")
+    return df
 
 
 def process_student_results(results: List[Dict]) -> pd.DataFrame:
@@ -18,108 +131,782 @@ def process_student_results(results: List[Dict]) -> pd.DataFrame:
     Returns:
         DataFrame with flattened student data
     """
+    return normalize_results(results)
+
+
+def process_student_results_rowwise(results: List[Dict]) -> pd.DataFrame:
+    """
+    Reference row-by-row implementation of `process_student_results`.
+    Kept for benchmarks and equivalence checks against `normalize_results`.
+    """
     processed_data = []
 
-    def safe_int(value, default=None):
+    for student_data in results:
         try:
-            if value is None:
-                return default
-            s = str(value).strip()
-            if s.upper() in {"NULL", "NE", "N/A", "-", ""}:
-                return default
-            return int(float(s))
-        except Exception:
-            return default
+            processed_data.append(_student_row(student_data))
+        except Exception as e:
+            print(f"Error processing student {student_data.get('name', 'Unknown')}: {e}")
+            continue
+
+    return _rows_to_frame(processed_data)
+
+
+# ============================================================================
+# BATCH (COLUMNAR) NORMALIZATION
+# ============================================================================
+
+def _parse_float(value) -> Tuple[float, bool]:
+    """Scalar fallback with `_safe_float` semantics: (value, parsed_ok)."""
+    try:
+        if value is None:
+            return float("nan"), False
+        s = str(value).strip()
+        if s.upper() in NULL_MARKERS:
+            return float("nan"), False
+        return float(s), True
+    except Exception:
+        return float("nan"), False
+
+
+def _coerce_floats(values: List) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized `_safe_float` over a flat list of raw API values.
+
+    Returns the parsed floats (NaN where not parsed) and a mask of which
+    values parsed. API values repeat heavily ("3.00", "NULL", totals 0-100),
+    so each distinct string is converted once (NumPy, which rounds exactly
+    like float()) and the result is broadcast back. None is handled in bulk;
+    other non-strings go through the scalar fallback.
+    """
+    n = len(values)
+    out = np.full(n, np.nan)
+    parsed = np.zeros(n, dtype=bool)
+    if n == 0:
+        return out, parsed
+
+    raw = np.empty(n, dtype=object)
+    raw[:] = values
+    codes, uniques = pd.factorize(raw)
+    uniques = np.asarray(uniques, dtype=object)
 
-    def safe_float(value, default=None):
+    # Convert the distinct strings; non-string uniques (numbers compare equal
+    # across int/float/bool) are resolved per element below
+    unique_values = np.full(len(uniques), np.nan)
+    unique_parsed = np.zeros(len(uniques), dtype=bool)
+    unique_is_str = np.array([type(u) is str for u in uniques], dtype=bool)
+    texts = [u.strip() for u in uniques[unique_is_str]]
+    candidates = [i for i, text in zip(np.flatnonzero(unique_is_str), texts) if text.upper() not in NULL_MARKERS]
+    if candidates:
         try:
-            if value is None:
-                return default
-            s = str(value).strip()
-            if s.upper() in {"NULL", "NE", "N/A", "-", ""}:
-                return default
-            return float(s)
-        except Exception:
-            return default
+            unique_values[candidates] = np.asarray([uniques[i].strip() for i in candidates], dtype=str).astype(np.float64)
+            unique_parsed[candidates] = True
+        except ValueError:  # an odd string NumPy rejects; float() may still accept it
+            for i in candidates:
+                unique_values[i], unique_parsed[i] = _parse_float(uniques[i])
 
-    def latest_numeric_sgpa(sgpa_list: Optional[List]) -> float:
-        """Return the latest numeric SGPA from the list or NaN if none."""
-        if not sgpa_list:
-            return float("nan")
-        # iterate reversed and find first value that can be converted to float
-        for v in reversed(sgpa_list):
-            if v is None:
-                continue
-            s = str(v).strip()
-            if s.upper() in {"NULL", "NE", "N/A", "-", ""}:
-                continue
+    known = codes >= 0
+    known[known] = unique_is_str[codes[known]]
+    out[known] = unique_values[codes[known]]
+    parsed[known] = unique_parsed[codes[known]]
+
+    # Everything else: None is simply "not parsed", the rest goes one by one
+    for i in np.flatnonzero(~known & (raw != None)):  # noqa: E711 - elementwise None check
+        out[i], parsed[i] = _parse_float(values[i])
+    return out, parsed
+
+
+def _numeric_column(values: np.ndarray, parsed: np.ndarray, has_slot: np.ndarray, as_int: bool):
+    """
+    Builds a slot column the way pandas infers it from the row dicts:
+    integers only when every row has a parsed value, a column of None when
+    every row has the slot but nothing parsed, otherwise float64 with NaN.
+    """
+    if has_slot.all():
+        if not parsed.any():
+            return [None] * len(values)
+        if as_int and parsed.all():
+            values = np.trunc(values)
+            if np.abs(values).max(initial=0) >= 2 ** 63:
+                return [int(v) for v in values]  # let pandas pick a dtype for huge ints
+            return values.astype(np.int64)
+    return np.trunc(values) if as_int else values
+
+
+def _subject_fields(subjects: List) -> List[List]:
+    """Per-field lists over a flat list of subject dicts (raises like the row-wise path)."""
+    return [
+        [subject.get("name", "") for subject in subjects],
+        [subject.get("grade", "") for subject in subjects],
+        [subject.get("total") for subject in subjects],
+        [subject.get("credit") for subject in subjects],
+    ]
+
+
+@timed("process.normalize")
+def normalize_results(results: List[Dict]) -> pd.DataFrame:
+    """
+    Batched, column-at-a-time version of the row-by-row normalizer.
+
+    All payloads are first flattened into per-field lists (one entry per
+    student or per subject), then NULL/NE coercion and SGPA/CGPA selection
+    run as NumPy operations over whole columns. The frame is identical to
+    `process_student_results_rowwise`: same columns, order, dtypes and values.
+
+    Args:
+        results: List of student result dictionaries from API
+
+    Returns:
+        DataFrame with flattened student data
+    """
+    # Pass 1: keep the payloads the row-wise path would not reject
+    kept, theory_lists, practical_lists, sgpa_lists = [], [], [], []
+    for student_data in results:
+        theory_subjects = student_data.get("theorySubjects", []) or []
+        practical_subjects = student_data.get("practicalSubjects", []) or []
+        sgpa_list = student_data.get("sgpa") or []
+        if not (
+            isinstance(theory_subjects, list)
+            and isinstance(practical_subjects, list)
+            and isinstance(sgpa_list, list)
+        ):
+            # Unusual shapes (tuples, strings, numbers): keep exactly what the row-wise path accepts
             try:
-                return float(s)
-            except Exception:
+                _student_row(student_data)
+            except Exception as e:
+                print(f"Error processing student {student_data.get('name', 'Unknown')}: {e}")
                 continue
-        return float("nan")
+            theory_subjects, practical_subjects, sgpa_list = list(theory_subjects), list(practical_subjects), list(sgpa_list)
+        kept.append(student_data)
+        theory_lists.append(theory_subjects)
+        practical_lists.append(practical_subjects)
+        sgpa_lists.append(sgpa_list)
+
+    try:
+        subject_fields = [_subject_fields(list(chain.from_iterable(lists))) for lists in (theory_lists, practical_lists)]
+    except Exception:
+        # Rare: a subject entry that is not a dict. Drop those students, as the row-wise path does
+        keep = []
+        for i, student_data in enumerate(kept):
+            try:
+                _subject_fields(list(theory_lists[i]) + list(practical_lists[i]))
+                keep.append(i)
+            except Exception as e:
+                print(f"Error processing student {student_data.get('name', 'Unknown')}: {e}")
+        kept, theory_lists, practical_lists, sgpa_lists = (
+            [items[i] for i in keep] for items in (kept, theory_lists, practical_lists, sgpa_lists)
+        )
+        subject_fields = [_subject_fields(list(chain.from_iterable(lists))) for lists in (theory_lists, practical_lists)]
+
+    n = len(kept)
+    if n == 0:
+        return _rows_to_frame([])
+
+    # Pass 2: columnar extraction
+    theory_counts = np.fromiter(map(len, theory_lists), dtype=np.int64, count=n)
+    practical_counts = np.fromiter(map(len, practical_lists), dtype=np.int64, count=n)
+
+    # Current SGPA: latest entry that parses, scanning each student's list from the end
+    sgpa_counts = np.fromiter(map(len, sgpa_lists), dtype=np.int64, count=n)
+    sgpa_values, sgpa_parsed = _coerce_floats(list(chain.from_iterable(reversed(sgpa) for sgpa in sgpa_lists)))
+    sgpa_rows = np.repeat(np.arange(n), sgpa_counts)[sgpa_parsed]
+    current_sgpa = np.full(n, np.nan)
+    if len(sgpa_rows):
+        owners, first = np.unique(sgpa_rows, return_index=True)
+        current_sgpa[owners] = sgpa_values[sgpa_parsed][first]
+
+    # CGPA falls back to the current SGPA when missing
+    cgpa, _ = _coerce_floats([student_data.get("cgpa") for student_data in kept])
+    cgpa = np.where(np.isnan(cgpa), current_sgpa, cgpa)
+
+    columns = {
+        "Registration No.": [str(d.get("redg_no", "")) for d in kept],
+        "Student Name": [d.get("name", "") for d in kept],
+        "Father's Name": [d.get("father_name", "") for d in kept],
+        "Mother's Name": [d.get("mother_name", "") for d in kept],
+        "College Code": [str(d.get("college_code", "")) for d in kept],
+        "College Name": [d.get("college_name", "") for d in kept],
+        "Course Code": [str(d.get("course_code", "")) for d in kept],
+        "Course": [d.get("course", "") for d in kept],
+        "Semester": [d.get("semester", "") for d in kept],
+        "Exam Held": [d.get("exam_held", "") for d in kept],
+        "Current SGPA": current_sgpa,
+        "CGPA": cgpa,
+        "Status": [d.get("fail_any", "PASS") for d in kept],
+        "Total Subjects": theory_counts + practical_counts,
+        "Theory Subjects": theory_counts,
+        "Practical Subjects": practical_counts,
+    }
+
+    # Flat subject tables, scattered into Theory_{i}_* / Practical_{i}_* slot columns
+    slot_columns = {}
+    for kind_order, (kind, fields, counts) in enumerate(
+        (("Theory", subject_fields[0], theory_counts), ("Practical", subject_fields[1], practical_counts))
+    ):
+        if not counts.any():
+            continue
+        names, grades, raw_totals, raw_credits = fields
+        names = np.asarray(names + [None], dtype=object)[:-1]
+        grades = np.asarray(grades + [None], dtype=object)[:-1]
+        totals, totals_ok = _coerce_floats(raw_totals)
+        totals_ok &= np.isfinite(totals)  # int(float("inf")) fails, so those stay None
+        credits, credits_ok = _coerce_floats(raw_credits)
+
+        rows = np.repeat(np.arange(n), counts)
+        slots = np.arange(len(rows)) - np.repeat(np.cumsum(counts) - counts, counts) + 1
+        running_max = np.maximum.accumulate(counts)
+
+        for slot in range(1, int(running_max[-1]) + 1):
+            picked = np.flatnonzero(slots == slot)
+            owners = rows[picked]
+            present = np.zeros(n, dtype=bool)
+            present[owners] = True
+
+            block = {}
+            for field, source in (("Name", names), ("Grade", grades)):
+                column = np.full(n, np.nan, dtype=object)
+                column[owners] = source[picked]
+                block[f"{kind}_{slot}_{field}"] = column.tolist()  # a list gets the same inference as row dicts
+            for field, values, parsed, as_int in (("Total", totals, totals_ok, True), ("Credit", credits, credits_ok, False)):
+                column = np.full(n, np.nan)
+                column_parsed = np.zeros(n, dtype=bool)
+                column[owners] = np.where(parsed[picked], values[picked], np.nan)
+                column_parsed[owners] = parsed[picked]
+                block[f"{kind}_{slot}_{field}"] = _numeric_column(column, column_parsed, present, as_int)
+
+            # Row dicts put a slot's columns where it first appears: by the first student
+            # that has the slot, theory before practical, then slot number
+            first_row = int(np.searchsorted(running_max, slot))
+            slot_columns[(first_row, kind_order, slot)] = block
+
+    for key in sorted(slot_columns):
+        columns.update(slot_columns[key])
+
+    return _rows_to_frame(columns)
+
+
+# ============================================================================
+# SUBJECT (LONG FORMAT) TABLE
+# ============================================================================
+
+SUBJECT_TYPES = ["Theory", "Practical"]
+
+SUBJECT_TABLE_COLUMNS = [
+    "Registration No.", "Type", "Slot", "Subject Code", "Subject",
+    "ESE", "IA", "Total", "Grade", "Credit",
+]
+
+
+def _small_int_array(values: np.ndarray, parsed: np.ndarray) -> pd.api.extensions.ExtensionArray:
+    """Nullable Int16 marks (Int64 if some value does not fit), NA where not parsed."""
+    values = np.where(parsed, np.trunc(values), 0)
+    dtype = np.int16 if np.abs(values).max(initial=0) <= np.iinfo(np.int16).max else np.int64
+    return pd.arrays.IntegerArray(values.astype(dtype), mask=~parsed)
+
+
+def _apply_subject_dtypes(table: pd.DataFrame) -> pd.DataFrame:
+    """Categoricals for the repeated labels, small numeric types for marks."""
+    table["Type"] = pd.Categorical(table["Type"], categories=SUBJECT_TYPES)
+    for column in ["Subject Code", "Subject", "Grade"]:
+        table[column] = table[column].astype("category")
+    table["Slot"] = table["Slot"].astype(np.int8)
+    table["Credit"] = table["Credit"].astype(np.float32)
+    return table
+
+
+@timed("process.subject_table")
+def build_subject_table(results: List[Dict]) -> pd.DataFrame:
+    """
+    Normalizes API payloads into one row per (student, subject).
+
+    Unlike the positional `Theory_{i}_*` columns, each row carries its own
+    subject code and name, so students with different electives aggregate
+    correctly and per-subject statistics are a single groupby.
+
+    Args:
+        results: List of student result dictionaries from API
+
+    Returns:
+        DataFrame with SUBJECT_TABLE_COLUMNS; Type/Subject Code/Subject/Grade
+        are categorical, marks are nullable Int16 and Credit is float32
+    """
+    regs, kinds, slots = [], [], []
+    fields = [[] for _ in range(7)]  # code, name, ese, ia, total, grade, credit
 
     for student_data in results:
         try:
-            # Calculate GPA from theory and practical subjects
-            theory_subjects = student_data.get("theorySubjects", []) or []
-            practical_subjects = student_data.get("practicalSubjects", []) or []
-            all_subjects = theory_subjects + practical_subjects
-
-            sgpa_list = student_data.get("sgpa") or []
-            current_sgpa = latest_numeric_sgpa(sgpa_list)
-
-            # If CGPA is NULL/None, use the latest SGPA value
-            cgpa_val = safe_float(student_data.get("cgpa"), default=float("nan"))
-            if pd.isna(cgpa_val):
-                cgpa_val = current_sgpa
-
-            row = {
-                "Registration No.": str(student_data.get("redg_no", "")),
-                "Student Name": student_data.get("name", ""),
-                "Father's Name": student_data.get("father_name", ""),
-                "Mother's Name": student_data.get("mother_name", ""),
-                "College Code": str(student_data.get("college_code", "")),
-                "College Name": student_data.get("college_name", ""),
-                "Course Code": str(student_data.get("course_code", "")),
-                "Course": student_data.get("course", ""),
-                "Semester": student_data.get("semester", ""),
-                "Exam Held": student_data.get("exam_held", ""),
-                "Current SGPA": current_sgpa,
-                "CGPA": cgpa_val,
-                "Status": student_data.get("fail_any", "PASS"),
-                "Total Subjects": len(all_subjects),
-                "Theory Subjects": len(theory_subjects),
-                "Practical Subjects": len(practical_subjects),
-            }
-
-            # Add subject details as separate columns (safe parsing)
-            for idx, subject in enumerate(theory_subjects):
-                row[f"Theory_{idx+1}_Name"] = subject.get("name", "")
-                row[f"Theory_{idx+1}_Grade"] = subject.get("grade", "")
-                row[f"Theory_{idx+1}_Total"] = safe_int(subject.get("total"), default=None)
-                row[f"Theory_{idx+1}_Credit"] = safe_float(subject.get("credit"), default=None)
-
-            for idx, subject in enumerate(practical_subjects):
-                row[f"Practical_{idx+1}_Name"] = subject.get("name", "")
-                row[f"Practical_{idx+1}_Grade"] = subject.get("grade", "")
-                row[f"Practical_{idx+1}_Total"] = safe_int(subject.get("total"), default=None)
-                row[f"Practical_{idx+1}_Credit"] = safe_float(subject.get("credit"), default=None)
-
-            processed_data.append(row)
+            reg = str(student_data.get("redg_no", ""))
+            rows = [
+                (kind, idx + 1, subject.get("code", ""), subject.get("name", ""), subject.get("ese"),
+                 subject.get("ia"), subject.get("total"), subject.get("grade", ""), subject.get("credit"))
+                for kind, key in (("Theory", "theorySubjects"), ("Practical", "practicalSubjects"))
+                for idx, subject in enumerate(student_data.get(key, []) or [])
+            ]
+        except Exception as e:
+            print(f"Error processing subjects for {student_data.get('name', 'Unknown')}: {e}")
+            continue
+        regs += [reg] * len(rows)
+        for row in rows:
+            kinds.append(row[0])
+            slots.append(row[1])
+            for column, value in zip(fields, row[2:]):
+                column.append(value)
+
+    codes, names, eses, ias, totals, grades, credits = fields
+    table = {
+        "Registration No.": regs,
+        "Type": kinds,
+        "Slot": np.asarray(slots, dtype=np.int64),
+        "Subject Code": codes,
+        "Subject": names,
+    }
+    for column, raw in (("ESE", eses), ("IA", ias), ("Total", totals)):
+        values, parsed = _coerce_floats(raw)
+        table[column] = _small_int_array(values, parsed & np.isfinite(values))
+    table["Grade"] = grades
+    table["Credit"] = _coerce_floats(credits)[0]
+    return _apply_subject_dtypes(pd.DataFrame(table, columns=SUBJECT_TABLE_COLUMNS))
+
+
+def concat_subject_tables(tables: List[pd.DataFrame]) -> pd.DataFrame:
+    """Stacks subject tables, re-deriving categories across all of them."""
+    if not tables:
+        return build_subject_table([])
+    # Each table has its own categories; concat would fall back to object anyway
+    combined = pd.concat(tables, ignore_index=True).astype({"Subject Code": object, "Subject": object, "Grade": object})
+    return _apply_subject_dtypes(combined)
+
+
+def subject_table_from_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Rebuilds the long subject table from a wide results frame (e.g. one
+    loaded without its payloads). Codes, ESE and IA are not in the wide
+    frame and come back as missing.
+    """
+    n = len(df)
+    missing_marks = np.full(n, np.nan)
+
+    def numeric(column: str) -> np.ndarray:
+        return pd.to_numeric(df[column], errors="coerce").to_numpy(dtype=float, na_value=np.nan) if column in df.columns else missing_marks
+
+    pieces = []
+    for kind in SUBJECT_TYPES:
+        slot = 1
+        while f"{kind}_{slot}_Name" in df.columns:
+            prefix = f"{kind}_{slot}_"
+            total = numeric(prefix + "Total")
+            piece = pd.DataFrame({
+                "Registration No.": df["Registration No."].to_numpy(),
+                "Type": kind,
+                "Slot": slot,
+                "Subject Code": np.nan,
+                "Subject": df[prefix + "Name"].to_numpy(),
+                "ESE": _small_int_array(missing_marks, np.zeros(n, dtype=bool)),
+                "IA": _small_int_array(missing_marks, np.zeros(n, dtype=bool)),
+                "Total": _small_int_array(total, ~np.isnan(total)),
+                "Grade": df[prefix + "Grade"].to_numpy() if prefix + "Grade" in df.columns else np.nan,
+                "Credit": numeric(prefix + "Credit"),
+            })
+            # Students without this slot have neither a name nor a grade
+            pieces.append(piece[piece["Subject"].notna() | piece["Grade"].notna()])
+            slot += 1
+    if not pieces:
+        return _apply_subject_dtypes(pd.DataFrame({column: [] for column in SUBJECT_TABLE_COLUMNS}))
+    return _apply_subject_dtypes(pd.concat(pieces, ignore_index=True))
+
+
+# ============================================================================
+# COMPACT SCHEMA
+# ============================================================================
+
+# Labels repeated on every row of a class or college
+RESULT_CATEGORY_COLUMNS = [
+    "College Code", "College Name", "Course Code", "Course", "Semester", "Exam Held", "Status",
+]
+RESULT_COUNT_COLUMNS = ["Total Subjects", "Theory Subjects", "Practical Subjects"]
+
+_SLOT_COLUMN = re.compile(r"^(?:Theory|Practical)_\d+_(Name|Grade|Total|Credit)$")
+
+
+@timed("process.compact")
+def compact_results(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Applies the compact schema to a results frame.
+
+    Repeated labels (college, course, semester, exam session, status and
+    the per-slot subject names and grades) become categoricals, subject
+    counts become int8, marks nullable Int16 and credits float32.
+    Current SGPA and CGPA stay float64 so values like 8.2 keep printing
+    and exporting exactly. Safe to call on an already compact frame.
+
+    Args:
+        df: Frame from `process_student_results`
+
+    Returns:
+        New DataFrame with the same columns and values
+    """
+    compact = df.copy()
+    for column in df.columns:
+        slot_field = _SLOT_COLUMN.match(column)
+        field = slot_field.group(1) if slot_field else None
+        if column in RESULT_CATEGORY_COLUMNS or field in ("Name", "Grade"):
+            compact[column] = df[column].astype("category")
+        elif column in RESULT_COUNT_COLUMNS:
+            compact[column] = pd.to_numeric(df[column], downcast="integer")
+        elif field == "Total":
+            values = pd.to_numeric(df[column], errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+            compact[column] = _small_int_array(values, np.isfinite(values))
+        elif field == "Credit":
+            compact[column] = pd.to_numeric(df[column], errors="coerce").astype(np.float32)
+    return compact
+
+
+def memory_report(df: pd.DataFrame, baseline: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+    """
+    Per-column memory usage (deep, i.e. including string payloads).
+
+    Args:
+        df: Frame to measure
+        baseline: Optional frame with the same columns (e.g. before
+            `compact_results`) to compare against
+
+    Returns:
+        DataFrame indexed by column with Dtype and Bytes, plus Baseline
+        Dtype, Baseline Bytes and Saved % when a baseline is given
+    """
+    report = pd.DataFrame({
+        "Dtype": df.dtypes.astype(str),
+        "Bytes": df.memory_usage(index=False, deep=True),
+    })
+    if baseline is not None:
+        report["Baseline Dtype"] = baseline.dtypes.astype(str)
+        report["Baseline Bytes"] = baseline.memory_usage(index=False, deep=True)
+        report["Saved %"] = (1 - report["Bytes"] / report["Baseline Bytes"]) * 100
+    report.index.name = "Column"
+    return report
+
+
+# ============================================================================
+# INCREMENTAL MERGE
+# ============================================================================
+
+def registration_numbers(df: Optional[pd.DataFrame]) -> set:
+    """Registration numbers present in a results frame (empty set for None)."""
+    if df is None or "Registration No." not in df.columns:
+        return set()
+    return set(df["Registration No."].dropna().astype(str))
+
+
+def merge_results(existing: Optional[pd.DataFrame], new: pd.DataFrame) -> pd.DataFrame:
+    """
+    Appends newly processed students to an existing results frame.
+
+    Only `new` has to be processed; the existing rows are kept as they are.
+    A student present in both keeps the row from `new` (the later fetch),
+    and columns only one side has (e.g. a sixth theory slot) are filled
+    with missing values for the other.
+
+    Args:
+        existing: Frame already held (may be None or empty)
+        new: Frame built from the newly fetched payloads
+
+    Returns:
+        Compact frame with one row per Registration No.
+    """
+    frames = [frame for frame in (existing, new) if frame is not None and len(frame)]
+    if not frames:
+        return new
+    if len(frames) == 1:
+        return compact_results(frames[0].drop_duplicates(subset="Registration No.", keep="last").reset_index(drop=True))
+
+    # Only the new rows are compacted; the existing ones already are
+    new = compact_results(new.drop_duplicates(subset="Registration No.", keep="last"))
+    kept = existing[~existing["Registration No."].isin(registration_numbers(new))]
+    return pd.concat(_align_dtypes(kept, new), ignore_index=True)
+
+
+def _align_dtypes(first: pd.DataFrame, second: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Gives two compact frames the same columns and categories so they concat
+    without falling back to object: columns one side lacks are added empty
+    with the other side's dtype, and categoricals get the union of both
+    sides' categories.
+    """
+    first, second = first.copy(), second.copy()
+    for this, other in ((first, second), (second, first)):
+        for column in other.columns.difference(this.columns, sort=False):
+            this[column] = pd.Series(index=this.index, dtype=other[column].dtype)
+    for column in first.columns:
+        a, b = first[column], second[column]
+        if isinstance(a.dtype, pd.CategoricalDtype) and isinstance(b.dtype, pd.CategoricalDtype) and a.dtype != b.dtype:
+            categories = a.cat.categories.union(b.cat.categories)
+            first[column] = a.cat.set_categories(categories)
+            second[column] = b.cat.set_categories(categories)
+    return first, second[first.columns]
+
+
+def merge_subject_tables(existing: Optional[pd.DataFrame], new: pd.DataFrame) -> pd.DataFrame:
+    """`merge_results` for long subject tables: students in `new` replace their old rows."""
+    if existing is None or not len(existing):
+        return new
+    replaced = existing["Registration No."].isin(registration_numbers(new))
+    return concat_subject_tables([existing[~replaced], new])
 
+
+class IncrementalResultProcessor:
+    """
+    Builds the results DataFrame while payloads are still arriving.
+
+    Payloads are flattened as they come in and turned into a frame chunk every
+    `chunk_size` rows, so raw payloads are never all held at once. `frame`
+    (and `subjects`, the long subject table) return everything processed so
+    far and can be read at any time, e.g. to show a partial table during a
+    long fetch.
+    """
+
+    def __init__(self, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.chunk_size = chunk_size
+        self.count = 0
+        self._rows: List[Dict] = []
+        self._payloads: List[Dict] = []
+        self._chunks: List[pd.DataFrame] = []
+        self._subject_chunks: List[pd.DataFrame] = []
+        self._frame: Optional[pd.DataFrame] = None
+        self._subjects: Optional[pd.DataFrame] = None
+
+    def add(self, student_data: Dict) -> bool:
+        """Processes one payload; returns True when a new chunk was appended."""
+        try:
+            self._rows.append(_student_row(student_data))
         except Exception as e:
             print(f"Error processing student {student_data.get('name', 'Unknown')}: {e}")
-            continue
+            return False
+        self._payloads.append(student_data)
+        self.count += 1
+        if len(self._rows) >= self.chunk_size:
+            self.flush()
+            return True
+        return False
 
-    df = pd.DataFrame(processed_data)
-    # Ensure numeric columns are proper dtype
-    if "Current SGPA" in df.columns:
-        df["Current SGPA"] = pd.to_numeric(df["Current SGPA"], errors="coerce")
-    if "CGPA" in df.columns:
-        df["CGPA"] = pd.to_numeric(df["CGPA"], errors="coerce")
+    def flush(self):
+        """Turns buffered rows into a frame chunk."""
+        if self._rows:
+            self._chunks.append(_rows_to_frame(self._rows))
+            self._subject_chunks.append(build_subject_table(self._payloads))
+            self._rows = []
+            self._payloads = []
+            self._frame = None
+            self._subjects = None
 
-    return df
+    @property
+    def frame(self) -> pd.DataFrame:
+        """All rows processed so far as one DataFrame."""
+        self.flush()
+        if self._frame is None:
+            if not self._chunks:
+                self._frame = pd.DataFrame()
+            else:
+                # A chunk whose marks are all NULL holds them as object; re-infer so
+                # the dtypes match a frame built from all payloads at once
+                self._frame = pd.concat(self._chunks, ignore_index=True).infer_objects()
+                # Keep one chunk holding the concatenated frame so later reads stay cheap
+                self._chunks = [self._frame]
+        return self._frame
+
+    @property
+    def subjects(self) -> pd.DataFrame:
+        """Long subject table (see `build_subject_table`) for all rows so far."""
+        self.flush()
+        if self._subjects is None:
+            self._subjects = concat_subject_tables(self._subject_chunks)
+            self._subject_chunks = [self._subjects]
+        return self._subjects
+
+
+# ============================================================================
+# LONGITUDINAL (MULTI-SEMESTER) HISTORY
+# ============================================================================
+
+# Per-student fields shared by every semester's payload
+STUDENT_INFO_FIELDS = {
+    "Registration No.": "redg_no",
+    "Student Name": "name",
+    "Father's Name": "father_name",
+    "Mother's Name": "mother_name",
+    "College Code": "college_code",
+    "College Name": "college_name",
+    "Course Code": "course_code",
+    "Course": "course",
+}
+
+# Codes in StudentHistory.status
+STATUS_UNKNOWN = -1
+STATUS_FAIL = 0
+STATUS_PASS = 1
+
+
+class StudentHistory:
+    """
+    SGPA/CGPA/status histories of a cohort as student x semester matrices.
+
+    Row i of every matrix belongs to row i of `students` (one row per
+    registration number); column j is semester `semesters[j]`. Missing
+    values are NaN in `sgpa`/`cgpa` and STATUS_UNKNOWN in `status`.
+    """
+
+    def __init__(self, students: pd.DataFrame, semesters: np.ndarray,
+                 sgpa: np.ndarray, cgpa: np.ndarray, status: np.ndarray):
+        self.students = students
+        self.semesters = semesters
+        self.sgpa = sgpa
+        self.cgpa = cgpa
+        self.status = status
+
+    def __len__(self) -> int:
+        return len(self.students)
+
+    def sgpa_frame(self) -> pd.DataFrame:
+        """Registration No., Student Name and one SGPA column per semester."""
+        frame = self.students[["Registration No.", "Student Name"]].copy()
+        for j, semester in enumerate(self.semesters):
+            frame[f"Semester {semester} SGPA"] = self.sgpa[:, j]
+        return frame
+
+    def trends(self) -> pd.DataFrame:
+        """
+        Per-student progression, computed over all students at once.
+
+        Returns:
+            DataFrame with Registration No., Student Name, College Name,
+            Semesters (with an SGPA), First/Latest SGPA, SGPA Change,
+            SGPA Trend (least-squares slope per semester), Best Semester,
+            Failed Semesters and Latest CGPA
+        """
+        columns = [column for column in ("Registration No.", "Student Name", "College Name") if column in self.students]
+        frame = self.students[columns].copy()
+        # Pad an empty history with one all-missing semester so the reductions below stay defined
+        y = self.sgpa if self.sgpa.shape[1] else np.full((len(self), 1), np.nan)
+        cgpa = self.cgpa if self.cgpa.shape[1] else y
+        x = self.semesters.astype(np.float64) if len(self.semesters) else np.zeros(1)
+        rows = np.arange(len(y))
+        has = ~np.isnan(y)
+        counts = has.sum(axis=1)
+        seen = counts > 0
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            x_mean = (has * x).sum(axis=1) / counts
+            y_mean = np.where(has, y, 0.0).sum(axis=1) / counts
+            dx = np.where(has, x - x_mean[:, None], 0.0)
+            dy = np.where(has, y - y_mean[:, None], 0.0)
+            slope = (dx * dy).sum(axis=1) / (dx * dx).sum(axis=1)
+
+        first_sgpa = y[rows, has.argmax(axis=1)]
+        latest_sgpa = y[rows, y.shape[1] - 1 - has[:, ::-1].argmax(axis=1)]
+        best = np.where(has, y, -np.inf).argmax(axis=1)
+        has_cgpa = ~np.isnan(cgpa)
+
+        frame["Semesters"] = counts
+        frame["First SGPA"] = first_sgpa
+        frame["Latest SGPA"] = latest_sgpa
+        frame["SGPA Change"] = latest_sgpa - first_sgpa
+        frame["SGPA Trend"] = np.where(counts >= 2, slope, np.nan)
+        frame["Best Semester"] = pd.Series(x[best], index=frame.index).where(seen).astype("Int8")
+        frame["Failed Semesters"] = (self.status == STATUS_FAIL).sum(axis=1)
+        frame["Latest CGPA"] = cgpa[rows, cgpa.shape[1] - 1 - has_cgpa[:, ::-1].argmax(axis=1)]
+        return frame
+
+    def semester_summary(self) -> pd.DataFrame:
+        """
+        Cohort figures per semester.
+
+        Returns:
+            DataFrame with Semester, Students (with an SGPA), Avg/Max/Min
+            SGPA, Pass Rate % (of students with a known status), Improved %
+            (students whose SGPA rose since the previous semester, among
+            those with both) and Avg CGPA
+        """
+        y = self.sgpa
+        has = ~np.isnan(y)
+        counts = has.sum(axis=0)
+        known = self.status != STATUS_UNKNOWN
+        cgpa = self.cgpa
+        has_cgpa = ~np.isnan(cgpa)
+
+        improved = np.full(len(self.semesters), np.nan)
+        if y.shape[1] > 1:
+            both = has[:, 1:] & has[:, :-1]
+            rose = both & (np.where(both, y[:, 1:] - y[:, :-1], 0.0) > 0)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                improved[1:] = rose.sum(axis=0) / both.sum(axis=0) * 100
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return pd.DataFrame({
+                "Semester": self.semesters,
+                "Students": counts,
+                "Avg SGPA": np.where(has, y, 0.0).sum(axis=0) / counts,
+                "Max SGPA": np.where(counts > 0, np.where(has, y, -np.inf).max(axis=0, initial=-np.inf), np.nan),
+                "Min SGPA": np.where(counts > 0, np.where(has, y, np.inf).min(axis=0, initial=np.inf), np.nan),
+                "Pass Rate %": (self.status == STATUS_PASS).sum(axis=0) / known.sum(axis=0) * 100,
+                "Improved %": improved,
+                "Avg CGPA": np.where(has_cgpa, cgpa, 0.0).sum(axis=0) / has_cgpa.sum(axis=0),
+            })
+
+
+def build_student_history(results_by_semester: Dict[int, List[Dict]]) -> StudentHistory:
+    """
+    Combines per-semester results of one cohort into a StudentHistory.
+
+    Each student appears once; their details come from the latest semester
+    they were found in. SGPAs are read from each payload's 8-slot `sgpa`
+    array, so semesters that were not fetched are still filled in from
+    later payloads (later payloads win where both have a value). CGPA and
+    pass/fail status are known only for the fetched semesters.
+
+    Args:
+        results_by_semester: Semester number -> API payloads for it
+
+    Returns:
+        StudentHistory over semesters 1..(latest fetched semester)
+    """
+    fetched = sorted(semester for semester, payloads in results_by_semester.items() if payloads)
+    width = max(fetched, default=0)
+
+    index: Dict[str, int] = {}
+    latest: List[Dict] = []
+    for semester in reversed(fetched):
+        for payload in results_by_semester[semester]:
+            registration_no = str(payload.get("redg_no", ""))
+            if registration_no not in index:
+                index[registration_no] = len(latest)
+                latest.append(payload)
+
+    n = len(latest)
+    # float64 like the Current SGPA/CGPA columns, so values keep printing exactly
+    sgpa = np.full((n, width), np.nan)
+    cgpa = np.full((n, width), np.nan)
+    status = np.full((n, width), STATUS_UNKNOWN, dtype=np.int8)
+
+    for semester in fetched:
+        payloads = results_by_semester[semester]
+        rows = np.fromiter(
+            (index[str(payload.get("redg_no", ""))] for payload in payloads), dtype=np.intp, count=len(payloads)
+        )
+        slots = chain.from_iterable(
+            ((payload.get("sgpa") or []) + [None] * width)[:width] for payload in payloads
+        )
+        values, _ = _coerce_floats(list(slots))
+        values = values.reshape(len(payloads), width)
+        sgpa[rows] = np.where(np.isnan(values), sgpa[rows], values)
+
+        cgpa[rows, semester - 1], _ = _coerce_floats([payload.get("cgpa") for payload in payloads])
+        failed = np.array([str(payload.get("fail_any", "PASS")).upper() == "FAIL" for payload in payloads], dtype=bool)
+        status[rows, semester - 1] = np.where(failed, STATUS_FAIL, STATUS_PASS)
+
+    students = pd.DataFrame({
+        column: [payload.get(field, "") for payload in latest] for column, field in STUDENT_INFO_FIELDS.items()
+    })
+    for column in ("Registration No.", "College Code", "Course Code"):
+        students[column] = students[column].astype(str)
+    return StudentHistory(compact_results(students), np.arange(1, width + 1), sgpa, cgpa, status)
 
 
 def get_sorting_options() -> Dict[str, str]:
@@ -189,24 +976,25 @@ def filter_dataframe(
     Returns:
         Filtered DataFrame
     """
-    result = df.copy()
+    # One combined mask and a single row selection instead of a copy per step
+    mask = np.ones(len(df), dtype=bool)
     
     if college:
-        result = result[result["College Name"] == college]
+        mask &= (df["College Name"] == college).to_numpy(dtype=bool, na_value=False)
     
     if course:
-        result = result[result["Course"] == course]
+        mask &= (df["Course"] == course).to_numpy(dtype=bool, na_value=False)
     
     if status:
-        result = result[result["Status"] == status]
+        mask &= (df["Status"] == status).to_numpy(dtype=bool, na_value=False)
     
     if sgpa_min is not None:
-        result = result[result["Current SGPA"] >= sgpa_min]
+        mask &= (df["Current SGPA"] >= sgpa_min).to_numpy(dtype=bool, na_value=False)
     
     if sgpa_max is not None:
-        result = result[result["Current SGPA"] <= sgpa_max]
+        mask &= (df["Current SGPA"] <= sgpa_max).to_numpy(dtype=bool, na_value=False)
     
-    return result
+    return df[mask]
 
 
 def get_grade_category(sgpa: float) -> str:
@@ -232,59 +1020,28 @@ def add_grade_category(df: pd.DataFrame) -> pd.DataFrame:
     return df_copy
 
 
-def get_subject_performance(df: pd.DataFrame) -> pd.DataFrame:
+def get_subject_performance(df: pd.DataFrame, subjects: Optional[pd.DataFrame] = None) -> pd.DataFrame:
     """
     Extracts and aggregates subject performance across all students.
     
     Args:
         df: Student results DataFrame
+        subjects: Long subject table from `build_subject_table`; rebuilt
+            from the wide columns of `df` when not given
     
     Returns:
         DataFrame with subject-wise performance metrics
     """
-    subject_stats = []
-    
-    # Extract theory subjects
-    theory_cols = [col for col in df.columns if col.startswith("Theory_") and col.endswith("_Grade")]
-    for col in theory_cols:
-        subject_name_col = col.replace("_Grade", "_Name")
-        if subject_name_col in df.columns:
-            subject_name = df[subject_name_col].iloc[0] if len(df) > 0 else "Unknown"
-            grades = df[col].dropna()
-            
-            subject_stats.append({
-                "Subject": subject_name,
-                "Type": "Theory",
-                "Students": len(grades),
-                "A+ Count": (grades == "A+").sum(),
-                "A Count": (grades == "A").sum(),
-                "B Count": (grades == "B").sum(),
-                "C Count": (grades == "C").sum(),
-                "D Count": (grades == "D").sum(),
-                "F Count": (grades == "F").sum(),
-            })
-    
-    # Extract practical subjects
-    practical_cols = [col for col in df.columns if col.startswith("Practical_") and col.endswith("_Grade")]
-    for col in practical_cols:
-        subject_name_col = col.replace("_Grade", "_Name")
-        if subject_name_col in df.columns:
-            subject_name = df[subject_name_col].iloc[0] if len(df) > 0 else "Unknown"
-            grades = df[col].dropna()
-            
-            subject_stats.append({
-                "Subject": subject_name,
-                "Type": "Practical",
-                "Students": len(grades),
-                "A+ Count": (grades == "A+").sum(),
-                "A Count": (grades == "A").sum(),
-                "B Count": (grades == "B").sum(),
-                "C Count": (grades == "C").sum(),
-                "D Count": (grades == "D").sum(),
-                "F Count": (grades == "F").sum(),
-            })
+    table = subjects if subjects is not None else subject_table_from_frame(df)
+    graded = table[table["Grade"].notna()]
+    counts = graded.groupby(["Type", "Subject", "Grade"], observed=True).size().unstack("Grade", fill_value=0)
     
-    return pd.DataFrame(subject_stats)
+    grade_labels = ["A+", "A", "B", "C", "D", "F"]
+    performance = pd.DataFrame({
+        "Students": counts.sum(axis=1),
+        **{f"{grade} Count": counts[grade] if grade in counts.columns else 0 for grade in grade_labels},
+    }).reset_index()
+    return performance[["Subject", "Type", "Students"] + [f"{grade} Count" for grade in grade_labels]]
 
 
 def get_statistics_summary(df: pd.DataFrame) -> Dict:
@@ -5,15 +5,115 @@ Author: Aditya Kumar
 
 import pandas as pd
 import streamlit as st
+from typing import Any, Callable, Dict, Optional
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-from data_processor import add_grade_category, get_statistics_summary
+from aggregate_cube import build_cube, rollup
+from data_processor import StudentHistory, get_grade_category, get_statistics_summary, subject_table_from_frame
+from frame_cache import LRUCache, frame_fingerprint
+from instrumentation import span, timed
 
+# Every aggregate and figure below reads only these columns of the results frame
+ANALYTICS_COLUMNS = [
+    "Registration No.", "Student Name", "College Name", "Course", "Status", "Current SGPA", "CGPA",
+]
+
+# Aggregates and figures of recently shown frames; a dashboard uses about a dozen entries
+ANALYTICS_CACHE_ENTRIES = 64
+_analytics_cache = LRUCache(max_entries=ANALYTICS_CACHE_ENTRIES)
+
+
+def _cached(df: pd.DataFrame, name: str, compute: Callable[[], Any], *params) -> Any:
+    """Memoizes `compute` by the content of the analytics columns of `df`."""
+    key = (frame_fingerprint(df, ANALYTICS_COLUMNS), name, *params)
+    
+    def timed_compute():
+        # Only misses are timed: this is the aggregation or figure-building cost
+        with span(f"analytics.{name}"):
+            return compute()
+    
+    return _analytics_cache.get_or_compute(key, timed_compute)
+
+
+def analytics_cache_stats() -> Dict[str, int]:
+    """Entry count and hit/miss counters of the analytics cache."""
+    return _analytics_cache.stats()
+
+
+# ============================================================================
+# AGGREGATES (pure pandas, cached)
+# ============================================================================
+
+def compute_category_counts(df: pd.DataFrame) -> pd.Series:
+    """Students per performance category (see `get_grade_category`)."""
+    return df["Current SGPA"].apply(get_grade_category).value_counts()
+
+
+def compute_top_performers(df: pd.DataFrame, top_n: int = 10) -> pd.DataFrame:
+    """Top `top_n` students by SGPA, ranked from 1."""
+    top_students = df.nlargest(top_n, "Current SGPA")[
+        ["Registration No.", "Student Name", "Current SGPA", "CGPA", "College Name"]
+    ].reset_index(drop=True)
+    top_students.index = top_students.index + 1
+    return top_students
+
+
+def get_cube(df: pd.DataFrame) -> pd.DataFrame:
+    """Cached aggregate cube (see `aggregate_cube.build_cube`) of `df`."""
+    return _cached(df, "cube", lambda: build_cube(df))
+
+
+def compute_group_stats(cube: pd.DataFrame, by: str, sgpa_stats=("mean", "max")) -> pd.DataFrame:
+    """Students, SGPA statistics and passes per `by` value, best average first."""
+    names = {"mean": "Avg SGPA", "max": "Max SGPA", "min": "Min SGPA"}
+    stats = rollup(cube, [by]).rename(columns={"Students": "Total Students"})
+    stats = stats[[by, "Total Students"] + [names[stat] for stat in sgpa_stats] + ["Passed"]]
+    return stats.sort_values("Avg SGPA", ascending=False)
+
+
+def compute_pass_fail(cube: pd.DataFrame) -> Dict[str, Any]:
+    """Pass/fail counts, pass rate and the pass rate per college."""
+    totals = rollup(cube)
+    passed, failed, students = (int(totals[column].iloc[0]) for column in ("Passed", "Failed", "Students"))
+    summary = {
+        "passed": passed,
+        "failed": failed,
+        "pass_rate": (passed / students * 100) if students > 0 else 0,
+        "college_pass_rate": None,
+    }
+    if "College Name" in cube.columns:
+        college_pass_rate = rollup(cube, ["College Name"])[["College Name", "Pass Rate %"]]
+        summary["college_pass_rate"] = college_pass_rate.sort_values("Pass Rate %", ascending=False)
+    return summary
+
+
+def compute_subject_grade_counts(df: pd.DataFrame, subjects: Optional[pd.DataFrame] = None) -> pd.Series:
+    """Count per (Type, Subject, Grade), from the long subject table when given."""
+    table = subjects if subjects is not None else subject_table_from_frame(df)
+    return table.groupby(["Type", "Subject", "Grade"], observed=True).size()
+
+
+def _subject_key(df: pd.DataFrame, subjects: Optional[pd.DataFrame]) -> tuple:
+    if subjects is not None:
+        return ("subjects", frame_fingerprint(subjects, ["Type", "Subject", "Grade"]))
+    return ("wide", frame_fingerprint(df))  # rebuilt from the Theory_*/Practical_* columns
+
+
+def get_subject_grade_counts(df: pd.DataFrame, subjects: Optional[pd.DataFrame] = None) -> pd.Series:
+    """Cached `compute_subject_grade_counts`."""
+    return _analytics_cache.get_or_compute(
+        (*_subject_key(df, subjects), "grade_counts"), lambda: compute_subject_grade_counts(df, subjects)
+    )
+
+
+# ============================================================================
+# RENDERING
+# ============================================================================
 
 def show_key_metrics(df: pd.DataFrame):
     """Displays key statistics in metric cards."""
-    stats = get_statistics_summary(df)
+    stats = _cached(df, "stats", lambda: get_statistics_summary(df))
     
     st.subheader("📌 Key Metrics")
     col1, col2, col3, col4 = st.columns(4)
@@ -32,55 +132,54 @@ def show_sgpa_distribution(df: pd.DataFrame):
     """Displays SGPA distribution histogram."""
     st.subheader("📈 SGPA Distribution")
     
-    fig = px.histogram(
-        df,
-        x="Current SGPA",
-        nbins=15,
-        title="Student Distribution by SGPA",
-        labels={"Current SGPA": "SGPA", "count": "Number of Students"},
-        color_discrete_sequence=["#1f77b4"]
-    )
-    fig.update_layout(
-        bargap=0.1,
-        hovermode="x unified",
-        height=400,
-        showlegend=False
-    )
-    st.plotly_chart(fig, use_container_width=True)
+    def build():
+        fig = px.histogram(
+            df,
+            x="Current SGPA",
+            nbins=15,
+            title="Student Distribution by SGPA",
+            labels={"Current SGPA": "SGPA", "count": "Number of Students"},
+            color_discrete_sequence=["#1f77b4"]
+        )
+        fig.update_layout(
+            bargap=0.1,
+            hovermode="x unified",
+            height=400,
+            showlegend=False
+        )
+        return fig
+    
+    st.plotly_chart(_cached(df, "sgpa_histogram", build), use_container_width=True)
 
 
 def show_grade_distribution(df: pd.DataFrame):
     """Displays performance category pie chart."""
     st.subheader("🎯 Performance Category Distribution")
     
-    df_with_category = add_grade_category(df)
-    category_counts = df_with_category["Grade Category"].value_counts()
+    def build():
+        category_counts = compute_category_counts(df)
+        fig = px.pie(
+            names=category_counts.index,
+            values=category_counts.values,
+            title="Students by Performance Category",
+            color_discrete_sequence=px.colors.qualitative.Set3
+        )
+        fig.update_traces(textposition='inside', textinfo='percent+label')
+        fig.update_layout(height=400)
+        return fig
     
-    fig = px.pie(
-        names=category_counts.index,
-        values=category_counts.values,
-        title="Students by Performance Category",
-        color_discrete_sequence=px.colors.qualitative.Set3
-    )
-    fig.update_traces(textposition='inside', textinfo='percent+label')
-    fig.update_layout(height=400)
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(_cached(df, "category_pie", build), use_container_width=True)
 
 
 def show_top_performers(df: pd.DataFrame, top_n: int = 10):
     """Displays top performers."""
     st.subheader(f"🏅 Top {top_n} Performers")
     
-    top_students = df.nlargest(top_n, "Current SGPA")[
-        ["Registration No.", "Student Name", "Current SGPA", "CGPA", "College Name"]
-    ].reset_index(drop=True)
-    top_students.index = top_students.index + 1
-    
-    col1, col2 = st.columns([2, 1])
+    top_students = _cached(df, "top_performers", lambda: compute_top_performers(df, top_n), top_n)
     
-    with col1:
+    def build():
         fig = px.bar(
-            df.nlargest(top_n, "Current SGPA"),
+            top_students,
             x="Student Name",
             y="Current SGPA",
             title=f"Top {top_n} Students by SGPA",
@@ -89,7 +188,12 @@ def show_top_performers(df: pd.DataFrame, top_n: int = 10):
             labels={"Current SGPA": "SGPA", "Student Name": "Student"}
         )
         fig.update_layout(height=400, showlegend=False)
-        st.plotly_chart(fig, use_container_width=True)
+        return fig
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        st.plotly_chart(_cached(df, "top_performers_bar", build, top_n), use_container_width=True)
     
     with col2:
         st.dataframe(top_students, use_container_width=True)
@@ -99,18 +203,9 @@ def show_college_wise_analysis(df: pd.DataFrame):
     """Displays college-wise performance analysis."""
     st.subheader("🏫 College-wise Analysis")
     
-    college_stats = df.groupby("College Name").agg({
-        "Registration No.": "count",
-        "Current SGPA": ["mean", "max"],
-        "Status": lambda x: (x == "PASS").sum()
-    }).reset_index()
-    
-    college_stats.columns = ["College Name", "Total Students", "Avg SGPA", "Max SGPA", "Passed"]
-    college_stats = college_stats.sort_values("Avg SGPA", ascending=False)
+    college_stats = _cached(df, "college_stats", lambda: compute_group_stats(get_cube(df), "College Name"))
     
-    col1, col2 = st.columns([1, 1])
-    
-    with col1:
+    def build_avg():
         fig1 = px.bar(
             college_stats,
             x="College Name",
@@ -121,9 +216,9 @@ def show_college_wise_analysis(df: pd.DataFrame):
             labels={"Avg SGPA": "Average SGPA"}
         )
         fig1.update_layout(height=400, xaxis_tickangle=-45)
-        st.plotly_chart(fig1, use_container_width=True)
+        return fig1
     
-    with col2:
+    def build_count():
         fig2 = px.bar(
             college_stats,
             x="College Name",
@@ -134,9 +229,17 @@ def show_college_wise_analysis(df: pd.DataFrame):
             labels={"Total Students": "Number of Students"}
         )
         fig2.update_layout(height=400, xaxis_tickangle=-45)
-        st.plotly_chart(fig2, use_container_width=True)
+        return fig2
+    
+    col1, col2 = st.columns([1, 1])
+    
+    with col1:
+        st.plotly_chart(_cached(df, "college_avg_bar", build_avg), use_container_width=True)
+    
+    with col2:
+        st.plotly_chart(_cached(df, "college_count_bar", build_count), use_container_width=True)
     
-    st.dataframe(college_stats.sort_values("Avg SGPA", ascending=False), use_container_width=True)
+    st.dataframe(college_stats, use_container_width=True)
 
 
 def show_course_wise_analysis(df: pd.DataFrame):
@@ -144,100 +247,70 @@ def show_course_wise_analysis(df: pd.DataFrame):
     st.subheader("📚 Course-wise Analysis")
     
     if "Course" in df.columns:
-        course_stats = df.groupby("Course").agg({
-            "Registration No.": "count",
-            "Current SGPA": ["mean", "max", "min"],
-            "Status": lambda x: (x == "PASS").sum()
-        }).reset_index()
+        course_stats = _cached(df, "course_stats", lambda: compute_group_stats(get_cube(df), "Course", ("mean", "max", "min")))
         
-        course_stats.columns = ["Course", "Total Students", "Avg SGPA", "Max SGPA", "Min SGPA", "Passed"]
-        course_stats = course_stats.sort_values("Avg SGPA", ascending=False)
+        def build():
+            fig = px.bar(
+                course_stats,
+                x="Course",
+                y=["Avg SGPA", "Max SGPA", "Min SGPA"],
+                title="SGPA Statistics by Course",
+                barmode="group",
+                labels={"value": "SGPA"}
+            )
+            fig.update_layout(height=400, xaxis_tickangle=-45)
+            return fig
         
-        fig = px.bar(
-            course_stats,
-            x="Course",
-            y=["Avg SGPA", "Max SGPA", "Min SGPA"],
-            title="SGPA Statistics by Course",
-            barmode="group",
-            labels={"value": "SGPA"}
-        )
-        fig.update_layout(height=400, xaxis_tickangle=-45)
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(_cached(df, "course_bar", build), use_container_width=True)
         
         st.dataframe(course_stats, use_container_width=True)
 
 
-def show_subject_analysis(df: pd.DataFrame):
-    """Displays subject-wise grade distribution."""
+def show_subject_analysis(df: pd.DataFrame, subjects: Optional[pd.DataFrame] = None):
+    """Displays subject-wise grade distribution.
+
+    Uses the long subject table when available (so electives are counted
+    under their own names); otherwise it is rebuilt from the wide columns.
+    """
     st.subheader("📖 Subject-wise Grade Distribution")
     
-    # Extract theory subjects
-    theory_subjects = {}
-    theory_cols = [col for col in df.columns if col.startswith("Theory_") and col.endswith("_Grade")]
-    
-    for col in theory_cols:
-        subject_name_col = col.replace("_Grade", "_Name")
-        if subject_name_col in df.columns and len(df) > 0:
-            subject_name = df[subject_name_col].iloc[0]
-            grades = df[col].value_counts()
-            theory_subjects[subject_name] = grades
+    # One pass for every (type, subject, grade) count
+    grade_counts = get_subject_grade_counts(df, subjects)
     
-    # Display theory subject analysis
-    if theory_subjects:
-        st.markdown("#### Theory Subjects")
+    for subject_type, heading, palette in [
+        ("Theory", "#### Theory Subjects", px.colors.qualitative.Set2),
+        ("Practical", "#### Practical Subjects", px.colors.qualitative.Set3),
+    ]:
+        if subject_type not in grade_counts.index.get_level_values("Type"):
+            continue
+        type_counts = grade_counts.xs(subject_type, level="Type")
         
-        col1, col2 = st.columns([1, 1])
-        
-        with col1:
-            selected_subject = st.selectbox(
-                "Select Theory Subject",
-                options=list(theory_subjects.keys()),
-                key="theory_subject"
-            )
-            
-            if selected_subject in theory_subjects:
-                fig = px.pie(
-                    names=theory_subjects[selected_subject].index,
-                    values=theory_subjects[selected_subject].values,
-                    title=f"Grade Distribution: {selected_subject}",
-                    color_discrete_sequence=px.colors.qualitative.Set2
-                )
-                fig.update_traces(textposition='inside', textinfo='percent+label')
-                st.plotly_chart(fig, use_container_width=True)
-    
-    # Extract practical subjects
-    practical_subjects = {}
-    practical_cols = [col for col in df.columns if col.startswith("Practical_") and col.endswith("_Grade")]
-    
-    for col in practical_cols:
-        subject_name_col = col.replace("_Grade", "_Name")
-        if subject_name_col in df.columns and len(df) > 0:
-            subject_name = df[subject_name_col].iloc[0]
-            grades = df[col].value_counts()
-            practical_subjects[subject_name] = grades
-    
-    # Display practical subject analysis
-    if practical_subjects:
-        st.markdown("#### Practical Subjects")
+        st.markdown(heading)
         
         col1, col2 = st.columns([1, 1])
         
         with col1:
             selected_subject = st.selectbox(
-                "Select Practical Subject",
-                options=list(practical_subjects.keys()),
-                key="practical_subject"
+                f"Select {subject_type} Subject",
+                options=list(type_counts.index.get_level_values("Subject").unique()),
+                key=f"{subject_type.lower()}_subject"
             )
             
-            if selected_subject in practical_subjects:
+            def build():
+                grades = type_counts.xs(selected_subject, level="Subject").sort_values(ascending=False)
                 fig = px.pie(
-                    names=practical_subjects[selected_subject].index,
-                    values=practical_subjects[selected_subject].values,
+                    names=grades.index.astype(str),
+                    values=grades.values,
                     title=f"Grade Distribution: {selected_subject}",
-                    color_discrete_sequence=px.colors.qualitative.Set3
+                    color_discrete_sequence=palette
                 )
                 fig.update_traces(textposition='inside', textinfo='percent+label')
-                st.plotly_chart(fig, use_container_width=True)
+                return fig
+            
+            fig = _analytics_cache.get_or_compute(
+                (*_subject_key(df, subjects), "pie", subject_type, selected_subject), build
+            )
+            st.plotly_chart(fig, use_container_width=True)
 
 
 def show_pass_fail_analysis(df: pd.DataFrame):
@@ -246,10 +319,8 @@ def show_pass_fail_analysis(df: pd.DataFrame):
     
     col1, col2, col3 = st.columns(3)
     
-    passed = (df["Status"] == "PASS").sum()
-    failed = (df["Status"] == "FAIL").sum()
-    total = len(df)
-    pass_rate = (passed / total * 100) if total > 0 else 0
+    summary = _cached(df, "pass_fail", lambda: compute_pass_fail(get_cube(df)))
+    passed, failed, pass_rate = summary["passed"], summary["failed"], summary["pass_rate"]
     
     with col1:
         st.metric("Passed", passed)
@@ -259,68 +330,118 @@ def show_pass_fail_analysis(df: pd.DataFrame):
         st.metric("Pass Rate", f"{pass_rate:.1f}%")
     
     # Visual representation
-    fig = go.Figure(data=[
-        go.Pie(
-            labels=["Passed", "Failed"],
-            values=[passed, failed],
-            marker=dict(colors=["#2ecc71", "#e74c3c"]),
-            textposition='inside',
-            textinfo='percent+label'
-        )
-    ])
-    fig.update_layout(title="Pass/Fail Distribution", height=400)
-    st.plotly_chart(fig, use_container_width=True)
+    def build_pie():
+        fig = go.Figure(data=[
+            go.Pie(
+                labels=["Passed", "Failed"],
+                values=[passed, failed],
+                marker=dict(colors=["#2ecc71", "#e74c3c"]),
+                textposition='inside',
+                textinfo='percent+label'
+            )
+        ])
+        fig.update_layout(title="Pass/Fail Distribution", height=400)
+        return fig
+    
+    st.plotly_chart(_cached(df, "pass_fail_pie", build_pie), use_container_width=True)
     
     # College-wise pass rate
-    if "College Name" in df.columns:
+    if summary["college_pass_rate"] is not None:
         st.markdown("#### Pass Rate by College")
         
-        college_pass_rate = df.groupby("College Name").apply(
-            lambda x: (x["Status"] == "PASS").sum() / len(x) * 100
-        ).reset_index()
-        college_pass_rate.columns = ["College Name", "Pass Rate %"]
-        college_pass_rate = college_pass_rate.sort_values("Pass Rate %", ascending=False)
+        def build_bar():
+            fig = px.bar(
+                summary["college_pass_rate"],
+                x="College Name",
+                y="Pass Rate %",
+                title="Pass Rate by College",
+                color="Pass Rate %",
+                color_continuous_scale="RdYlGn",
+                labels={"Pass Rate %": "Pass Rate (%)"}
+            )
+            fig.update_layout(height=400, xaxis_tickangle=-45)
+            return fig
         
-        fig = px.bar(
-            college_pass_rate,
-            x="College Name",
-            y="Pass Rate %",
-            title="Pass Rate by College",
-            color="Pass Rate %",
-            color_continuous_scale="RdYlGn",
-            labels={"Pass Rate %": "Pass Rate (%)"}
-        )
-        fig.update_layout(height=400, xaxis_tickangle=-45)
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(_cached(df, "college_pass_rate_bar", build_bar), use_container_width=True)
 
 
 def show_sgpa_vs_cgpa_correlation(df: pd.DataFrame):
     """Displays scatter plot of SGPA vs CGPA correlation."""
     st.subheader("📊 SGPA vs CGPA Correlation")
     
-    fig = px.scatter(
-        df,
-        x="Current SGPA",
-        y="CGPA",
-        hover_data=["Student Name", "Registration No.", "College Name"],
-        title="SGPA vs CGPA Correlation",
-        color="Current SGPA",
-        color_continuous_scale="Viridis",
-        labels={"Current SGPA": "Current SGPA", "CGPA": "CGPA"}
+    def build():
+        fig = px.scatter(
+            df,
+            x="Current SGPA",
+            y="CGPA",
+            hover_data=["Student Name", "Registration No.", "College Name"],
+            title="SGPA vs CGPA Correlation",
+            color="Current SGPA",
+            color_continuous_scale="Viridis",
+            labels={"Current SGPA": "Current SGPA", "CGPA": "CGPA"}
+        )
+        fig.add_scatter(
+            x=df["Current SGPA"],
+            y=df["Current SGPA"],
+            mode='lines',
+            name='Ideal Line',
+            line=dict(dash='dash', color='red'),
+            hoverinfo='skip'
+        )
+        fig.update_layout(height=400)
+        return fig
+    
+    st.plotly_chart(_cached(df, "sgpa_cgpa_scatter", build), use_container_width=True)
+
+
+def show_semester_progression(history: StudentHistory):
+    """Displays cohort-wide SGPA and pass-rate progression over semesters."""
+    st.subheader("📚 Semester Progression")
+    
+    summary = history.semester_summary()
+    trends = history.trends()
+    labels = [f"Sem {semester}" for semester in summary["Semester"]]
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Students", len(history))
+    with col2:
+        st.metric("Improving (SGPA trend > 0)", int((trends["SGPA Trend"] > 0).sum()))
+    with col3:
+        st.metric("Failed at least once", int((trends["Failed Semesters"] > 0).sum()))
+    
+    fig = make_subplots(specs=[[{"secondary_y": True}]])
+    fig.add_trace(
+        go.Bar(x=labels, y=summary["Pass Rate %"], name="Pass Rate %", marker_color="#2ca02c", opacity=0.4),
+        secondary_y=True
     )
-    fig.add_scatter(
-        x=df["Current SGPA"],
-        y=df["Current SGPA"],
-        mode='lines',
-        name='Ideal Line',
-        line=dict(dash='dash', color='red'),
-        hoverinfo='skip'
+    fig.add_trace(
+        go.Scatter(x=labels, y=summary["Avg SGPA"], name="Avg SGPA", mode="lines+markers", line=dict(color="#1f77b4")),
+        secondary_y=False
     )
-    fig.update_layout(height=400)
+    fig.update_layout(title="Average SGPA and Pass Rate by Semester", height=400, hovermode="x unified")
+    fig.update_yaxes(title_text="Avg SGPA", secondary_y=False)
+    fig.update_yaxes(title_text="Pass Rate %", range=[0, 100], secondary_y=True)
     st.plotly_chart(fig, use_container_width=True)
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        fig = px.histogram(
+            trends.dropna(subset=["SGPA Trend"]),
+            x="SGPA Trend",
+            nbins=20,
+            title="SGPA Change per Semester (per student)",
+            labels={"SGPA Trend": "SGPA Trend", "count": "Number of Students"},
+            color_discrete_sequence=["#9467bd"]
+        )
+        fig.update_layout(bargap=0.1, height=350, showlegend=False)
+        st.plotly_chart(fig, use_container_width=True)
+    with col2:
+        st.dataframe(summary.round(2), use_container_width=True, hide_index=True)
 
 
-def show_complete_analytics(df: pd.DataFrame):
+@timed("render.analytics")
+def show_complete_analytics(df: pd.DataFrame, subjects: Optional[pd.DataFrame] = None):
     """Displays complete analytics dashboard."""
     st.markdown("## 📊 Complete Analytics Dashboard")
     st.markdown("---")
@@ -356,17 +477,17 @@ def show_complete_analytics(df: pd.DataFrame):
     st.markdown("---")
     
     # Subject analysis
-    show_subject_analysis(df)
+    show_subject_analysis(df, subjects)
     st.markdown("---")
     
     # Correlation analysis
     show_sgpa_vs_cgpa_correlation(df)
 
 
-def show_enhanced_analytics(df: pd.DataFrame):
+def show_enhanced_analytics(df: pd.DataFrame, subjects: Optional[pd.DataFrame] = None):
     """Compatibility wrapper used by `app.py`.
 
     Historically `app.py` imports `show_enhanced_analytics`. Delegate
     to `show_complete_analytics` to keep older imports working.
     """
-    return show_complete_analytics(df)
+    return show_complete_analytics(df, subjects)
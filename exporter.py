@@ -0,0 +1,160 @@
+"""
+Exporter Module - Chunked CSV/JSON/Excel exports generated on demand
+Author: Aditya Kumar
+
+Each export is written chunk by chunk into a spooled temporary file (kept in
+memory while small, moved to disk when large), optionally gzip-compressed,
+so building a download never holds the whole text alongside the frame; only
+the finished file is read back as bytes. The Export tab passes
+`build_export` to `st.download_button` as a callable, so nothing is
+generated until a button is clicked.
+"""
+
+import gzip
+import io
+import tempfile
+from typing import IO, Iterator
+
+import pandas as pd
+
+try:
+    import xlsxwriter
+except ImportError:  # xlsxwriter is optional; Excel exports fall back to openpyxl
+    xlsxwriter = None
+
+EXPORT_CHUNK_ROWS = 1000
+
+# Exports larger than this spill from memory to a temporary file
+SPOOL_MAX_BYTES = 4 * 1024 * 1024
+
+EXPORT_FORMATS = {
+    # format -> (file extension, MIME type)
+    "csv": ("csv", "text/csv"),
+    "json": ("json", "application/json"),
+    "xlsx": ("xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+}
+
+
+def iter_chunks(df: pd.DataFrame, chunk_rows: int = EXPORT_CHUNK_ROWS) -> Iterator[pd.DataFrame]:
+    """Yields consecutive row slices of `df` (views, not copies)."""
+    for start in range(0, len(df), chunk_rows):
+        yield df.iloc[start:start + chunk_rows]
+
+
+def iter_csv(df: pd.DataFrame, chunk_rows: int = EXPORT_CHUNK_ROWS) -> Iterator[str]:
+    """CSV text of `df` in chunks; the header comes with the first one."""
+    if df.empty:
+        yield df.to_csv(index=False)
+        return
+    for i, chunk in enumerate(iter_chunks(df, chunk_rows)):
+        yield chunk.to_csv(index=False, header=(i == 0))
+
+
+def iter_json(df: pd.DataFrame, chunk_rows: int = EXPORT_CHUNK_ROWS) -> Iterator[str]:
+    """A JSON array of row records in chunks, one record per line."""
+    yield "["
+    separator = "\n"
+    for chunk in iter_chunks(df, chunk_rows):
+        records = chunk.to_json(orient="records", lines=True).strip()
+        if records:
+            yield separator + records.replace("\n", ",\n")
+            separator = ",\n"
+    yield "\n]\n"
+
+
+def _write_xlsx(df: pd.DataFrame, out: IO[bytes], chunk_rows: int, sheet_name: str):
+    if xlsxwriter is None:
+        with pd.ExcelWriter(out, engine="openpyxl") as excel_writer:
+            df.to_excel(excel_writer, sheet_name=sheet_name, index=False)
+        return
+
+    # constant_memory flushes each row to disk once the next one starts, so
+    # rows must be written strictly in order (pandas' to_excel writes by column)
+    workbook = xlsxwriter.Workbook(out, {"constant_memory": True})
+    worksheet = workbook.add_worksheet(sheet_name)
+    worksheet.write_row(0, 0, [str(column) for column in df.columns])
+    row = 1
+    for chunk in iter_chunks(df, chunk_rows):
+        # Plain Python values with missing cells as None (written as blanks)
+        values = chunk.astype(object).where(chunk.notna(), None)
+        for record in values.itertuples(index=False, name=None):
+            worksheet.write_row(row, 0, record)
+            row += 1
+    workbook.close()
+
+
+def write_export(
+    df: pd.DataFrame,
+    fmt: str,
+    out: IO[bytes],
+    compress: bool = False,
+    chunk_rows: int = EXPORT_CHUNK_ROWS,
+    sheet_name: str = "Results"
+):
+    """
+    Writes `df` to the binary stream `out` in the given format.
+
+    Args:
+        df: Frame to export
+        fmt: "csv", "json" or "xlsx"
+        out: Writable binary stream
+        compress: Gzip the output (CSV and JSON only; xlsx is already zipped)
+        chunk_rows: Rows converted at a time
+        sheet_name: Worksheet name for Excel exports
+    """
+    if fmt == "xlsx":
+        _write_xlsx(df, out, chunk_rows, sheet_name)
+        return
+    if fmt == "csv":
+        parts = iter_csv(df, chunk_rows)
+    elif fmt == "json":
+        parts = iter_json(df, chunk_rows)
+    else:
+        raise ValueError(f"Unknown export format: {fmt}")
+
+    stream = gzip.GzipFile(fileobj=out, mode="wb", compresslevel=6, mtime=0) if compress else out
+    text = io.TextIOWrapper(stream, encoding="utf-8", newline="")
+    try:
+        for part in parts:
+            text.write(part)
+        text.flush()
+    finally:
+        text.detach()
+        if compress:
+            stream.close()
+
+
+def build_export(
+    df: pd.DataFrame,
+    fmt: str,
+    compress: bool = False,
+    chunk_rows: int = EXPORT_CHUNK_ROWS
+) -> bytes:
+    """
+    Generates an export for `st.download_button`, which only accepts bytes,
+    str or plain in-memory buffers.
+
+    Args:
+        df: Frame to export
+        fmt: "csv", "json" or "xlsx"
+        compress: Gzip CSV/JSON output
+        chunk_rows: Rows converted at a time
+
+    Returns:
+        The file content
+    """
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES) as out:
+        write_export(df, fmt, out, compress=compress, chunk_rows=chunk_rows)
+        out.seek(0)
+        return out.read()
+
+
+def export_file_name(stem: str, fmt: str, compress: bool = False) -> str:
+    """File name for an export, e.g. beu_results_20240101.csv.gz."""
+    extension = EXPORT_FORMATS[fmt][0]
+    return f"{stem}.{extension}.gz" if compress and fmt != "xlsx" else f"{stem}.{extension}"
+
+
+def export_mime(fmt: str, compress: bool = False) -> str:
+    """MIME type for an export."""
+    return "application/gzip" if compress and fmt != "xlsx" else EXPORT_FORMATS[fmt][1]
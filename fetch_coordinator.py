@@ -0,0 +1,241 @@
+"""
+Fetch Coordinator Module - Process-wide request coalescing and outbound concurrency cap
+Author: Aditya Kumar
+
+Every Streamlit session runs its fetches in the same server process, but in
+its own thread (and, for the async engine, its own event loop). The
+coordinator sits below all of them:
+
+- identical lookups (same result URL) that are in flight at the same time
+  are coalesced: the first caller makes the request, later callers wait for
+  its outcome instead of sending their own
+- a single limit caps how many requests are outstanding across all sessions
+
+Both work from threads and from coroutines on any event loop.
+"""
+
+import asyncio
+import threading
+from collections import deque
+from concurrent.futures import Future
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, Awaitable, Callable, Deque, Dict, Hashable, Tuple, TypeVar, Union
+
+T = TypeVar("T")
+
+# Requests outstanding at once across every session of the process
+DEFAULT_MAX_OUTBOUND = 64
+
+# Result handed to waiters when the caller making the request gave up
+# (e.g. its session stopped); they then make the request themselves
+_ABANDONED = object()
+
+
+class OutboundLimit:
+    """
+    Counting semaphore shared by threads and event loops. Slots are handed
+    to waiters in arrival order.
+    """
+
+    def __init__(self, limit: int = DEFAULT_MAX_OUTBOUND):
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+        self.limit = limit
+        self.active = 0
+        self._waiters: Deque[Union[threading.Event, Tuple[asyncio.AbstractEventLoop, asyncio.Future]]] = deque()
+        self._lock = threading.Lock()
+
+    def _take_or_queue(self, waiter) -> bool:
+        with self._lock:
+            if self.active < self.limit and not self._waiters:
+                self.active += 1
+                return True
+            self._waiters.append(waiter)
+            return False
+
+    def acquire(self):
+        """Blocks the calling thread until a slot is free."""
+        event = threading.Event()
+        if not self._take_or_queue(event):
+            event.wait()  # release() hands its slot over before setting the event
+
+    async def acquire_async(self):
+        """Suspends the calling coroutine until a slot is free."""
+        loop = asyncio.get_running_loop()
+        granted = loop.create_future()
+        waiter = (loop, granted)
+        if self._take_or_queue(waiter):
+            return
+        try:
+            await granted
+        except asyncio.CancelledError:
+            with self._lock:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                    raise
+            # The slot was already handed over; give it back (unless _grant will)
+            if granted.done() and not granted.cancelled():
+                self.release()
+            raise
+
+    def _grant(self, granted: asyncio.Future):
+        if granted.cancelled():
+            self.release()
+        else:
+            granted.set_result(None)
+
+    def release(self):
+        """Frees a slot, handing it straight to the longest waiter if any."""
+        with self._lock:
+            while self._waiters:
+                waiter = self._waiters.popleft()
+                if isinstance(waiter, threading.Event):
+                    waiter.set()
+                    return
+                loop, granted = waiter
+                try:
+                    loop.call_soon_threadsafe(self._grant, granted)
+                    return
+                except RuntimeError:  # that session's loop is already closed
+                    continue
+            self.active -= 1
+
+    @contextmanager
+    def slot(self):
+        self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    @asynccontextmanager
+    async def slot_async(self):
+        await self.acquire_async()
+        try:
+            yield
+        finally:
+            self.release()
+
+
+class FetchCoordinator:
+    """
+    Coalesces identical in-flight lookups and caps outbound concurrency.
+
+    Outcomes are shared between callers as-is, so they must not be modified.
+    """
+
+    def __init__(self, max_outbound: int = DEFAULT_MAX_OUTBOUND):
+        self.limit = OutboundLimit(max_outbound)
+        self.lookups = 0
+        self.coalesced = 0
+        self._in_flight: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def _join(self, key: Hashable) -> Tuple[Future, bool]:
+        """Returns the in-flight call for `key` and whether the caller must make it."""
+        with self._lock:
+            call = self._in_flight.get(key)
+            if call is not None:
+                self.coalesced += 1
+                return call, False
+            call = Future()
+            # Running futures cannot be cancelled, so a waiter giving up never affects the others
+            call.set_running_or_notify_cancel()
+            self._in_flight[key] = call
+            self.lookups += 1
+            return call, True
+
+    def _finish(self, key: Hashable, call: Future, outcome: Any = _ABANDONED, error: BaseException = None):
+        with self._lock:
+            if self._in_flight.get(key) is call:
+                del self._in_flight[key]
+        if error is not None:
+            call.set_exception(error)
+        else:
+            call.set_result(outcome)
+
+    def run(self, key: Hashable, fetch: Callable[[], T]) -> T:
+        """
+        Returns `fetch()`, or the outcome of an identical call already in flight.
+
+        Args:
+            key: Identity of the request (e.g. its URL)
+            fetch: Makes the request; should hold a `slot()` while on the wire
+        """
+        while True:
+            call, leader = self._join(key)
+            if not leader:
+                outcome = call.result()
+                if outcome is _ABANDONED:
+                    continue
+                return outcome
+            try:
+                outcome = fetch()
+            except Exception as e:
+                self._finish(key, call, error=e)
+                raise
+            except BaseException:
+                self._finish(key, call)
+                raise
+            self._finish(key, call, outcome)
+            return outcome
+
+    async def run_async(self, key: Hashable, fetch: Callable[[], Awaitable[T]]) -> T:
+        """Coroutine counterpart of `run`; `fetch` returns an awaitable."""
+        while True:
+            call, leader = self._join(key)
+            if not leader:
+                outcome = await asyncio.wrap_future(call)
+                if outcome is _ABANDONED:
+                    continue
+                return outcome
+            try:
+                outcome = await fetch()
+            except Exception as e:
+                self._finish(key, call, error=e)
+                raise
+            except BaseException:  # cancelled: let a waiter take over
+                self._finish(key, call)
+                raise
+            self._finish(key, call, outcome)
+            return outcome
+
+    def slot(self):
+        """Context manager holding one outbound slot (threads)."""
+        return self.limit.slot()
+
+    def slot_async(self):
+        """Async context manager holding one outbound slot (coroutines)."""
+        return self.limit.slot_async()
+
+    def stats(self) -> Dict[str, int]:
+        """Lookups sent out, lookups served by one already in flight, and current load."""
+        with self._lock:
+            in_flight = len(self._in_flight)
+        return {
+            "lookups": self.lookups,
+            "coalesced": self.coalesced,
+            "in_flight": in_flight,
+            "outbound": self.limit.active,
+            "max_outbound": self.limit.limit,
+        }
+
+
+_coordinator = FetchCoordinator()
+_coordinator_lock = threading.Lock()
+
+
+def get_fetch_coordinator() -> FetchCoordinator:
+    """Returns the process-wide coordinator."""
+    return _coordinator
+
+
+def configure_coordinator(max_outbound: int) -> FetchCoordinator:
+    """
+    Changes the process-wide outbound cap. Requests already holding a slot
+    of the old limit finish normally; new requests use the new one.
+    """
+    with _coordinator_lock:
+        if max_outbound != _coordinator.limit.limit:
+            _coordinator.limit = OutboundLimit(max_outbound)
+        return _coordinator
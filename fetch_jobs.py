@@ -0,0 +1,228 @@
+"""
+Fetch Jobs Module - Background fetch jobs that run outside the Streamlit script
+Author: Aditya Kumar
+
+A fetch started from the form normally runs inside the script run, so it
+blocks the session and is lost when the user interacts or the page
+reconnects. Jobs submitted here run on a process-wide worker pool instead:
+each has an ID, reports progress while it runs, can be cancelled, and saves
+its results to the result store when it finishes. Sessions only poll them.
+"""
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from api_scraper import BASE_URL, iter_semester_results
+from data_processor import (
+    IncrementalResultProcessor, compact_results, merge_results, merge_subject_tables, registration_numbers
+)
+from result_store import get_result_store, slice_key
+
+# Job states
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+# Jobs running at once; further jobs wait in the queue
+DEFAULT_JOB_WORKERS = 2
+
+# Finished jobs kept (with their frames) for sessions to open
+MAX_FINISHED_JOBS = 20
+
+
+class JobCancelled(Exception):
+    """Raised inside a job's fetch loop once cancellation was requested."""
+
+
+class FetchJob:
+    """
+    One background fetch of a class.
+
+    `params` holds the `fetch_semester_results` arguments plus `merge_saved`
+    (only fetch students missing from the saved slice and merge into it).
+    """
+
+    def __init__(self, job_id: str, params: Dict, label: str):
+        self.id = job_id
+        self.params = params
+        self.label = label
+        self.status = QUEUED
+        self.done = 0
+        self.total = 0
+        self.found = 0
+        self.message = ""
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.df: Optional[pd.DataFrame] = None
+        self.subjects: Optional[pd.DataFrame] = None
+        self._cancel = threading.Event()
+
+    @property
+    def active(self) -> bool:
+        return self.status in (QUEUED, RUNNING)
+
+    @property
+    def fraction(self) -> float:
+        """Share of the regular range checked so far (0-1)."""
+        return min(1.0, self.done / self.total) if self.total else 0.0
+
+    @property
+    def elapsed(self) -> float:
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.time()) - self.started_at
+
+    def _progress(self, done: int, total: int):
+        self.done, self.total = done, total
+        if self._cancel.is_set():
+            raise JobCancelled()
+
+
+class FetchJobManager:
+    """Process-wide queue of fetch jobs, shared by all sessions."""
+
+    def __init__(self, max_workers: int = DEFAULT_JOB_WORKERS):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fetch-job")
+        self._jobs: "OrderedDict[str, FetchJob]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(self, label: str, **params) -> str:
+        """
+        Queues a fetch job.
+
+        Args:
+            label: Short description shown in the jobs panel
+            **params: reg_start, reg_end, branch, college, semester, batch,
+                include_lateral, exam_month, exam_year, use_cache, probe,
+                miss_streak, merge_saved and optionally base_url
+
+        Returns:
+            The new job's ID
+        """
+        job = FetchJob(uuid.uuid4().hex[:8], params, label)
+        with self._lock:
+            self._jobs[job.id] = job
+        self._executor.submit(self._run, job)
+        return job.id
+
+    def get(self, job_id: str) -> Optional[FetchJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def jobs(self) -> List[FetchJob]:
+        """All known jobs, newest first."""
+        with self._lock:
+            return list(reversed(self._jobs.values()))
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        Requests cancellation. A queued job never starts; a running one stops
+        after the lookups already in progress, keeping nothing.
+        """
+        job = self.get(job_id)
+        if job is None or not job.active:
+            return False
+        job._cancel.set()
+        if job.status == QUEUED:
+            job.status = CANCELLED
+            job.finished_at = time.time()
+        return True
+
+    def _run(self, job: FetchJob):
+        if job._cancel.is_set():
+            return
+        job.status = RUNNING
+        job.started_at = time.time()
+        p = job.params
+        key = slice_key(p["batch"], p["branch"], p["college"], p["semester"], p["exam_month"], p["exam_year"])
+        store = get_result_store()
+        try:
+            existing_df = existing_subjects = None
+            if p.get("merge_saved"):
+                stored = store.find(**key)
+                if stored:
+                    existing_df = store.load_slices(stored)
+                    existing_subjects = store.load_slices(stored, table="subjects")
+
+            processor = IncrementalResultProcessor()
+            results = iter_semester_results(
+                p["reg_start"], p["reg_end"], p["branch"], p["college"], p["semester"], p["batch"],
+                include_lateral=p.get("include_lateral", False),
+                exam_month=p["exam_month"],
+                exam_year=p["exam_year"],
+                use_cache=p.get("use_cache", True),
+                probe=p.get("probe", False),
+                miss_streak=p["miss_streak"],
+                base_url=p.get("base_url", BASE_URL),
+                skip_registrations=registration_numbers(existing_df),
+                on_progress=job._progress
+            )
+            try:
+                for result in results:
+                    if job._cancel.is_set():
+                        raise JobCancelled()
+                    processor.add(result)
+                    job.found = processor.count
+            finally:
+                results.close()  # cancels lookups that have not started
+
+            if existing_df is not None:
+                df = merge_results(existing_df, processor.frame)
+                subjects = merge_subject_tables(existing_subjects, processor.subjects)
+            else:
+                df = compact_results(processor.frame)
+                subjects = processor.subjects
+            job.df, job.subjects = df, subjects
+
+            if len(df) == 0:
+                job.message = "No results found"
+            else:
+                job.message = f"{processor.count} new student records ({len(df)} in total)"
+                try:
+                    store.save(
+                        df, subjects,
+                        batch=p["batch"], branch=p["branch"], college=p["college"], semester=p["semester"],
+                        exam_month=p["exam_month"], exam_year=p["exam_year"]
+                    )
+                except Exception as e:
+                    job.message += f"; could not save to the local dataset: {e}"
+            job.status = DONE
+        except JobCancelled:
+            job.status = CANCELLED
+            job.message = f"Cancelled after {job.done} of {job.total} registration numbers"
+        except Exception as e:
+            print(f"Fetch job {job.id} failed: {e}")
+            job.status = FAILED
+            job.message = str(e)
+        finally:
+            job.finished_at = time.time()
+            self._prune()
+
+    def _prune(self):
+        """Forgets the oldest finished jobs beyond MAX_FINISHED_JOBS."""
+        with self._lock:
+            finished = [job_id for job_id, job in self._jobs.items() if not job.active]
+            for job_id in finished[:max(0, len(finished) - MAX_FINISHED_JOBS)]:
+                del self._jobs[job_id]
+
+
+_manager: Optional[FetchJobManager] = None
+_manager_lock = threading.Lock()
+
+
+def get_job_manager() -> FetchJobManager:
+    """Returns the process-wide job manager, creating it on first use."""
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            _manager = FetchJobManager()
+        return _manager
@@ -0,0 +1,147 @@
+"""
+Filter Index Module - Bitmap and sort-order index for interactive filtering of result frames
+Author: Aditya Kumar
+
+A FilterIndex is built once per results frame and answers filter/sort
+queries with row positions instead of copying the frame:
+
+- every value of College Name / Course / Status has a packed bitmap
+  (one bit per row); a query ORs the bitmaps of the selected values and
+  ANDs the dimensions together
+- the SGPA range is cut from a pre-sorted SGPA order with binary search
+- each sort option keeps its row order, computed on first use
+
+Only the rows and columns that are displayed are ever materialized.
+"""
+
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from frame_cache import LRUCache, frame_fingerprint
+
+BITMAP_COLUMNS = ["College Name", "Course", "Status"]
+
+# Sort option key (as in data_processor.get_sorting_options) -> (column, ascending)
+SORT_COLUMNS: Dict[str, Tuple[str, bool]] = {
+    "sgpa_desc": ("Current SGPA", False),
+    "sgpa_asc": ("Current SGPA", True),
+    "cgpa_desc": ("CGPA", False),
+    "cgpa_asc": ("CGPA", True),
+    "name": ("Student Name", True),
+    "regno": ("Registration No.", True),
+    "college": ("College Name", True),
+    "course": ("Course", True),
+}
+
+
+class FilterIndex:
+    """
+    Bitmap/sort index over one results frame. The frame must not be
+    modified while the index is in use.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+        self.size = len(df)
+        self._bitmaps: Dict[str, Dict[object, np.ndarray]] = {}
+        self._orders: Dict[str, np.ndarray] = {}
+        self._lock = threading.Lock()
+
+        for column in BITMAP_COLUMNS:
+            if column not in df.columns:
+                continue
+            codes, uniques = pd.factorize(df[column])
+            # One packed bitmap per distinct value, in order of first appearance
+            self._bitmaps[column] = {
+                value: np.packbits(codes == code) for code, value in enumerate(uniques.tolist())
+            }
+
+        sgpa = df["Current SGPA"].to_numpy(dtype=float, na_value=np.nan)
+        self._sgpa_order = np.argsort(sgpa, kind="stable")  # NaN last
+        self._sgpa_sorted = sgpa[self._sgpa_order]
+
+    def values(self, column: str) -> List:
+        """Distinct values of a bitmap column, in order of first appearance."""
+        return list(self._bitmaps.get(column, {}))
+
+    def _all_rows(self) -> np.ndarray:
+        return np.packbits(np.ones(self.size, dtype=bool))
+
+    def _match_any(self, column: str, selected: Iterable) -> np.ndarray:
+        bits = np.zeros((self.size + 7) // 8, dtype=np.uint8)
+        for value in selected:
+            value_bits = self._bitmaps.get(column, {}).get(value)
+            if value_bits is not None:
+                bits |= value_bits
+        return bits
+
+    def _sgpa_between(self, low: float, high: float) -> np.ndarray:
+        start = np.searchsorted(self._sgpa_sorted, low, side="left")
+        stop = np.searchsorted(self._sgpa_sorted, high, side="right")
+        rows = np.zeros(self.size, dtype=bool)
+        rows[self._sgpa_order[start:stop]] = True  # NaN sorts after every bound, so it never matches
+        return np.packbits(rows)
+
+    def order(self, sort_by: str) -> np.ndarray:
+        """Row positions in `sort_by` order (missing values last); built on first use."""
+        with self._lock:
+            order = self._orders.get(sort_by)
+        if order is None:
+            column, ascending = SORT_COLUMNS[sort_by]
+            ranked = self.df[column].reset_index(drop=True).sort_values(
+                ascending=ascending, kind="stable", na_position="last"
+            )
+            order = ranked.index.to_numpy()
+            with self._lock:
+                self._orders[sort_by] = order
+        return order
+
+    def query(
+        self,
+        colleges: Optional[Iterable[str]] = None,
+        courses: Optional[Iterable[str]] = None,
+        statuses: Optional[Iterable[str]] = None,
+        sgpa_range: Optional[Tuple[float, float]] = None,
+        sort_by: Optional[str] = None
+    ) -> np.ndarray:
+        """
+        Row positions matching every given filter, optionally sorted.
+
+        Args:
+            colleges, courses, statuses: Accepted values; None or empty
+                means no filter on that column
+            sgpa_range: Inclusive (low, high) SGPA bounds; rows without an
+                SGPA never match
+            sort_by: A SORT_COLUMNS key
+
+        Returns:
+            Integer positions into the indexed frame
+        """
+        bits = self._all_rows()
+        for column, selected in (("College Name", colleges), ("Course", courses), ("Status", statuses)):
+            if selected:
+                bits &= self._match_any(column, selected)
+        if sgpa_range is not None:
+            bits &= self._sgpa_between(*sgpa_range)
+
+        rows = np.unpackbits(bits, count=self.size).view(bool)
+        if sort_by is None:
+            return np.flatnonzero(rows)
+        order = self.order(sort_by)
+        return order[rows[order]]
+
+    def take(self, positions: np.ndarray, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """The selected rows (and only `columns`, when given) as a new frame."""
+        frame = self.df if columns is None else self.df[columns]
+        return frame.take(positions).reset_index(drop=True)
+
+
+_indexes = LRUCache(max_entries=8)
+
+
+def get_filter_index(df: pd.DataFrame) -> FilterIndex:
+    """Returns the cached FilterIndex for `df`, building it on first use."""
+    return _indexes.get_or_compute(frame_fingerprint(df), lambda: FilterIndex(df))
@@ -0,0 +1,106 @@
+"""
+Frame Cache Module - Content fingerprints for DataFrames and a bounded LRU cache
+Author: Aditya Kumar
+
+Streamlit reruns the whole script on every widget change, but imported
+modules stay loaded, so a module-level cache here survives reruns (and is
+shared by all sessions of the server process). Entries are keyed by a
+content hash of the frame, so a changed frame never hits a stale entry.
+"""
+
+import hashlib
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+import pandas as pd
+
+DEFAULT_MAX_ENTRIES = 64
+
+# id(frame) -> (weak reference, {columns: fingerprint}); frames are treated as
+# immutable once fingerprinted, which holds for the frames kept in session state
+_fingerprints: Dict[int, Tuple[weakref.ref, Dict[Optional[Tuple[str, ...]], str]]] = {}
+_fingerprints_lock = threading.Lock()
+
+
+def _hash_frame(df: pd.DataFrame, columns: List[str]) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr((len(df), columns, [str(df[column].dtype) for column in columns])).encode())
+    for column in columns:
+        digest.update(pd.util.hash_pandas_object(df[column], index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def frame_fingerprint(df: pd.DataFrame, columns: Optional[List[str]] = None) -> str:
+    """
+    Content hash of `df`, or of just `columns` (those present) when given.
+
+    Hashing a large frame takes milliseconds, so the fingerprint is
+    remembered per frame object until the frame is garbage collected;
+    repeated calls on the same frame are dictionary lookups.
+    """
+    wanted = tuple(column for column in columns if column in df.columns) if columns is not None else None
+    key = id(df)
+    with _fingerprints_lock:
+        entry = _fingerprints.get(key)
+        if entry is not None and entry[0]() is df and wanted in entry[1]:
+            return entry[1][wanted]
+
+    fingerprint = _hash_frame(df, list(wanted) if wanted is not None else list(df.columns))
+
+    with _fingerprints_lock:
+        entry = _fingerprints.get(key)
+        if entry is None or entry[0]() is not df:
+            ref = weakref.ref(df, lambda _, key=key: _forget(key))
+            entry = _fingerprints[key] = (ref, {})
+        entry[1][wanted] = fingerprint
+    return fingerprint
+
+
+def _forget(key: int):
+    with _fingerprints_lock:
+        entry = _fingerprints.get(key)
+        if entry is not None and entry[0]() is None:
+            del _fingerprints[key]
+
+
+class LRUCache:
+    """
+    Thread-safe cache holding at most `max_entries` values; the least
+    recently used entry is evicted first. Cached values are shared between
+    callers and must not be modified.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Returns the cached value for `key`, computing and storing it on a miss."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+        # Computed outside the lock; two sessions racing on the same key both compute once
+        value = compute()
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Entry count and hit/miss counters."""
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,242 @@
+"""
+HTML Parsers Module - Interchangeable parsers for the legacy ASP.NET result pages
+Author: Aditya Kumar
+
+Every backend returns the same dict for a result page:
+    {"Registration No.", "Student Name", "Father's Name", "Mother's Name",
+     "Current SGPA", "Sem <header>"...}
+or None when the page carries no student (invalid registration number).
+A page that has a student but is missing one of the other labels raises
+AttributeError, exactly like the original BeautifulSoup code, so callers
+can keep treating it as a retryable, half-loaded page.
+"""
+
+import re
+from html import unescape
+from typing import Callable, Dict, List, Optional, Tuple
+
+from bs4 import BeautifulSoup
+
+try:
+    import lxml.html as lxml_html
+except ImportError:  # lxml is optional; the regex and bs4 backends still work
+    lxml_html = None
+
+STUDENT_NAME_ID = "ContentPlaceHolder1_DataList1_StudentNameLabel_0"
+SEM_TABLE_ID = "ContentPlaceHolder1_GridView3"
+
+# Output key -> element ID, in the order the keys appear in the result dict
+LABEL_IDS = {
+    "Registration No.": "ContentPlaceHolder1_DataList1_RegistrationNoLabel_0",
+    "Student Name": STUDENT_NAME_ID,
+    "Father's Name": "ContentPlaceHolder1_DataList1_FatherNameLabel_0",
+    "Mother's Name": "ContentPlaceHolder1_DataList1_MotherNameLabel_0",
+    "Current SGPA": "ContentPlaceHolder1_DataList5_GROSSTHEORYTOTALLabel_0",
+}
+
+
+def _missing(element_id: str) -> AttributeError:
+    return AttributeError(f"'NoneType' object has no attribute 'text' ({element_id})")
+
+
+def _build_result(labels: Dict[str, Optional[str]], headers: List[str], values: List[str]) -> Dict:
+    result = {}
+    for key, element_id in LABEL_IDS.items():
+        if labels[key] is None:
+            raise _missing(element_id)
+        result[key] = labels[key]
+    for header, value in zip(headers, values):
+        result[f"Sem {header}"] = value
+    return result
+
+
+# ============================================================================
+# BEAUTIFULSOUP (reference implementation)
+# ============================================================================
+
+def parse_with_bs4(html: str) -> Optional[Dict]:
+    """Reference parser: full html.parser tree plus CSS selectors."""
+    soup = BeautifulSoup(html, "html.parser")
+    if not soup.select_one(f"#{STUDENT_NAME_ID}"):
+        return None
+
+    labels = {}
+    for key, element_id in LABEL_IDS.items():
+        tag = soup.select_one(f"#{element_id}")
+        labels[key] = tag.text.strip() if tag else None
+
+    headers, values = [], []
+    table = soup.select_one(f"#{SEM_TABLE_ID}")
+    if table:
+        rows = table.select("tr")
+        headers = [th.text.strip() for th in rows[0].find_all("th")]
+        values = [td.text.strip() for td in rows[1].find_all("td")]
+    return _build_result(labels, headers, values)
+
+
+# ============================================================================
+# LXML (C parser, same tree semantics)
+# ============================================================================
+
+def parse_with_lxml(html: str) -> Optional[Dict]:
+    """libxml2-backed parser; several times faster than html.parser."""
+    if lxml_html is None:
+        raise ImportError("lxml is not installed")
+    if not html.strip():
+        return None
+    try:
+        root = lxml_html.fromstring(html)
+    except ValueError:
+        # Unicode input with an XML encoding declaration is rejected by lxml
+        return parse_with_bs4(html)
+
+    def by_id(element_id: str):
+        return root.get_element_by_id(element_id, None)
+
+    if by_id(STUDENT_NAME_ID) is None:
+        return None
+
+    labels = {}
+    for key, element_id in LABEL_IDS.items():
+        element = by_id(element_id)
+        labels[key] = element.text_content().strip() if element is not None else None
+
+    headers, values = [], []
+    table = by_id(SEM_TABLE_ID)
+    if table is not None:
+        rows = list(table.iter("tr"))
+        headers = [th.text_content().strip() for th in rows[0].iter("th")]
+        values = [td.text_content().strip() for td in rows[1].iter("td")]
+    return _build_result(labels, headers, values)
+
+
+# ============================================================================
+# TARGETED REGEX EXTRACTOR (no tree at all)
+# ============================================================================
+
+_COMMENT = re.compile(r"<!--.*?-->", re.S)
+_TAG = re.compile(r"<[^>]*>")
+_ROW = re.compile(r"<tr\b[^>]*>(.*?)</tr\s*>", re.S | re.I)
+_HEADER_CELL = re.compile(r"<th\b[^>]*>(.*?)</th\s*>", re.S | re.I)
+_DATA_CELL = re.compile(r"<td\b[^>]*>(.*?)</td\s*>", re.S | re.I)
+_TAG_NAME = re.compile(r"<([a-zA-Z][\w]*)")
+_CLOSE_TAGS: Dict[str, "re.Pattern"] = {}
+
+
+def _element_body(html: str, element_id: str) -> Optional[str]:
+    """
+    Inner markup of the first element with `element_id`. ASP.NET renders
+    these as flat <span>/<table> elements, so the first close tag of the
+    same name ends the element.
+    """
+    pos = html.find(f'id="{element_id}"')
+    if pos == -1:
+        # Less common spellings: single quotes, unquoted, spaces around "="
+        match = re.search(r"\sid\s*=\s*[\"']?" + re.escape(element_id) + r"[\"'\s>]", html)
+        if match is None:
+            return None
+        pos = match.start()
+    tag_start = html.rfind("<", 0, pos)
+    tag_name = _TAG_NAME.match(html, tag_start)
+    body_start = html.find(">", pos) + 1
+    if tag_name is None or body_start == 0:
+        return None
+    name = tag_name.group(1).lower()
+    close = _CLOSE_TAGS.get(name)
+    if close is None:
+        close = _CLOSE_TAGS[name] = re.compile(rf"</{name}\s*>", re.I)
+    body_end = close.search(html, body_start)
+    return html[body_start:body_end.start()] if body_end else None
+
+
+def _text(fragment: str) -> str:
+    return unescape(_TAG.sub("", _COMMENT.sub("", fragment))).strip()
+
+
+def parse_with_regex(html: str) -> Optional[Dict]:
+    """
+    Pulls the known `ContentPlaceHolder1_*` elements straight out of the
+    markup without building a tree. Relies on the portal's flat label
+    markup; use lxml or bs4 for arbitrary HTML.
+    """
+    if STUDENT_NAME_ID not in html:
+        return None
+    labels = {}
+    for key, element_id in LABEL_IDS.items():
+        body = _element_body(html, element_id)
+        labels[key] = _text(body) if body is not None else None
+    if labels["Student Name"] is None:
+        return None
+
+    headers, values = [], []
+    table = _element_body(html, SEM_TABLE_ID)
+    if table is not None:
+        rows = _ROW.findall(table)
+        headers = [_text(cell) for cell in _HEADER_CELL.findall(rows[0])]
+        values = [_text(cell) for cell in _DATA_CELL.findall(rows[1])]
+    return _build_result(labels, headers, values)
+
+
+# ============================================================================
+# REGISTRY
+# ============================================================================
+
+TREE_PARSER = "lxml" if lxml_html is not None else "bs4"
+
+
+def parse_auto(html: str) -> Optional[Dict]:
+    """
+    Regex extractor first; if the page does not look like the usual portal
+    markup (extraction failed, or found no student although the name label
+    is there), the page is parsed again with a real tree parser.
+    """
+    try:
+        result = parse_with_regex(html)
+    except (AttributeError, IndexError):
+        result = None
+    if result is None and STUDENT_NAME_ID in html:
+        return PARSERS[TREE_PARSER](html)
+    return result
+
+
+PARSERS: Dict[str, Callable[[str], Optional[Dict]]] = {
+    "bs4": parse_with_bs4,
+    "regex": parse_with_regex,
+    "auto": parse_auto,
+}
+if lxml_html is not None:
+    PARSERS["lxml"] = parse_with_lxml
+
+DEFAULT_PARSER = "auto"
+
+
+def parse_result_page(html: str, parser: str = DEFAULT_PARSER) -> Optional[Dict]:
+    """
+    Parses one result page with the named backend.
+
+    Args:
+        html: Page source
+        parser: "auto" (default), "regex", "lxml" or "bs4"
+
+    Returns:
+        Result dict, or None if the page has no student
+    """
+    try:
+        parse = PARSERS[parser]
+    except KeyError:
+        raise ValueError(f"Unknown parser '{parser}', choose from {sorted(PARSERS)}")
+    return parse(html)
+
+
+def try_parse_result_page(html: str, parser: str = DEFAULT_PARSER) -> Tuple[Optional[Dict], bool]:
+    """
+    `parse_result_page` for worker processes: instead of raising on a
+    half-loaded page it returns (None, False), so the caller can refetch.
+
+    Returns:
+        (result or None, complete)
+    """
+    try:
+        return parse_result_page(html, parser), True
+    except AttributeError:
+        return None, False
@@ -0,0 +1,152 @@
+"""
+HTTP Pool Module - Shared keep-alive sessions for the BEU API fetch path
+Author: Aditya Kumar
+"""
+
+import threading
+from typing import Dict, Optional
+
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+DEFAULT_POOL_SIZE = 16
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Accept': 'application/json',
+    'Connection': 'keep-alive',
+}
+
+_stats = {"connections_opened": 0, "requests_sent": 0}
+_stats_lock = threading.Lock()
+
+_session: Optional[requests.Session] = None
+_session_pool_size = 0
+_session_lock = threading.Lock()
+
+
+def _count(key: str, n: int = 1):
+    with _stats_lock:
+        _stats[key] += n
+
+
+class _CountingHTTPConnectionPool(HTTPConnectionPool):
+    def _new_conn(self):
+        _count("connections_opened")
+        return super()._new_conn()
+
+
+class _CountingHTTPSConnectionPool(HTTPSConnectionPool):
+    def _new_conn(self):
+        _count("connections_opened")
+        return super()._new_conn()
+
+
+class PooledAdapter(HTTPAdapter):
+    """HTTPAdapter whose pools count new connections and sent requests."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _CountingHTTPConnectionPool,
+            "https": _CountingHTTPSConnectionPool,
+        }
+
+    def send(self, request, **kwargs):
+        _count("requests_sent")
+        return super().send(request, **kwargs)
+
+
+def _build_adapter(pool_size: int) -> PooledAdapter:
+    return PooledAdapter(pool_connections=4, pool_maxsize=pool_size)
+
+
+def _build_session(pool_size: int) -> requests.Session:
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    adapter = _build_adapter(pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session(pool_size: Optional[int] = None) -> requests.Session:
+    """
+    Returns the process-wide pooled session, creating it on first use.
+
+    Connections are kept alive and reused across every fetch in the run.
+    The pool only ever grows: asking for a larger `pool_size` than the
+    session holds mounts a bigger adapter on the same session, and requests
+    already running on the old adapter finish normally. A smaller size
+    leaves the pool as it is, so one caller never shrinks another's.
+
+    Args:
+        pool_size: Minimum number of keep-alive connections per host
+    """
+    global _session, _session_pool_size
+    with _session_lock:
+        if _session is None:
+            _session_pool_size = max(pool_size or 0, DEFAULT_POOL_SIZE)
+            _session = _build_session(_session_pool_size)
+        elif pool_size and pool_size > _session_pool_size:
+            _session_pool_size = pool_size
+            adapter = _build_adapter(_session_pool_size)
+            _session.mount("https://", adapter)
+            _session.mount("http://", adapter)
+        return _session
+
+
+def configure_pool(pool_size: int) -> requests.Session:
+    """Grows the shared session to at least `pool_size` connections per host (see `get_session`)."""
+    return get_session(pool_size)
+
+
+def current_pool_size() -> int:
+    """Keep-alive connections per host the shared session currently holds (0 before first use)."""
+    with _session_lock:
+        return _session_pool_size
+
+
+def pool_stats() -> Dict[str, int]:
+    """Returns counters for connections opened versus reused since the process started."""
+    with _stats_lock:
+        opened = _stats["connections_opened"]
+        sent = _stats["requests_sent"]
+    return {
+        "requests_sent": sent,
+        "connections_opened": opened,
+        "connections_reused": max(0, sent - opened),
+    }
+
+
+def pool_stats_since(before: Dict[str, int]) -> Dict[str, int]:
+    """
+    Counters accumulated since `before`, an earlier `pool_stats()` snapshot.
+
+    Taking a snapshot at the start of a fetch run and diffing at the end
+    reports that run without zeroing the counters other sessions rely on.
+    """
+    now = pool_stats()
+    sent = now["requests_sent"] - before["requests_sent"]
+    opened = now["connections_opened"] - before["connections_opened"]
+    return {
+        "requests_sent": sent,
+        "connections_opened": opened,
+        "connections_reused": max(0, sent - opened),
+    }
+
+
+def pool_trace_config() -> aiohttp.TraceConfig:
+    """TraceConfig that feeds the async engine's connections into the same counters."""
+    async def on_request_start(session, context, params):
+        _count("requests_sent")
+
+    async def on_connection_create_end(session, context, params):
+        _count("connections_opened")
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_start.append(on_request_start)
+    trace_config.on_connection_create_end.append(on_connection_create_end)
+    return trace_config
@@ -0,0 +1,221 @@
+"""
+Instrumentation Module - Opt-in span timers, counters and latency histograms
+Author: Aditya Kumar
+
+Recording is off by default, and every probe is then a single flag check.
+Once enabled (⏱️ Performance in the sidebar, or BEULYTICS_TRACE=1), spans
+time the fetch -> process -> render pipeline, counters track requests,
+retries, cache hits and bytes, and every span name gets a latency
+histogram. The recorder is process-wide, like the HTTP pool and caches.
+
+`export_trace()` produces Chrome trace-event JSON (open it in
+chrome://tracing or https://ui.perfetto.dev) with the counters and the
+per-span summary alongside.
+"""
+
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from typing import Callable, Deque, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+# Spans kept for the trace export (oldest dropped first)
+MAX_SPANS = 20000
+
+# Durations kept per span name for percentiles
+MAX_SAMPLES = 5000
+
+# Histogram bucket upper bounds in milliseconds (the last bucket is open-ended)
+HISTOGRAM_BUCKETS_MS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000]
+
+_enabled = os.environ.get("BEULYTICS_TRACE", "").lower() in ("1", "true", "yes")
+
+
+class Recorder:
+    """Thread-safe store of finished spans, counters and duration samples."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.started_at = time.time()
+            self._origin = time.perf_counter()
+            self._spans: Deque[Dict] = deque(maxlen=MAX_SPANS)
+            self._samples: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=MAX_SAMPLES))
+            self._calls: Dict[str, int] = defaultdict(int)
+            self._total_ms: Dict[str, float] = defaultdict(float)
+            self._counters: Dict[str, float] = defaultdict(float)
+
+    def add_span(self, name: str, start: float, end: float, attrs: Dict):
+        duration_ms = (end - start) * 1000
+        with self._lock:
+            self._spans.append({
+                "name": name,
+                "start_ms": (start - self._origin) * 1000,
+                "duration_ms": duration_ms,
+                "thread": threading.get_ident(),
+                "attrs": attrs,
+            })
+            self._samples[name].append(duration_ms)
+            self._calls[name] += 1
+            self._total_ms[name] += duration_ms
+
+    def add(self, name: str, value: float = 1):
+        with self._lock:
+            self._counters[name] += value
+
+    def counters(self) -> Dict[str, float]:
+        with self._lock:
+            return dict(sorted(self._counters.items()))
+
+    def spans(self) -> List[Dict]:
+        with self._lock:
+            return list(self._spans)
+
+    def samples(self, name: str) -> np.ndarray:
+        with self._lock:
+            return np.array(self._samples.get(name, ()), dtype=float)
+
+    def summary(self) -> pd.DataFrame:
+        """
+        One row per span name.
+
+        Returns:
+            DataFrame with Span, Calls, Total ms, Mean ms, p50/p95/p99 ms and
+            Max ms (percentiles over the last MAX_SAMPLES calls), slowest
+            total first
+        """
+        with self._lock:
+            names = list(self._calls)
+            calls = dict(self._calls)
+            totals = dict(self._total_ms)
+            samples = {name: np.array(self._samples[name], dtype=float) for name in names}
+        rows = []
+        for name in names:
+            p50, p95, p99 = np.percentile(samples[name], [50, 95, 99])
+            rows.append({
+                "Span": name,
+                "Calls": calls[name],
+                "Total ms": totals[name],
+                "Mean ms": totals[name] / calls[name],
+                "p50 ms": p50,
+                "p95 ms": p95,
+                "p99 ms": p99,
+                "Max ms": samples[name].max(),
+            })
+        columns = ["Span", "Calls", "Total ms", "Mean ms", "p50 ms", "p95 ms", "p99 ms", "Max ms"]
+        return pd.DataFrame(rows, columns=columns).sort_values("Total ms", ascending=False, ignore_index=True)
+
+    def histogram(self, name: str) -> pd.DataFrame:
+        """Bucketed durations of one span name (Bucket label, Calls)."""
+        values = self.samples(name)
+        edges = [0] + HISTOGRAM_BUCKETS_MS + [np.inf]
+        counts, _ = np.histogram(values, bins=edges)
+        labels = [f"≤{bound} ms" for bound in HISTOGRAM_BUCKETS_MS] + [f">{HISTOGRAM_BUCKETS_MS[-1]} ms"]
+        return pd.DataFrame({"Bucket": labels, "Calls": counts})
+
+    def export_trace(self) -> str:
+        """Chrome trace-event JSON of all kept spans, plus counters and the summary."""
+        events = [
+            {
+                "name": span["name"],
+                "cat": span["name"].split(".", 1)[0],
+                "ph": "X",
+                "ts": round(span["start_ms"] * 1000, 1),
+                "dur": round(span["duration_ms"] * 1000, 1),
+                "pid": os.getpid(),
+                "tid": span["thread"],
+                "args": span["attrs"],
+            }
+            for span in self.spans()
+        ]
+        return json.dumps({
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": {
+                "started_at": self.started_at,
+                "exported_at": time.time(),
+                "counters": self.counters(),
+                "summary": self.summary().to_dict(orient="records"),
+            },
+        }, default=str)
+
+
+_recorder = Recorder()
+
+
+def get_recorder() -> Recorder:
+    """Returns the process-wide recorder."""
+    return _recorder
+
+
+def enable(on: bool = True):
+    """Turns recording on or off for the whole process."""
+    global _enabled
+    _enabled = bool(on)
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+@contextmanager
+def span(name: str, **attrs):
+    """Times the enclosed block as `name` (no-op while recording is off)."""
+    if not _enabled:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _recorder.add_span(name, start, time.perf_counter(), attrs)
+
+
+def count(name: str, value: float = 1):
+    """Adds `value` to counter `name` (no-op while recording is off)."""
+    if _enabled:
+        _recorder.add(name, value)
+
+
+def timed(name: Optional[str] = None) -> Callable:
+    """
+    Decorator recording every call of a function (or coroutine function) as
+    a span, named `name` or after the function.
+    """
+    def decorate(func: Callable) -> Callable:
+        span_name = name or f"{func.__module__}.{func.__name__}"
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if not _enabled:
+                    return await func(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    _recorder.add_span(span_name, start, time.perf_counter(), {})
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _recorder.add_span(span_name, start, time.perf_counter(), {})
+        return wrapper
+
+    return decorate
@@ -0,0 +1,71 @@
+"""
+Rate Limiting Module - Token-bucket limiter shared by the fetch engines
+Author: Aditya Kumar
+"""
+
+import asyncio
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+
+class TokenBucket:
+    """
+    Classic token bucket: holds up to `burst` tokens and refills at `rate`
+    tokens per second. Each request consumes one token.
+
+    Works from threads (`acquire`) and from coroutines (`acquire_async`).
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.capacity = float(burst if burst is not None else max(1, int(rate)))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Takes one token and returns how long the caller must wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self):
+        """Blocks the calling thread until a token is available."""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        """Suspends the calling coroutine until a token is available."""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+_buckets: Dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def get_host_bucket(url: str, rate: float, burst: Optional[int] = None) -> TokenBucket:
+    """
+    Returns the process-wide bucket for the host of `url`.
+
+    The first caller for a host fixes its rate; later callers asking for a
+    different rate replace the bucket so UI changes take effect.
+    """
+    host = urlsplit(url).netloc
+    with _buckets_lock:
+        bucket = _buckets.get(host)
+        if bucket is None or bucket.rate != float(rate):
+            bucket = TokenBucket(rate, burst)
+            _buckets[host] = bucket
+        return bucket
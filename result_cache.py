@@ -0,0 +1,235 @@
+"""
+Result Cache Module - Persistent on-disk cache of raw BEU API payloads
+Author: Aditya Kumar
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".beulytics_cache")
+DEFAULT_CACHE_PATH = os.path.join(CACHE_DIR, "results.sqlite")
+
+# Published results do not change, so entries can live for a long time
+DEFAULT_TTL_SECONDS = 30 * 24 * 3600
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# "No such student" answers expire sooner: a result may still be published later
+DEFAULT_NEGATIVE_TTL_SECONDS = 7 * 24 * 3600
+
+
+class ResultCache:
+    """
+    SQLite-backed cache keyed by (redg_no, semester, exam_held).
+
+    Entries older than `ttl` seconds are treated as missing. When the stored
+    payloads exceed `max_bytes`, the oldest entries are evicted first.
+    A separate negative cache remembers students the API has no record of,
+    for `negative_ttl` seconds. Safe to share between threads.
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_CACHE_PATH,
+        ttl: float = DEFAULT_TTL_SECONDS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        negative_ttl: float = DEFAULT_NEGATIVE_TTL_SECONDS
+    ):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.negative_ttl = negative_ttl
+        self.hits = 0
+        self.misses = 0
+        self.negative_hits = 0
+        self._lock = threading.Lock()
+
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS results (
+                redg_no TEXT NOT NULL,
+                semester TEXT NOT NULL,
+                exam_held TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                fetched_at REAL NOT NULL,
+                PRIMARY KEY (redg_no, semester, exam_held)
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_results_fetched_at ON results (fetched_at)")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS missing (
+                redg_no TEXT NOT NULL,
+                semester TEXT NOT NULL,
+                exam_held TEXT NOT NULL,
+                checked_at REAL NOT NULL,
+                PRIMARY KEY (redg_no, semester, exam_held)
+            )
+            """
+        )
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS le_bounds (
+                batch INTEGER NOT NULL,
+                branch TEXT NOT NULL,
+                college TEXT NOT NULL,
+                upper INTEGER NOT NULL,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (batch, branch, college)
+            )
+            """
+        )
+        self._conn.commit()
+        self._bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+
+    def get(self, redg_no: str, semester: str, exam_held: str) -> Optional[Dict]:
+        """Returns the cached payload, or None if absent or expired."""
+        key = (str(redg_no), semester, exam_held)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, size, fetched_at FROM results WHERE redg_no=? AND semester=? AND exam_held=?",
+                key
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            payload, size, fetched_at = row
+            if time.time() - fetched_at > self.ttl:
+                self._conn.execute("DELETE FROM results WHERE redg_no=? AND semester=? AND exam_held=?", key)
+                self._conn.commit()
+                self._bytes -= size
+                self.misses += 1
+                return None
+            self.hits += 1
+        return json.loads(payload)
+
+    def put(self, redg_no: str, semester: str, exam_held: str, payload: Dict):
+        """Stores a payload, evicting the oldest entries if over the size limit."""
+        raw = json.dumps(payload, separators=(",", ":"))
+        key = (str(redg_no), semester, exam_held)
+        with self._lock:
+            old = self._conn.execute(
+                "SELECT size FROM results WHERE redg_no=? AND semester=? AND exam_held=?", key
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results (redg_no, semester, exam_held, payload, size, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (*key, raw, len(raw), time.time())
+            )
+            self._conn.execute("DELETE FROM missing WHERE redg_no=? AND semester=? AND exam_held=?", key)
+            self._bytes += len(raw) - (old[0] if old else 0)
+            if self._bytes > self.max_bytes:
+                self._evict_locked()
+            self._conn.commit()
+
+    def is_missing(self, redg_no: str, semester: str, exam_held: str) -> bool:
+        """True if the API recently reported no record for this student."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT checked_at FROM missing WHERE redg_no=? AND semester=? AND exam_held=?",
+                (str(redg_no), semester, exam_held)
+            ).fetchone()
+            if row is None or time.time() - row[0] > self.negative_ttl:
+                return False
+            self.negative_hits += 1
+            return True
+
+    def mark_missing(self, redg_no: str, semester: str, exam_held: str):
+        """Remembers that the API has no record for this student."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO missing (redg_no, semester, exam_held, checked_at) VALUES (?, ?, ?, ?)",
+                (str(redg_no), semester, exam_held, time.time())
+            )
+            self._conn.commit()
+
+    def get_le_bound(self, batch: int, branch: str, college: str) -> Optional[int]:
+        """Returns the highest LE student number discovered for a class, if any."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT upper FROM le_bounds WHERE batch=? AND branch=? AND college=?",
+                (int(batch), str(branch), str(college))
+            ).fetchone()
+        return row[0] if row else None
+
+    def set_le_bound(self, batch: int, branch: str, college: str, upper: int):
+        """Records the highest LE student number discovered for a class."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO le_bounds (batch, branch, college, upper, updated_at) VALUES (?, ?, ?, ?, ?)",
+                (int(batch), str(branch), str(college), int(upper), time.time())
+            )
+            self._conn.commit()
+
+    def _evict_locked(self):
+        now = time.time()
+        self._conn.execute("DELETE FROM results WHERE fetched_at < ?", (now - self.ttl,))
+        self._conn.execute("DELETE FROM missing WHERE checked_at < ?", (now - self.negative_ttl,))
+        self._bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+        while self._bytes > self.max_bytes:
+            rows = self._conn.execute(
+                "SELECT rowid, size FROM results ORDER BY fetched_at LIMIT 256"
+            ).fetchall()
+            if not rows:
+                break
+            freed = 0
+            doomed = []
+            for rowid, size in rows:
+                doomed.append((rowid,))
+                freed += size
+                if self._bytes - freed <= self.max_bytes:
+                    break
+            self._conn.executemany("DELETE FROM results WHERE rowid=?", doomed)
+            self._bytes -= freed
+
+    def evict(self):
+        """Drops expired entries and trims the cache to `max_bytes`."""
+        with self._lock:
+            self._evict_locked()
+            self._conn.commit()
+
+    def clear(self):
+        """Removes every cached payload, negative entry and discovered LE bound."""
+        with self._lock:
+            self._conn.execute("DELETE FROM results")
+            self._conn.execute("DELETE FROM missing")
+            self._conn.execute("DELETE FROM le_bounds")
+            self._conn.commit()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Returns entry counts, stored bytes and hit/miss counters."""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+            missing = self._conn.execute("SELECT COUNT(*) FROM missing").fetchone()[0]
+            return {
+                "entries": entries,
+                "missing": missing,
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "negative_hits": self.negative_hits,
+            }
+
+
+_cache: Optional[ResultCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_result_cache() -> ResultCache:
+    """Returns the process-wide result cache, opening it on first use."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ResultCache()
+        return _cache
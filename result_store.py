@@ -0,0 +1,242 @@
+"""
+Result Store Module - Partitioned Parquet dataset of fetched result sets
+Author: Aditya Kumar
+
+Every fetched class is saved as one slice of a hive-style directory tree:
+
+    .beulytics_data/batch=23/semester=3/exam=July-2025/branch=105/college=110/
+        results.parquet     (the compact results frame)
+        subjects.parquet    (the long subject table)
+
+Loading walks only the directories that match the requested partitions and
+reads only the requested columns from each file, so reopening a past fetch
+or sweep takes milliseconds instead of refetching it.
+"""
+
+import os
+import shutil
+import threading
+from typing import Dict, Iterable, List, Optional, Union
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+from data_processor import compact_results, concat_subject_tables, subject_table_from_frame
+
+STORE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".beulytics_data")
+
+# Directory levels, outermost first
+PARTITION_KEYS = ["batch", "semester", "exam", "branch", "college"]
+
+RESULTS_TABLE = "results"
+SUBJECTS_TABLE = "subjects"
+TABLES = [RESULTS_TABLE, SUBJECTS_TABLE]
+
+FilterValue = Union[str, int, Iterable[Union[str, int]]]
+
+
+def slice_key(batch: int, branch: str, college: str, semester: int, exam_month: str, exam_year: int) -> Dict[str, str]:
+    """Partition values for one fetched class, as stored in directory names."""
+    return {
+        "batch": str(batch),
+        "semester": str(semester),
+        "exam": f"{exam_month}-{exam_year}",
+        "branch": str(branch),
+        "college": str(college),
+    }
+
+
+def _allowed(value: Optional[FilterValue]) -> Optional[set]:
+    if value is None:
+        return None
+    if isinstance(value, (str, int)):
+        return {str(value)}
+    return {str(v) for v in value}
+
+
+class ResultStore:
+    """
+    Partitioned Parquet store of result frames, one slice per fetched class.
+
+    Saving a slice again replaces it. Files are written to a temporary name
+    and renamed into place, so readers never see a half-written slice.
+    """
+
+    def __init__(self, root: str = STORE_DIR):
+        self.root = root
+        self._lock = threading.Lock()
+
+    def _slice_dir(self, key: Dict[str, str]) -> str:
+        return os.path.join(self.root, *(f"{name}={key[name]}" for name in PARTITION_KEYS))
+
+    def save(
+        self,
+        df: pd.DataFrame,
+        subjects: Optional[pd.DataFrame] = None,
+        *,
+        batch: int,
+        branch: str,
+        college: str,
+        semester: int,
+        exam_month: str,
+        exam_year: int
+    ) -> str:
+        """
+        Writes one fetched class to the store.
+
+        Args:
+            df: Results frame (compacted before writing)
+            subjects: Optional long subject table for the same students
+            batch, branch, college, semester, exam_month, exam_year: Fetch parameters
+
+        Returns:
+            Directory the slice was written to
+        """
+        directory = self._slice_dir(slice_key(batch, branch, college, semester, exam_month, exam_year))
+        frames = {RESULTS_TABLE: compact_results(df)}
+        if subjects is not None:
+            frames[SUBJECTS_TABLE] = subjects
+        with self._lock:
+            os.makedirs(directory, exist_ok=True)
+            for table in TABLES:
+                path = os.path.join(directory, f"{table}.parquet")
+                if table not in frames:
+                    if os.path.exists(path):
+                        os.remove(path)  # do not leave a stale table from an earlier save
+                    continue
+                tmp_path = f"{path}.tmp"
+                frames[table].to_parquet(tmp_path, index=False)
+                os.replace(tmp_path, path)
+        return directory
+
+    def find(self, **filters: FilterValue) -> List[Dict[str, str]]:
+        """
+        Lists stored slices whose partition values match `filters`, e.g.
+        find(batch=23, college=["110", "108"]). Only matching directories
+        are visited.
+        """
+        unknown = set(filters) - set(PARTITION_KEYS)
+        if unknown:
+            raise ValueError(f"Unknown partition key(s) {sorted(unknown)}, choose from {PARTITION_KEYS}")
+
+        found = []
+
+        def walk(directory: str, depth: int, key: Dict[str, str]):
+            if depth == len(PARTITION_KEYS):
+                if os.path.exists(os.path.join(directory, f"{RESULTS_TABLE}.parquet")):
+                    found.append(key)
+                return
+            name = PARTITION_KEYS[depth]
+            allowed = _allowed(filters.get(name))
+            try:
+                entries = sorted(os.listdir(directory))
+            except FileNotFoundError:
+                return
+            for entry in entries:
+                prefix, sep, value = entry.partition("=")
+                if sep and prefix == name and (allowed is None or value in allowed):
+                    walk(os.path.join(directory, entry), depth + 1, {**key, name: value})
+
+        walk(self.root, 0, {})
+        return found
+
+    def slices(self, **filters: FilterValue) -> pd.DataFrame:
+        """
+        Stored slices with their row count (read from the Parquet footer),
+        size on disk and save time.
+        """
+        rows = []
+        for key in self.find(**filters):
+            directory = self._slice_dir(key)
+            path = os.path.join(directory, f"{RESULTS_TABLE}.parquet")
+            size = sum(
+                os.path.getsize(os.path.join(directory, f"{table}.parquet"))
+                for table in TABLES
+                if os.path.exists(os.path.join(directory, f"{table}.parquet"))
+            )
+            rows.append({
+                **key,
+                "students": pq.read_metadata(path).num_rows,
+                "bytes": size,
+                "saved_at": pd.Timestamp.fromtimestamp(os.path.getmtime(path)),
+            })
+        return pd.DataFrame(rows, columns=PARTITION_KEYS + ["students", "bytes", "saved_at"])
+
+    def load_slices(
+        self,
+        keys: List[Dict[str, str]],
+        columns: Optional[List[str]] = None,
+        table: str = RESULTS_TABLE
+    ) -> pd.DataFrame:
+        """
+        Reads the given slices and stacks them.
+
+        Args:
+            keys: Slice keys as returned by `find`
+            columns: Columns to read; None reads all. Columns a slice does
+                not have (e.g. a sixth theory subject) are skipped for it.
+            table: "results" or "subjects"
+
+        Returns:
+            Compact results frame, or a subject table. Slices saved without
+            a subject table get theirs rebuilt from their results (subject
+            codes, ESE and IA missing).
+        """
+        if table not in TABLES:
+            raise ValueError(f"Unknown table '{table}', choose from {TABLES}")
+        frames = []
+        for key in keys:
+            path = os.path.join(self._slice_dir(key), f"{table}.parquet")
+            if not os.path.exists(path):
+                results_path = os.path.join(self._slice_dir(key), f"{RESULTS_TABLE}.parquet")
+                if table == SUBJECTS_TABLE and os.path.exists(results_path):
+                    rebuilt = subject_table_from_frame(pq.read_table(results_path).to_pandas())
+                    frames.append(rebuilt if columns is None else rebuilt[[c for c in columns if c in rebuilt.columns]])
+                continue
+            wanted = None
+            if columns is not None:
+                present = set(pq.read_schema(path).names)
+                wanted = [column for column in columns if column in present]
+            frames.append(pq.read_table(path, columns=wanted).to_pandas())
+
+        if table == SUBJECTS_TABLE:
+            return concat_subject_tables(frames)
+        if not frames:
+            return pd.DataFrame(columns=columns or [])
+        if len(frames) == 1:
+            return frames[0]
+        # Slices carry their own categories; compacting the stack re-derives them
+        return compact_results(pd.concat(frames, ignore_index=True))
+
+    def load(
+        self,
+        columns: Optional[List[str]] = None,
+        table: str = RESULTS_TABLE,
+        **filters: FilterValue
+    ) -> pd.DataFrame:
+        """
+        Reads every slice matching `filters`, e.g.
+        load(columns=["Registration No.", "Current SGPA"], batch=23, semester=3).
+        """
+        return self.load_slices(self.find(**filters), columns=columns, table=table)
+
+    def delete(self, **filters: FilterValue) -> int:
+        """Removes the matching slices; returns how many were removed."""
+        keys = self.find(**filters)
+        with self._lock:
+            for key in keys:
+                shutil.rmtree(self._slice_dir(key), ignore_errors=True)
+        return len(keys)
+
+
+_store: Optional[ResultStore] = None
+_store_lock = threading.Lock()
+
+
+def get_result_store() -> ResultStore:
+    """Returns the process-wide result store."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = ResultStore()
+        return _store
@@ -0,0 +1,227 @@
+"""
+Retry Policy Module - Backoff with jitter, retry budgets and a circuit breaker for the BEU API
+Author: Aditya Kumar
+"""
+
+import asyncio
+import random
+import threading
+import time
+from collections import deque
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+# HTTP statuses worth retrying: throttling and transient server errors
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+# Circuit breaker states
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+def is_client_error(status: int) -> bool:
+    """True for 4xx statuses a retry cannot fix (bad request, forbidden, not found)."""
+    return 400 <= status < 500 and status not in RETRYABLE_STATUSES
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parses a Retry-After header (seconds or HTTP date) into seconds from now."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with "full jitter": each retry waits a random time
+    between 0 and min(max_delay, base_delay * 2**attempt), so workers that
+    failed together do not retry together. A server-supplied Retry-After
+    wins when it is longer, capped at `max_retry_after`.
+    """
+
+    def __init__(
+        self,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        jitter: bool = True,
+        max_retry_after: float = 120.0
+    ):
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.max_retry_after = max_retry_after
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Seconds to wait before retry number `attempt` (0-based)."""
+        ceiling = min(self.max_delay, self.base_delay * (2 ** attempt))
+        wait = random.uniform(0, ceiling) if self.jitter else ceiling
+        if retry_after is not None:
+            wait = max(wait, min(retry_after, self.max_retry_after))
+        return wait
+
+
+class RetryBudget:
+    """
+    Caps retries for one run at `ratio` of the requests made so far (plus a
+    small floor), so a struggling server sees at most ~20% extra load
+    instead of every request being tripled.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_retries: int = 10):
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.requests = 0
+        self.retries = 0
+        self._lock = threading.Lock()
+
+    def record_request(self):
+        with self._lock:
+            self.requests += 1
+
+    def try_spend(self) -> bool:
+        """Takes one retry from the budget; False when it is exhausted."""
+        with self._lock:
+            if self.retries >= self.min_retries + self.ratio * self.requests:
+                return False
+            self.retries += 1
+            return True
+
+
+class CircuitBreaker:
+    """
+    Tracks the outcome of the last `window` requests to one host. When at
+    least `min_requests` have been seen and the error rate reaches
+    `error_threshold`, the breaker opens and every worker pauses for
+    `cooldown` seconds. Afterwards a single trial request is let through
+    (half-open); success closes the breaker, failure opens it again.
+    """
+
+    def __init__(
+        self,
+        window: int = 50,
+        error_threshold: float = 0.5,
+        min_requests: int = 20,
+        cooldown: float = 30.0
+    ):
+        self.window = window
+        self.error_threshold = error_threshold
+        self.min_requests = min_requests
+        self.cooldown = cooldown
+        self.state = CLOSED
+        self.opened_until = 0.0
+        self.times_opened = 0
+        self._outcomes = deque(maxlen=window)
+        self._trial_started: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def error_rate(self) -> float:
+        with self._lock:
+            return self._error_rate_locked()
+
+    def _error_rate_locked(self) -> float:
+        if not self._outcomes:
+            return 0.0
+        return self._outcomes.count(False) / len(self._outcomes)
+
+    def _open_locked(self):
+        self.state = OPEN
+        self.opened_until = time.monotonic() + self.cooldown
+        self.times_opened += 1
+        self._trial_started = None
+
+    def wait_time(self) -> float:
+        """Seconds the caller must wait before sending; 0 means go ahead."""
+        with self._lock:
+            if self.state == CLOSED:
+                return 0.0
+            now = time.monotonic()
+            if self.state == OPEN:
+                if now < self.opened_until:
+                    return self.opened_until - now
+                self.state = HALF_OPEN
+            # A trial that never reported back (e.g. cancelled) is abandoned after one cooldown
+            if self._trial_started is None or now - self._trial_started > self.cooldown:
+                self._trial_started = now
+                return 0.0
+            return 1.0  # someone else is running the trial; check back shortly
+
+    def wait_sync(self):
+        """Blocks the calling thread while the breaker is open."""
+        while True:
+            wait = self.wait_time()
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+    async def wait_async(self):
+        """Suspends the calling coroutine while the breaker is open."""
+        while True:
+            wait = self.wait_time()
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    def record_success(self):
+        with self._lock:
+            self._outcomes.append(True)
+            if self.state == HALF_OPEN:
+                self.state = CLOSED
+                self._trial_started = None
+                self._outcomes.clear()
+
+    def record_failure(self):
+        with self._lock:
+            self._outcomes.append(False)
+            if self.state == HALF_OPEN:
+                self._open_locked()
+            elif (
+                self.state == CLOSED
+                and len(self._outcomes) >= self.min_requests
+                and self._error_rate_locked() >= self.error_threshold
+            ):
+                self._open_locked()
+
+    def snapshot(self) -> Dict:
+        """State summary for display."""
+        with self._lock:
+            return {
+                "state": self.state,
+                "error_rate": self._error_rate_locked(),
+                "recent_requests": len(self._outcomes),
+                "paused_for": max(0.0, self.opened_until - time.monotonic()) if self.state == OPEN else 0.0,
+                "times_opened": self.times_opened,
+            }
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(url: str) -> CircuitBreaker:
+    """Returns the process-wide breaker for the host of `url`."""
+    host = urlsplit(url).netloc
+    with _breakers_lock:
+        breaker = _breakers.get(host)
+        if breaker is None:
+            breaker = CircuitBreaker()
+            _breakers[host] = breaker
+        return breaker
+
+
+def breaker_snapshots() -> Dict[str, Dict]:
+    """Snapshot of every host's breaker, for the UI."""
+    with _breakers_lock:
+        breakers = dict(_breakers)
+    return {host: breaker.snapshot() for host, breaker in breakers.items()}
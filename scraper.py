@@ -1,79 +1,165 @@
 import requests
-from bs4 import BeautifulSoup
 import time
-from concurrent.futures import ThreadPoolExecutor
+import os
+import queue
+import threading
+import multiprocessing
+from concurrent.futures import Future, ThreadPoolExecutor, ProcessPoolExecutor
 import pandas as pd
+from result_cache import get_result_cache
+from rate_limit import get_host_bucket
+from html_parsers import try_parse_result_page, DEFAULT_PARSER
 
-def fetch_and_parse_result(session, base_url, registration_no, retries=5, backoff_factor=1):
-    """Fetches and parses a single student's result using a shared session object."""
-    url = f"{base_url}{registration_no}"
-    
-    # Add a polite delay to avoid overwhelming the server
-    time.sleep(1)
+# Old pacing was 4 workers each sleeping 1 s per request; keep the same request rate
+DEFAULT_RATE = 4.0
 
+# Below this many pages, starting worker processes costs more than parsing inline
+PROCESS_PARSE_THRESHOLD = 50
+
+# Worker processes are started from a clean server process, not forked from
+# the (multi-threaded) Streamlit process
+PARSE_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/109.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.9',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Connection': 'keep-alive',
+}
+
+def fetch_page(session, url, bucket, retries=5, backoff_factor=1):
+    """Downloads one result page and returns its HTML, or None if every attempt failed.
+    Requests are paced by the shared per-host token bucket instead of a fixed sleep."""
     for attempt in range(retries):
+        bucket.acquire()
         try:
-            # Use the session to make the request, which includes headers
             response = session.get(url, timeout=15)
-            response.raise_for_status()  # Raise an error for bad status codes (4xx or 5xx)
-
-            soup = BeautifulSoup(response.text, "html.parser")
-            
-            # Check if student name exists to validate the page
-            student_name_tag = soup.select_one("#ContentPlaceHolder1_DataList1_StudentNameLabel_0")
-            if not student_name_tag:
-                print(f"No valid data found for Registration No: {registration_no}")
-                return None
-
-            result = {
-                "Registration No.": soup.select_one("#ContentPlaceHolder1_DataList1_RegistrationNoLabel_0").text.strip(),
-                "Student Name": student_name_tag.text.strip(),
-                "Father's Name": soup.select_one("#ContentPlaceHolder1_DataList1_FatherNameLabel_0").text.strip(),
-                "Mother's Name": soup.select_one("#ContentPlaceHolder1_DataList1_MotherNameLabel_0").text.strip(),
-                "Current SGPA": soup.select_one("#ContentPlaceHolder1_DataList5_GROSSTHEORYTOTALLabel_0").text.strip()
-            }
-            table = soup.select_one("#ContentPlaceHolder1_GridView3")
-            if table:
-                headers = [th.text.strip() for th in table.select("tr")[0].find_all("th")]
-                values = [td.text.strip() for td in table.select("tr")[1].find_all("td")]
-                for header, value in zip(headers, values):
-                    result[f"Sem {header}"] = value
-            return result
-        
-        except (requests.exceptions.RequestException, AttributeError) as e:
-            print(f"Attempt {attempt + 1} failed for {registration_no} - {e}")
+            response.raise_for_status()
+            return response.text
+        except requests.exceptions.RequestException as e:
+            print(f"Attempt {attempt + 1} failed for {url} - {e}")
             if attempt < retries - 1:
                 time.sleep(backoff_factor * (2 ** attempt)) # Exponential backoff
-            else:
-                print(f"All retries failed for Registration No: {registration_no}.")
-                return None
+    print(f"All retries failed for {url}.")
+    return None
 
-def fetch_all_results(base_url, start_reg, end_reg):
-    """Fetches all results using a thread pool and a single, shared session."""
-    results = []
-    
-    # Headers to mimic a real browser
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/109.0.0.0 Safari/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.9',
-        'Accept-Language': 'en-US,en;q=0.9',
-        'Connection': 'keep-alive',
-    }
+def fetch_all_results(base_url, start_reg, end_reg, parser=DEFAULT_PARSER, io_workers=4, parse_workers=None,
+                      rate=DEFAULT_RATE, queue_size=64, retries=5, backoff_factor=1):
+    """Fetches all results with a two-stage pipeline and a single, shared session.
+
+    Stage 1: `io_workers` threads download raw HTML into a bounded queue (they
+    block when parsing falls behind). Stage 2: pages are parsed on a process
+    pool of `parse_workers` processes (default: all cores), so parsing is not
+    limited by the GIL. Short ranges, or parse_workers=0, parse inline.
+    Half-loaded pages are downloaded again, up to `retries` times.
+    Results are returned in registration number order."""
+    reg_numbers = list(range(start_reg, end_reg + 1))
+    results = {}
+    page_attempts = dict.fromkeys(reg_numbers, 0)
+    pages = queue.Queue(maxsize=queue_size)
+    stop = threading.Event()
+    bucket = get_host_bucket(base_url, rate)
+
+    use_processes = parse_workers != 0 and len(reg_numbers) >= PROCESS_PARSE_THRESHOLD
+    parse_pool = ProcessPoolExecutor(parse_workers or os.cpu_count(), mp_context=PARSE_CONTEXT) if use_processes else None
 
     # Create one session object for all requests
-    with requests.Session() as session:
-        session.headers.update(headers) # Add headers to the session
-
-        # Use a safe number of workers
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            # Pass the session object to each thread
-            futures = [executor.submit(fetch_and_parse_result, session, base_url, reg_no) 
-                       for reg_no in range(start_reg, end_reg + 1)]
-            
-            for future in futures:
-                result = future.result()
-                if result:
-                    results.append(result)
+    with requests.Session() as session, ThreadPoolExecutor(max_workers=io_workers) as io_pool:
+        session.headers.update(HEADERS) # Add headers to mimic a real browser
+
+        def hand_over(item):
+            # Blocking put that gives up once the consumer has stopped, so no thread hangs on a full queue
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.5)
+                    return
+                except queue.Full:
+                    continue
+
+        def download(reg_no, delay=0):
+            if delay:
+                time.sleep(delay)
+            if stop.is_set():
+                return
+            try:
+                html = fetch_page(session, f"{base_url}{reg_no}", bucket, retries, backoff_factor)
+            except Exception as e:
+                # Anything escaping here would stay in the unread future and the
+                # consumer would wait for this page forever; report it as a failure
+                print(f"Download failed for {reg_no} - {e}")
+                html = None
+            hand_over((reg_no, html))
+
+        for reg_no in reg_numbers:
+            io_pool.submit(download, reg_no)
+
+        try:
+            # Each queue item is (reg_no, html) from stage 1, or (reg_no, Future) once stage 2 is done
+            remaining = len(reg_numbers)
+            while remaining:
+                reg_no, item = pages.get()
+                if item is None:
+                    remaining -= 1  # download failed for good
+                    continue
+                if isinstance(item, Future):
+                    result, complete = item.result()
+                elif parse_pool is not None:
+                    parse_pool.submit(try_parse_result_page, item, parser).add_done_callback(
+                        lambda future, reg_no=reg_no: hand_over((reg_no, future))
+                    )
+                    continue
+                else:
+                    result, complete = try_parse_result_page(item, parser)
+
+                if not complete:
+                    page_attempts[reg_no] += 1
+                    print(f"Attempt {page_attempts[reg_no]} failed for {reg_no} - incomplete page")
+                    if page_attempts[reg_no] < retries:
+                        io_pool.submit(download, reg_no, backoff_factor * (2 ** (page_attempts[reg_no] - 1)))
+                        continue
+                    print(f"All retries failed for Registration No: {reg_no}.")
+                elif result is None:
+                    print(f"No valid data found for Registration No: {reg_no}")
+                else:
+                    results[reg_no] = result
+                remaining -= 1
+        finally:
+            stop.set()
+            io_pool.shutdown(wait=False, cancel_futures=True)
+            if parse_pool is not None:
+                parse_pool.shutdown(wait=True, cancel_futures=True)
+
+    return [results[reg_no] for reg_no in reg_numbers if reg_no in results]
+
+def discover_lateral_results(base_url, first_reg_no, batch, branch, college, miss_streak=5, window=5, use_cache=True):
+    """Fetches LE results upward from `first_reg_no` (the ...901 number) until
+    `miss_streak` consecutive numbers have no result. The highest LE number found
+    is cached per (batch, branch, college), so later runs fetch up to it directly.
+    With use_cache=False the cached bound is neither read nor updated."""
+    cache = get_result_cache() if use_cache else None
+    known = (cache.get_le_bound(batch, branch, college) if cache is not None else None) or 900
+    base = first_reg_no - 901  # registration number with the student part zeroed
+    results = []
+
+    if known >= 901:
+        results += fetch_all_results(base_url, base + 901, base + known)
+
+    streak = 0
+    start = max(known, 900) + 1
+    while start <= 999 and streak < miss_streak:
+        end = min(start + window - 1, 999)
+        found = fetch_all_results(base_url, base + start, base + end)
+        results += found
+        found_numbers = {int(r["Registration No."][-3:]) for r in found}
+        for number in range(start, end + 1):
+            streak = 0 if number in found_numbers else streak + 1
+        start = end + 1
+
+    found_numbers = [int(r["Registration No."][-3:]) for r in results]
+    if cache is not None and found_numbers and max(found_numbers) > known:
+        cache.set_le_bound(batch, branch, college, max(found_numbers))
     return results
 
 # Your sorting functions remain exactly the same
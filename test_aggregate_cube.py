@@ -0,0 +1,79 @@
+"""Cube roll-ups must match plain groupbys over the student rows."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from aggregate_cube import build_cube, rollup
+from benchmarks.synthetic import make_cohort
+from data_processor import compact_results, normalize_results
+from enhanced_analytics import compute_group_stats, compute_pass_fail
+
+
+@pytest.fixture(scope="module", params=["plain", "compact"])
+def df(request):
+    frame = normalize_results(make_cohort(1200) + make_cohort(300, college="108", semester="V"))
+    frame.loc[::17, "Current SGPA"] = np.nan  # SGPA that did not parse
+    frame.loc[::29, "CGPA"] = np.nan
+    return compact_results(frame) if request.param == "compact" else frame
+
+
+def baseline(df, by):
+    passed = df["Status"] == "PASS"
+    frame = df.assign(Passed=passed.astype(int), Failed=(df["Status"] == "FAIL").astype(int))
+    grouped = frame.groupby(by, observed=True)
+    expected = pd.DataFrame({
+        "Students": grouped.size(),
+        "Passed": grouped["Passed"].sum(),
+        "Failed": grouped["Failed"].sum(),
+        "Avg SGPA": grouped["Current SGPA"].mean(),
+        "Max SGPA": grouped["Current SGPA"].max(),
+        "Min SGPA": grouped["Current SGPA"].min(),
+        "Avg CGPA": grouped["CGPA"].mean(),
+    })
+    expected["Pass Rate %"] = expected["Passed"] / expected["Students"] * 100
+    return expected.reset_index()
+
+
+@pytest.mark.parametrize("by", [["College Name"], ["Course"], ["College Name", "Semester"], ["Semester", "Status"]])
+def test_rollup_matches_groupby(df, by):
+    rolled = rollup(build_cube(df), by)
+    expected = baseline(df, by)
+    columns = by + ["Students", "Passed", "Failed", "Pass Rate %", "Avg SGPA", "Max SGPA", "Min SGPA", "Avg CGPA"]
+    assert_frame_equal(
+        rolled[columns].sort_values(by).reset_index(drop=True),
+        expected[columns].sort_values(by).reset_index(drop=True),
+        check_dtype=False, check_categorical=False
+    )
+
+
+def test_cube_is_small_and_totals_match(df):
+    cube = build_cube(df)
+    assert len(cube) < 20
+    totals = rollup(cube).iloc[0]
+    assert totals["Students"] == len(df)
+    assert totals["Passed"] == (df["Status"] == "PASS").sum()
+    assert totals["Avg SGPA"] == pytest.approx(df["Current SGPA"].mean())
+    assert totals["Min CGPA"] == df["CGPA"].min()
+
+
+def test_missing_status_is_counted_but_not_grouped():
+    frame = normalize_results(make_cohort(20))
+    frame["Status"] = frame["Status"].where(frame.index >= 3, None)
+    cube = build_cube(frame)
+    assert rollup(cube)["Students"].iloc[0] == 20
+    assert rollup(cube, ["Status"])["Students"].sum() == 17
+    assert rollup(cube, ["Status"], dropna=False)["Students"].sum() == 20
+
+
+def test_analytics_helpers_read_the_cube(df):
+    cube = build_cube(df)
+    stats = compute_group_stats(cube, "College Name")
+    expected = baseline(df, ["College Name"]).sort_values("Avg SGPA", ascending=False)
+    assert stats["College Name"].tolist() == expected["College Name"].tolist()
+    assert stats["Total Students"].tolist() == expected["Students"].tolist()
+
+    summary = compute_pass_fail(cube)
+    assert summary["passed"] == (df["Status"] == "PASS").sum()
+    assert summary["pass_rate"] == pytest.approx((df["Status"] == "PASS").mean() * 100)
@@ -0,0 +1,72 @@
+"""The asyncio fetch engine against the mock API, and the per-host token bucket."""
+
+import asyncio
+import time
+
+import pytest
+
+import rate_limit
+from api_scraper import fetch_semester_results, fetch_semester_results_async
+from benchmarks.mock_beu_api import MockBEUServer
+from rate_limit import TokenBucket, get_host_bucket
+
+COMMON = dict(reg_start=1, reg_end=12, branch="105", college="110", semester=3, batch=23, use_cache=False)
+
+
+def registrations(results):
+    return sorted(str(payload["redg_no"]) for payload in results)
+
+
+@pytest.fixture
+def server():
+    with MockBEUServer(latency=0.01, max_student=10, max_lateral=903) as mock:
+        yield mock
+
+
+def test_same_students_as_threaded_engine(server):
+    threaded = fetch_semester_results(**COMMON, include_lateral=True, max_workers=8, base_url=server.result_url)
+    fetched = asyncio.run(fetch_semester_results_async(
+        **COMMON, include_lateral=True, rate_per_host=500, base_url=server.result_url
+    ))
+    assert registrations(fetched) == registrations(threaded)
+    assert len(fetched) == 13  # 10 regular + LE 901-903
+
+
+def test_skip_registrations_and_progress(server):
+    progress = []
+    fetched = asyncio.run(fetch_semester_results_async(
+        **COMMON, rate_per_host=500, base_url=server.result_url,
+        skip_registrations={"23105110001", "23105110002"},
+        on_progress=lambda done, total: progress.append((done, total))
+    ))
+    assert registrations(fetched) == [f"23105110{n:03d}" for n in range(3, 11)]
+    assert server.requests_served == 10  # the two held students are not requested
+    assert progress[-1] == (12, 12) and len(progress) == 12
+
+
+def test_rate_per_host_bounds_throughput(server):
+    start = time.perf_counter()
+    asyncio.run(fetch_semester_results_async(
+        **COMMON, rate_per_host=10, max_concurrency=50, base_url=server.result_url
+    ))
+    # A burst of 10 tokens, then 10 per second for the remaining 2 requests
+    assert time.perf_counter() - start >= 0.15
+
+
+def test_token_bucket_waits_once_the_burst_is_spent():
+    bucket = TokenBucket(rate=50, burst=2)
+    start = time.perf_counter()
+    for _ in range(7):
+        bucket.acquire()
+    assert time.perf_counter() - start >= 0.09  # 5 tokens at 50/s
+
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+
+def test_host_bucket_is_shared_until_the_rate_changes(monkeypatch):
+    monkeypatch.setattr(rate_limit, "_buckets", {})
+    bucket = get_host_bucket("http://beu.example/a", 5)
+    assert get_host_bucket("http://beu.example/b?x=1", 5) is bucket
+    assert get_host_bucket("http://other.example/a", 5) is not bucket
+    assert get_host_bucket("http://beu.example/a", 8).rate == 8.0
@@ -0,0 +1,64 @@
+"""Checkpointing and resuming of the bulk sweep."""
+
+import json
+
+import pytest
+
+import api_scraper
+from benchmarks.mock_beu_api import MockBEUServer
+from bulk_sweep import SweepCheckpoint, parse_args, run_sweep, sweep_session
+from retry_policy import RetryPolicy
+
+UNREACHABLE = "http://127.0.0.1:9/backend/v1/result/get-result"
+
+
+@pytest.fixture(autouse=True)
+def quick_retries(monkeypatch):
+    monkeypatch.setattr(api_scraper, "DEFAULT_RETRY_POLICY", RetryPolicy(base_delay=0.01, max_delay=0.01))
+
+
+def sweep(tmp_path, base_url, *extra):
+    args = parse_args([
+        "--batch", "23", "--semester", "3", "--colleges", "110", "--branches", "105",
+        "--checkpoint", str(tmp_path / "checkpoint.jsonl"), "--output", str(tmp_path / "results.jsonl"),
+        "--base-url", base_url, "--no-cache", "--report-every", "0.05", "--workers", "1", *extra,
+    ])
+    run_sweep(args)
+    return args
+
+
+def checkpoint_lines(tmp_path):
+    with open(tmp_path / "checkpoint.jsonl", encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def found_registrations(tmp_path):
+    with open(tmp_path / "results.jsonl", encoding="utf-8") as f:
+        return sorted(json.loads(line)["redg_no"] for line in f)
+
+
+def test_failed_class_is_retried_on_resume(tmp_path):
+    args = sweep(tmp_path, UNREACHABLE, "--reg-end", "2", "--no-lateral")
+    lines = checkpoint_lines(tmp_path) if (tmp_path / "checkpoint.jsonl").exists() else []
+    assert not any(line.get("class_done") or line.get("segment_done") for line in lines)
+    assert not SweepCheckpoint(args.checkpoint).is_finished(sweep_session(args), "110", "105")
+
+    with MockBEUServer(latency=0, max_student=2) as server:
+        sweep(tmp_path, server.result_url, "--reg-end", "2", "--no-lateral")
+        assert server.requests_served >= 2
+    assert found_registrations(tmp_path) == [23105110001, 23105110002]
+    assert any(line.get("class_done") for line in checkpoint_lines(tmp_path))
+
+
+def test_finished_class_is_skipped_and_other_sessions_are_not(tmp_path):
+    # The regular range 899-902 overlaps the LE numbers; the mock answers 901-902 for both batches
+    options = ("--reg-start", "899", "--reg-end", "902", "--le-miss-streak", "1")
+    with MockBEUServer(latency=0, max_student=2, max_lateral=902) as server:
+        sweep(tmp_path, server.result_url, *options)
+        first = server.requests_served
+        sweep(tmp_path, server.result_url, *options)
+        assert server.requests_served == first  # nothing left to do
+        sweep(tmp_path, server.result_url, *options, "--exam-month", "December")
+        assert server.requests_served > first  # another exam session is a separate sweep
+    # LE discovery is not cut short by the regular pass's records for 901-902
+    assert found_registrations(tmp_path).count(24105110901) == 2
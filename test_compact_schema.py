@@ -0,0 +1,61 @@
+"""The compact results schema: dtypes, unchanged values, and a lossless store round trip."""
+
+import numpy as np
+from pandas.testing import assert_frame_equal
+
+from benchmarks.synthetic import make_cohort
+from data_processor import RESULT_CATEGORY_COLUMNS, compact_results, memory_report, normalize_results
+from result_store import ResultStore
+
+SESSION = dict(batch=23, branch="105", college="110", semester=3, exam_month="July", exam_year=2025)
+
+
+def cohort_frame(n=950):
+    return normalize_results(make_cohort(n))  # NULL marks, LE numbers with NULL SGPA/CGPA
+
+
+def test_schema():
+    compact = compact_results(cohort_frame())
+    for column in RESULT_CATEGORY_COLUMNS + ["Theory_1_Name", "Practical_2_Grade"]:
+        assert compact[column].dtype.name == "category", column
+    for column in ("Total Subjects", "Theory Subjects", "Practical Subjects"):
+        assert compact[column].dtype == np.int8
+    assert compact["Theory_1_Total"].dtype.name == "Int16"
+    assert compact["Theory_1_Credit"].dtype == np.float32
+    assert compact["Current SGPA"].dtype == np.float64 and compact["CGPA"].dtype == np.float64
+
+
+def test_values_are_unchanged():
+    df = cohort_frame()
+    compact = compact_results(df)
+    assert list(compact.columns) == list(df.columns)
+    for column in df.columns:
+        original, converted = df[column], compact[column]
+        if column.endswith("_Credit"):
+            np.testing.assert_allclose(converted.astype(float), original.astype(float), rtol=1e-6)
+        elif column.endswith("_Total"):
+            assert converted.astype("Float64").equals(original.astype("Float64")), column
+        else:
+            assert converted.astype(object).where(converted.notna(), None).tolist() == \
+                original.astype(object).where(original.notna(), None).tolist(), column
+
+
+def test_compacting_twice_changes_nothing():
+    compact = compact_results(cohort_frame(200))
+    assert_frame_equal(compact_results(compact), compact)
+
+
+def test_memory_report_shows_the_saving():
+    df = cohort_frame()
+    compact = compact_results(df)
+    report = memory_report(compact, baseline=df)
+    assert list(report.columns) == ["Dtype", "Bytes", "Baseline Dtype", "Baseline Bytes", "Saved %"]
+    assert report["Bytes"].sum() < report["Baseline Bytes"].sum() / 2
+    assert report.loc["College Name", "Saved %"] > 90
+
+
+def test_store_round_trip_keeps_the_schema(tmp_path):
+    compact = compact_results(cohort_frame())
+    store = ResultStore(str(tmp_path))
+    store.save(compact, **SESSION)
+    assert_frame_equal(store.load(), compact)
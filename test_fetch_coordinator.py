@@ -0,0 +1,157 @@
+"""Request coalescing and the outbound cap of the fetch coordinator."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from fetch_coordinator import FetchCoordinator, OutboundLimit
+
+
+def test_identical_lookups_are_coalesced():
+    coordinator = FetchCoordinator()
+    calls = []
+    release = threading.Event()
+
+    def fetch():
+        calls.append(1)
+        release.wait(5)
+        return "payload"
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [pool.submit(coordinator.run, "url-1", fetch) for _ in range(8)]
+        while coordinator.stats()["coalesced"] < 7:
+            time.sleep(0.01)
+        release.set()
+        outcomes = [future.result(5) for future in futures]
+
+    assert outcomes == ["payload"] * 8
+    assert len(calls) == 1
+    stats = coordinator.stats()
+    assert (stats["lookups"], stats["coalesced"], stats["in_flight"]) == (1, 7, 0)
+
+
+def test_errors_are_shared_and_not_remembered():
+    coordinator = FetchCoordinator()
+
+    def failing():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        coordinator.run("url", failing)
+    assert coordinator.run("url", lambda: "ok") == "ok"  # a later lookup sends again
+    assert coordinator.stats()["lookups"] == 2
+
+
+def test_different_keys_are_not_coalesced():
+    coordinator = FetchCoordinator()
+    assert [coordinator.run(key, lambda key=key: key) for key in ("a", "b", "a")] == ["a", "b", "a"]
+    assert coordinator.stats()["coalesced"] == 0
+
+
+def test_async_coalescing_and_cancelled_leader():
+    coordinator = FetchCoordinator()
+    calls = []
+
+    async def slow():
+        calls.append(1)
+        await asyncio.sleep(10)
+
+    async def quick():
+        calls.append(1)
+        await asyncio.sleep(0.01)  # still in flight when the other waiters retry
+        return "payload"
+
+    async def main():
+        leader = asyncio.create_task(coordinator.run_async("url", slow))
+        await asyncio.sleep(0.01)
+        waiters = [asyncio.create_task(coordinator.run_async("url", quick)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        leader.cancel()  # a waiter takes over and makes the request itself
+        return await asyncio.gather(*waiters)
+
+    assert asyncio.run(main()) == ["payload"] * 3
+    assert len(calls) == 2
+
+
+def test_outbound_limit_caps_threads():
+    limit = OutboundLimit(3)
+    active = peak = 0
+    lock = threading.Lock()
+
+    def request():
+        nonlocal active, peak
+        with limit.slot():
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.01)
+            with lock:
+                active -= 1
+
+    with ThreadPoolExecutor(max_workers=12) as pool:
+        list(pool.map(lambda _: request(), range(36)))
+    assert peak == 3
+    assert limit.active == 0
+
+
+def test_outbound_limit_shared_by_threads_and_event_loops():
+    limit = OutboundLimit(2)
+    active = peak = 0
+    lock = threading.Lock()
+
+    def enter():
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+
+    def leave():
+        nonlocal active
+        with lock:
+            active -= 1
+
+    async def coroutine_requests():
+        async def one():
+            async with limit.slot_async():
+                enter()
+                await asyncio.sleep(0.01)
+                leave()
+        await asyncio.gather(*(one() for _ in range(10)))
+
+    def thread_request():
+        with limit.slot():
+            enter()
+            time.sleep(0.01)
+            leave()
+
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        loops = [pool.submit(asyncio.run, coroutine_requests()) for _ in range(2)]
+        threads = [pool.submit(thread_request) for _ in range(10)]
+        for future in loops + threads:
+            future.result(10)
+    assert peak == 2
+    assert limit.active == 0
+
+
+def test_cancelled_async_waiter_gives_its_slot_back():
+    limit = OutboundLimit(1)
+
+    async def main():
+        await limit.acquire_async()
+        waiter = asyncio.create_task(limit.acquire_async())
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        limit.release()
+
+    asyncio.run(main())
+    assert limit.active == 0
+
+
+def test_limit_must_be_positive():
+    with pytest.raises(ValueError):
+        OutboundLimit(0)
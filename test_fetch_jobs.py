@@ -0,0 +1,85 @@
+"""Background fetch jobs: running, merging into the saved slice, and cancellation."""
+
+import time
+
+import pytest
+
+import result_store
+from benchmarks.mock_beu_api import MockBEUServer
+from fetch_jobs import CANCELLED, DONE, RUNNING, FetchJobManager
+from result_store import ResultStore, slice_key
+
+CLASS = dict(branch="105", college="110", semester=3, batch=23, exam_month="July", exam_year=2025)
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    temporary = ResultStore(str(tmp_path))
+    monkeypatch.setattr(result_store, "_store", temporary)
+    return temporary
+
+
+@pytest.fixture
+def server():
+    with MockBEUServer(latency=0, max_student=6) as mock:
+        yield mock
+
+
+def submit(manager, server, reg_start, reg_end, **options):
+    params = dict(
+        reg_start=reg_start, reg_end=reg_end, **CLASS, include_lateral=False, use_cache=False,
+        probe=False, miss_streak=25, merge_saved=False, base_url=server.result_url
+    )
+    return manager.submit(f"{reg_start}-{reg_end}", **{**params, **options})
+
+
+def wait_for(manager, job_id, *statuses, timeout=30.0):
+    deadline = time.monotonic() + timeout
+    while manager.get(job_id).status not in statuses:
+        assert time.monotonic() < deadline, f"job stuck in {manager.get(job_id).status}"
+        time.sleep(0.02)
+    return manager.get(job_id)
+
+
+def saved(store):
+    keys = store.find(**slice_key(**CLASS))
+    return store.load_slices(keys) if keys else None
+
+
+def test_job_fetches_and_saves(store, server):
+    manager = FetchJobManager()
+    job = wait_for(manager, submit(manager, server, 1, 4), DONE)
+    assert job.found == 4 and len(job.df) == 4 and job.fraction == 1.0
+    assert saved(store)["Registration No."].tolist() == job.df["Registration No."].tolist()
+    assert len(job.subjects) > 0
+
+
+def test_merge_only_fetches_missing_students(store, server):
+    manager = FetchJobManager()
+    wait_for(manager, submit(manager, server, 1, 3), DONE)
+    before = server.requests_served
+
+    job = wait_for(manager, submit(manager, server, 1, 6, merge_saved=True), DONE)
+    assert server.requests_served - before == 3  # students 1-3 were already saved
+    assert job.found == 3 and len(job.df) == 6
+    merged = saved(store)
+    assert len(merged) == 6 and not merged["Registration No."].duplicated().any()
+    assert set(job.subjects["Registration No."]) == set(merged["Registration No."])
+
+
+def test_cancel_running_and_queued_jobs(store):
+    manager = FetchJobManager(max_workers=1)
+    with MockBEUServer(latency=0.05, max_student=200) as slow:
+        running = submit(manager, slow, 1, 200)
+        queued = submit(manager, slow, 1, 5)
+        wait_for(manager, running, RUNNING)
+
+        assert manager.cancel(queued)
+        assert manager.get(queued).status == CANCELLED
+        assert manager.cancel(running)
+        job = wait_for(manager, running, CANCELLED)
+
+    assert job.message.startswith("Cancelled after") and job.df is None
+    assert manager.get(queued).started_at is None  # never ran
+    assert saved(store) is None  # a cancelled job keeps nothing
+    assert not manager.cancel(running) and not manager.cancel("no-such-job")
@@ -0,0 +1,50 @@
+"""FilterIndex queries must select the same rows as filter_dataframe / sort_dataframe."""
+
+import numpy as np
+import pytest
+
+from benchmarks.synthetic import make_cohort
+from data_processor import compact_results, filter_dataframe, normalize_results, sort_dataframe
+from filter_index import SORT_COLUMNS, FilterIndex
+
+# Three colleges (999 numbers each) with LE students, whose SGPA may be missing
+DF = compact_results(normalize_results(make_cohort(2500)))
+INDEX = FilterIndex(DF)
+COLLEGES = INDEX.values("College Name")
+
+
+@pytest.mark.parametrize("college, status, sgpa_min, sgpa_max", [
+    (None, None, None, None),
+    (COLLEGES[1], None, None, None),
+    (None, "FAIL", None, None),
+    (COLLEGES[0], "PASS", 6.0, 8.5),
+    (None, None, 9.0, 9.0),
+    (COLLEGES[2], "PASS", 11.0, 12.0),  # nothing matches
+])
+def test_query_matches_filter_dataframe(college, status, sgpa_min, sgpa_max):
+    expected = filter_dataframe(DF, college=college, status=status, sgpa_min=sgpa_min, sgpa_max=sgpa_max)
+    sgpa_range = None
+    if sgpa_min is not None:
+        sgpa_range = (sgpa_min, sgpa_max)
+    positions = INDEX.query(
+        colleges=[college] if college else None,
+        statuses=[status] if status else None,
+        sgpa_range=sgpa_range
+    )
+    np.testing.assert_array_equal(positions, expected.index.to_numpy())
+
+
+def test_several_values_per_column():
+    positions = INDEX.query(colleges=COLLEGES[:2], statuses=["PASS", "FAIL"])
+    expected = DF.index[DF["College Name"].isin(COLLEGES[:2]) & DF["Status"].isin(["PASS", "FAIL"])]
+    np.testing.assert_array_equal(positions, expected.to_numpy())
+
+
+@pytest.mark.parametrize("sort_by", sorted(SORT_COLUMNS))
+def test_sort_matches_sort_dataframe(sort_by):
+    column = SORT_COLUMNS[sort_by][0]
+    expected = sort_dataframe(filter_dataframe(DF, status="PASS"), sort_by)
+    result = INDEX.take(INDEX.query(statuses=["PASS"], sort_by=sort_by))
+    # Rows with equal keys may come in either order; the key sequence and the row set must agree
+    assert result[column].astype(object).tolist() == expected[column].astype(object).tolist()
+    assert sorted(result["Registration No."]) == sorted(expected["Registration No."])
@@ -0,0 +1,61 @@
+"""Content fingerprints, the bounded LRU cache and the memoized analytics built on them."""
+
+import pytest
+
+import enhanced_analytics
+from benchmarks.synthetic import make_cohort
+from data_processor import normalize_results
+from enhanced_analytics import get_cube
+from frame_cache import LRUCache, frame_fingerprint
+
+
+@pytest.fixture
+def df():
+    return normalize_results(make_cohort(100))
+
+
+@pytest.fixture
+def analytics_cache(monkeypatch):
+    cache = LRUCache(max_entries=8)
+    monkeypatch.setattr(enhanced_analytics, "_analytics_cache", cache)
+    return cache
+
+
+def test_fingerprint_follows_content(df):
+    copy = df.copy()
+    assert frame_fingerprint(copy) == frame_fingerprint(df)
+
+    copy.loc[0, "Current SGPA"] = 1.0
+    changed = copy.copy()  # a new object: fingerprints are remembered per frame object
+    assert frame_fingerprint(changed) != frame_fingerprint(df)
+    assert frame_fingerprint(changed, ["Student Name", "Status"]) == frame_fingerprint(df, ["Student Name", "Status"])
+
+
+def test_fingerprint_ignores_absent_columns(df):
+    assert frame_fingerprint(df, ["Status", "No Such Column"]) == frame_fingerprint(df, ["Status"])
+
+
+def test_lru_evicts_least_recently_used():
+    cache = LRUCache(max_entries=2)
+    cache.get_or_compute("a", lambda: 1)
+    cache.get_or_compute("b", lambda: 2)
+    assert cache.get_or_compute("a", lambda: None) == 1  # "a" is now the most recent
+    cache.get_or_compute("c", lambda: 3)
+
+    assert cache.get_or_compute("b", lambda: "recomputed") == "recomputed"
+    assert cache.stats() == {"entries": 2, "hits": 1, "misses": 4}
+
+
+def test_analytics_are_computed_once_per_content(df, analytics_cache):
+    cube = get_cube(df)
+    assert get_cube(df) is cube
+    assert get_cube(df.copy()) is cube  # same content, new object (e.g. after a rerun)
+    assert analytics_cache.stats()["misses"] == 1
+
+    other = df.copy()
+    other["Father's Name"] = "SOMEONE ELSE"  # not read by any aggregate
+    assert get_cube(other) is cube
+
+    other.loc[0, "Status"] = "FAIL" if df.loc[0, "Status"] == "PASS" else "PASS"
+    assert get_cube(other.copy()) is not cube
+    assert analytics_cache.stats()["misses"] == 2
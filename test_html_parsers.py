@@ -0,0 +1,38 @@
+"""Every HTML parser backend must read legacy result pages the same way."""
+
+import pytest
+
+from benchmarks.synthetic import make_missing_page, make_result_page
+from html_parsers import PARSERS, parse_result_page, try_parse_result_page
+
+PAGES = [make_result_page(f"23105110{number:03d}", semesters) for number, semesters in ((1, 3), (42, 1), (905, 8))]
+
+
+@pytest.mark.parametrize("parser", sorted(PARSERS))
+def test_backends_agree(parser):
+    for page in PAGES:
+        assert parse_result_page(page, parser) == parse_result_page(page, "bs4")
+
+
+def test_reference_values():
+    result = parse_result_page(PAGES[0], "bs4")
+    assert result["Registration No."] == "23105110001"
+    assert result["Father's Name"] == "FATHER 001 & FAMILY"
+    assert result["Sem III"] != "" and result["Sem IV"] == ""
+
+
+@pytest.mark.parametrize("parser", sorted(PARSERS))
+def test_missing_student(parser):
+    assert parse_result_page(make_missing_page(), parser) is None
+
+
+@pytest.mark.parametrize("parser", sorted(PARSERS))
+def test_half_loaded_page_is_incomplete(parser):
+    page = PAGES[0]
+    truncated = page[:page.index('id="ContentPlaceHolder1_DataList5"')]  # name present, SGPA label not yet
+    assert try_parse_result_page(truncated, parser) == (None, False)
+
+
+def test_unknown_parser():
+    with pytest.raises(ValueError):
+        parse_result_page(PAGES[0], "html5lib")
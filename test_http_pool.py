@@ -0,0 +1,44 @@
+"""Growth of the shared keep-alive session and per-run connection counters."""
+
+import pytest
+
+import http_pool
+from benchmarks.mock_beu_api import MockBEUServer
+from http_pool import DEFAULT_POOL_SIZE, configure_pool, current_pool_size, get_session, pool_stats, pool_stats_since
+
+
+@pytest.fixture(autouse=True)
+def fresh_session(monkeypatch):
+    monkeypatch.setattr(http_pool, "_session", None)
+    monkeypatch.setattr(http_pool, "_session_pool_size", 0)
+
+
+def test_pool_only_grows_and_keeps_the_session():
+    session = configure_pool(32)
+    assert current_pool_size() == 32
+
+    assert configure_pool(8) is session  # another session asking for less changes nothing
+    assert current_pool_size() == 32
+    assert session.get_adapter("http://example.com")._pool_maxsize == 32
+
+    assert configure_pool(64) is session  # grown in place, not replaced
+    assert current_pool_size() == 64
+    assert session.get_adapter("https://example.com")._pool_maxsize == 64
+    assert get_session() is session
+
+
+def test_first_use_holds_at_least_the_default():
+    get_session(pool_size=2)
+    assert current_pool_size() == DEFAULT_POOL_SIZE
+
+
+def test_stats_since_reports_one_run_without_resetting():
+    with MockBEUServer(latency=0) as server:
+        get_session().get(server.result_url).close()
+        before = pool_stats()
+        for _ in range(3):
+            get_session().get(server.result_url).close()
+        run = pool_stats_since(before)
+
+    assert run == {"requests_sent": 3, "connections_opened": 0, "connections_reused": 3}
+    assert pool_stats()["requests_sent"] == before["requests_sent"] + 3
@@ -0,0 +1,63 @@
+"""Streaming fetches and the incremental processor versus the batch path."""
+
+import pytest
+from pandas.testing import assert_frame_equal
+
+from api_scraper import iter_semester_results
+from benchmarks.mock_beu_api import MockBEUServer
+from benchmarks.synthetic import make_cohort, make_payload
+from data_processor import IncrementalResultProcessor, build_subject_table, process_student_results
+
+
+def mixed_payloads():
+    cohort = make_cohort(910)
+    payloads = cohort[:200] + cohort[-10:]  # includes NULL marks and LE numbers with NULL SGPA/CGPA
+    extra = make_payload("23105110500", "III")
+    extra["theorySubjects"].append(dict(extra["theorySubjects"][0], name="ELECTIVE"))  # one more slot than the rest
+    payloads.insert(150, extra)
+    return payloads
+
+
+@pytest.mark.parametrize("chunk_size", [1, 16, 100, 5000])
+def test_matches_batch_processing(chunk_size):
+    payloads = mixed_payloads()
+    processor = IncrementalResultProcessor(chunk_size=chunk_size)
+    for payload in payloads:
+        processor.add(payload)
+
+    assert processor.count == len(payloads)
+    assert_frame_equal(processor.frame, process_student_results(payloads), check_like=True)
+    assert_frame_equal(processor.subjects, build_subject_table(payloads))
+
+
+def test_partial_frames_can_be_read_while_adding():
+    payloads = make_cohort(30)
+    processor = IncrementalResultProcessor(chunk_size=8)
+    flushed = [processor.add(payload) for payload in payloads[:10]]
+    assert flushed.count(True) == 1
+    assert len(processor.frame) == 10  # buffered rows are included
+
+    for payload in payloads[10:]:
+        processor.add(payload)
+    assert_frame_equal(processor.frame, process_student_results(payloads), check_like=True)
+
+
+def test_bad_payload_is_skipped():
+    processor = IncrementalResultProcessor()
+    assert not processor.add({"name": "BROKEN", "theorySubjects": 5})
+    processor.add(make_payload("23105110001", "III"))
+    assert processor.count == 1 and len(processor.frame) == 1
+
+
+def test_streaming_fetch_yields_every_student():
+    with MockBEUServer(latency=0, max_student=6) as server:
+        progress = []
+        stream = iter_semester_results(
+            1, 6, "105", "110", 3, 23, max_workers=6, base_url=server.result_url, use_cache=False,
+            on_progress=lambda done, total: progress.append(done)
+        )
+        processor = IncrementalResultProcessor(chunk_size=2)
+        for payload in stream:
+            processor.add(payload)
+    assert sorted(processor.frame["Registration No."]) == [f"23105110{n:03d}" for n in range(1, 7)]
+    assert sorted(progress) == list(range(1, 7))
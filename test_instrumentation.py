@@ -0,0 +1,92 @@
+"""Opt-in spans, counters and histograms, and what the fetch pipeline records."""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+import api_scraper
+import instrumentation
+from api_scraper import fetch_semester_results
+from benchmarks.mock_beu_api import MockBEUServer
+from instrumentation import Recorder, count, get_recorder, span, timed
+from retry_policy import RetryPolicy
+
+
+@pytest.fixture
+def recorder(monkeypatch):
+    fresh = Recorder()
+    monkeypatch.setattr(instrumentation, "_recorder", fresh)
+    monkeypatch.setattr(instrumentation, "_enabled", True)
+    return fresh
+
+
+def test_nothing_is_recorded_while_disabled(recorder, monkeypatch):
+    monkeypatch.setattr(instrumentation, "_enabled", False)
+    with span("work"):
+        count("requests")
+    assert recorder.spans() == [] and recorder.counters() == {}
+    assert recorder.summary().empty
+
+
+def test_spans_counters_and_summary(recorder):
+    for _ in range(3):
+        with span("work", engine="test"):
+            time.sleep(0.003)
+    count("requests")
+    count("bytes.received", 512)
+
+    assert get_recorder() is recorder
+    assert recorder.counters() == {"bytes.received": 512, "requests": 1}
+    assert recorder.spans()[0]["attrs"] == {"engine": "test"}
+    row = recorder.summary().iloc[0]
+    assert row["Span"] == "work" and row["Calls"] == 3
+    assert 3 <= row["p50 ms"] <= row["Max ms"] and row["Total ms"] >= 9
+
+    histogram = recorder.histogram("work")
+    assert histogram["Calls"].sum() == 3
+    assert histogram["Calls"].iloc[:2].sum() == 0  # nothing in the ≤1 ms and ≤2 ms buckets
+
+
+def test_timed_functions_and_coroutines(recorder):
+    @timed("sync.call")
+    def add(a, b):
+        return a + b
+
+    @timed()
+    async def wait():
+        await asyncio.sleep(0)
+        return "done"
+
+    assert add(1, 2) == 3
+    assert asyncio.run(wait()) == "done"
+    names = {s["name"] for s in recorder.spans()}
+    assert names == {"sync.call", f"{__name__}.wait"}
+
+
+def test_trace_export_is_chrome_trace_json(recorder):
+    with span("fetch.request"):
+        pass
+    count("retries", 2)
+    trace = json.loads(recorder.export_trace())
+    event = trace["traceEvents"][0]
+    assert event["name"] == "fetch.request" and event["ph"] == "X" and event["cat"] == "fetch"
+    assert trace["otherData"]["counters"] == {"retries": 2}
+    assert trace["otherData"]["summary"][0]["Calls"] == 1
+
+
+def test_fetch_pipeline_is_counted(recorder, monkeypatch):
+    monkeypatch.setattr(api_scraper, "DEFAULT_RETRY_POLICY", RetryPolicy(base_delay=0.01, max_delay=0.01))
+    with MockBEUServer(latency=0, max_student=3) as server:
+        fetch_semester_results(1, 4, "105", "110", 3, 23, max_workers=4, base_url=server.result_url, use_cache=False)
+    counters = recorder.counters()
+    assert counters["requests"] == 4 and counters["bytes.received"] > 0
+    summary = recorder.summary().set_index("Span")
+    assert summary.loc["fetch.request", "Calls"] == 4
+    assert summary.loc["fetch.polite_sleep", "Calls"] == 4
+
+    with MockBEUServer(latency=0, error_rate=1.0) as failing:
+        fetch_semester_results(1, 1, "105", "110", 3, 23, base_url=failing.result_url, use_cache=False)
+    counters = recorder.counters()
+    assert counters["retries"] == 2 and counters["requests.failed"] == 3
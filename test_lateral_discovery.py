@@ -0,0 +1,62 @@
+"""LE discovery against the mock API, and its use of the cached LE bounds."""
+
+import asyncio
+
+import pytest
+
+import result_cache
+import scraper
+from api_scraper import fetch_semester_results, fetch_semester_results_async
+from benchmarks.mock_beu_api import MockBEUServer
+from result_cache import ResultCache
+
+COMMON = dict(reg_start=1, reg_end=3, branch="105", college="110", semester=3, batch=23, include_lateral=True)
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    """A throwaway process-wide result cache, so the real one is never touched."""
+    temporary = ResultCache(str(tmp_path / "results.sqlite"))
+    monkeypatch.setattr(result_cache, "_cache", temporary)
+    return temporary
+
+
+@pytest.fixture
+def server():
+    with MockBEUServer(latency=0, max_student=3, max_lateral=906) as mock:
+        yield mock
+
+
+def lateral_numbers(results):
+    return sorted(int(str(payload["redg_no"])[-3:]) for payload in results if int(str(payload["redg_no"])[-3:]) > 900)
+
+
+def test_threaded_without_cache_leaves_bound_alone(cache, server):
+    results = fetch_semester_results(**COMMON, max_workers=8, base_url=server.result_url, use_cache=False)
+    assert lateral_numbers(results) == list(range(901, 907))
+    assert cache.get_le_bound(23, "105", "110") is None
+
+
+def test_async_without_cache_leaves_bound_alone(cache, server):
+    results = asyncio.run(fetch_semester_results_async(**COMMON, base_url=server.result_url, use_cache=False))
+    assert lateral_numbers(results) == list(range(901, 907))
+    assert cache.get_le_bound(23, "105", "110") is None
+
+
+def test_stale_bound_is_ignored_without_cache(cache, server):
+    cache.set_le_bound(23, "105", "110", 999)  # would make discovery request 901-999 directly
+    asyncio.run(fetch_semester_results_async(**COMMON, base_url=server.result_url, use_cache=False))
+    assert server.requests_served < 30
+    assert cache.get_le_bound(23, "105", "110") == 999
+
+
+def test_bound_is_remembered_with_cache(cache, server):
+    asyncio.run(fetch_semester_results_async(**COMMON, base_url=server.result_url, use_cache=True))
+    assert cache.get_le_bound(23, "105", "110") == 906
+
+
+def test_legacy_discovery_without_cache(cache):
+    with MockBEUServer(latency=0, max_lateral=902) as mock:
+        results = scraper.discover_lateral_results(mock.legacy_url, 24105110901, 23, "105", "110", use_cache=False)
+    assert sorted(r["Registration No."] for r in results) == ["24105110901", "24105110902"]
+    assert cache.get_le_bound(23, "105", "110") is None
@@ -0,0 +1,46 @@
+"""Merging newly fetched students into a saved results slice."""
+
+import copy
+
+from pandas.testing import assert_frame_equal
+
+from benchmarks.synthetic import make_cohort
+from data_processor import compact_results, merge_results, normalize_results
+from result_store import ResultStore, slice_key
+
+SESSION = dict(batch=23, branch="105", college="110", semester=3, exam_month="July", exam_year=2025)
+
+
+def test_merge_into_saved_slice(tmp_path):
+    cohort = make_cohort(40)
+    store = ResultStore(str(tmp_path))
+    store.save(compact_results(normalize_results(cohort[:30])), **SESSION)
+    saved = store.load_slices(store.find(**slice_key(**SESSION)))
+
+    # Students 21-30 are fetched again (with a changed name and an unseen grade) alongside 31-40
+    refetched = copy.deepcopy(cohort[20:30])
+    for payload in refetched:
+        payload["name"] += " (CORRECTED)"
+        payload["theorySubjects"][0]["grade"] = "X"
+    refetched[0]["theorySubjects"].append(dict(refetched[0]["theorySubjects"][0], name="EXTRA SUBJECT"))
+    new = normalize_results(refetched + cohort[30:])
+
+    merged = merge_results(saved, new)
+
+    assert len(merged) == 40
+    assert not merged["Registration No."].duplicated().any()
+    assert merged["Registration No."].tolist() == [str(p["redg_no"]) for p in cohort[:20] + refetched + cohort[30:]]
+    assert merged["Student Name"].iloc[20:30].str.endswith("(CORRECTED)").all()  # the later fetch wins
+    assert (merged["Theory_1_Grade"].iloc[20:30] == "X").all()
+    for column in saved.columns:
+        assert merged[column].dtype.name == saved[column].dtype.name, column
+    assert merged["Theory_7_Name"].dtype.name == "category"  # slot only the new rows have
+
+    # Same rows and values as compacting the whole concatenation
+    expected = compact_results(normalize_results(cohort[:20] + refetched + cohort[30:]))
+    assert_frame_equal(merged, expected[merged.columns], check_categorical=False)
+
+
+def test_merge_without_saved_rows():
+    new = normalize_results(make_cohort(5))
+    assert_frame_equal(merge_results(None, new), compact_results(new))
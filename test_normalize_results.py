@@ -0,0 +1,52 @@
+"""Batched normalize_results must match the row-by-row reference exactly."""
+
+import pytest
+from pandas.testing import assert_frame_equal
+
+from benchmarks.synthetic import make_cohort, make_payload
+from data_processor import normalize_results, process_student_results_rowwise
+from test_cgpa_null import sample as cgpa_null_sample
+from test_parse_le import le_sample
+
+
+@pytest.mark.parametrize("payloads", [
+    [le_sample],
+    [cgpa_null_sample],
+    [le_sample, cgpa_null_sample],
+    make_cohort(1200),  # spans two college codes, includes LE numbers 901-999
+    [make_payload("23105110001", semester) for semester in ("I", "V", "VIII")],
+])
+def test_matches_rowwise(payloads):
+    assert_frame_equal(process_student_results_rowwise(payloads), normalize_results(payloads), check_exact=True)
+
+
+def test_empty():
+    assert_frame_equal(process_student_results_rowwise([]), normalize_results([]), check_exact=True)
+
+
+def test_null_sgpa_and_cgpa():
+    row = normalize_results([le_sample]).iloc[0]
+    assert row["Current SGPA"] == 7.96
+    assert row["CGPA"] == 7.96  # a NULL CGPA falls back to the latest SGPA
+
+
+def malformed(**fields):
+    return {**make_payload("23105110002", "III"), **fields}
+
+
+@pytest.mark.parametrize("bad", [
+    malformed(theorySubjects={"name": "Maths"}),  # dict instead of a list
+    malformed(theorySubjects="Maths", practicalSubjects="Lab"),
+    malformed(practicalSubjects=7),
+    malformed(
+        theorySubjects=({"name": "Maths", "grade": "A", "total": "80", "credit": "3"},),
+        practicalSubjects=({"name": "Lab", "grade": "B", "total": "70", "credit": "1"},),
+    ),  # tuples are accepted
+    malformed(theorySubjects=({"name": "Maths"},)),  # a tuple and a list do not add up
+    malformed(sgpa="7.5"),  # a string is iterated like the row-wise path does
+    malformed(sgpa=7.5),
+    malformed(theorySubjects=["Maths"]),  # subject entry that is not a dict
+])
+def test_malformed_payloads_fall_back_like_rowwise(bad):
+    payloads = [make_payload("23105110001", "III"), bad, make_payload("23105110003", "III")]
+    assert_frame_equal(process_student_results_rowwise(payloads), normalize_results(payloads), check_exact=True)
@@ -0,0 +1,71 @@
+"""Data View and Filter & Sort send one page of the selected columns to the browser."""
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+import result_cache
+import result_store
+from benchmarks.synthetic import make_cohort
+from data_processor import compact_results, normalize_results
+
+SHOWN = ["Registration No.", "Student Name", "College Name", "Current SGPA", "CGPA", "Status"]
+
+
+@pytest.fixture(autouse=True)
+def local_data(tmp_path, monkeypatch):
+    """The sidebar reads the result cache and saved datasets; keep both away from the real ones."""
+    monkeypatch.setattr(result_cache, "_cache", result_cache.ResultCache(str(tmp_path / "results.sqlite")))
+    monkeypatch.setattr(result_store, "_store", result_store.ResultStore(str(tmp_path / "data")))
+
+
+def run_app(n):
+    app = AppTest.from_file("app.py", default_timeout=60)
+    app.session_state["df_v2"] = compact_results(normalize_results(make_cohort(n)))
+    app.run()
+    assert not app.exception
+    return app
+
+
+def data_view(app):
+    return app.dataframe[-2].value
+
+
+def filter_view(app):
+    return app.dataframe[-1].value
+
+
+@pytest.fixture(scope="module")
+def df():
+    return compact_results(normalize_results(make_cohort(120)))
+
+
+def test_data_view_shows_one_page_of_the_selected_columns(df):
+    app = run_app(120)
+    assert data_view(app).shape == (50, len(SHOWN))
+    assert list(data_view(app).columns) == SHOWN
+
+    app.number_input(key="v2_data_view_page").set_value(3).run()
+    assert data_view(app)["Registration No."].tolist() == df["Registration No."].iloc[100:].tolist()
+
+    app.selectbox(key="v2_data_view_page_size").set_value(25).run()
+    app.multiselect(key="v2_display_cols").set_value(["Registration No.", "CGPA"]).run()
+    assert data_view(app).shape == (25, 2)
+
+
+def test_filter_view_pages_over_the_matching_rows(df):
+    app = run_app(120)
+    app.number_input(key="v2_filter_view_page").set_value(3).run()
+    assert len(filter_view(app)) == 20
+
+    app.multiselect(key="status_filter_v2").set_value(["FAIL"]).run()
+    failed = int((df["Status"] == "FAIL").sum())
+    assert 0 < failed <= 50
+    assert app.number_input(key="v2_filter_view_page").value == 1  # clamped to the only page left
+    assert len(filter_view(app)) == failed
+    assert set(filter_view(app)["Status"]) == {"FAIL"}
+
+
+def test_small_tables_are_not_paginated():
+    app = run_app(20)
+    assert len(data_view(app)) == 20
+    assert not [widget for widget in app.number_input if widget.key == "v2_data_view_page"]
@@ -0,0 +1,66 @@
+"""Range probing and the negative cache for students the API has no record of."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import result_cache
+from api_scraper import FAILED, FOUND, MISSING, fetch_semester_results, iter_probe_registrations
+from benchmarks.mock_beu_api import MockBEUServer
+from result_cache import ResultCache
+
+COMMON = dict(branch="105", college="110", semester=3, batch=23, max_workers=8)
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    temporary = ResultCache(str(tmp_path / "results.sqlite"))
+    monkeypatch.setattr(result_cache, "_cache", temporary)
+    return temporary
+
+
+def probe(outcomes, miss_streak=3, window=1):
+    """Probes numbers 1..len(outcomes); returns the numbers that were looked up."""
+    asked = []
+
+    def fetch_status(registration_no, api_batch):
+        asked.append(int(registration_no))
+        return outcomes[int(registration_no) - 1], None
+
+    registrations = [(str(n), 23) for n in range(1, len(outcomes) + 1)]
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        list(iter_probe_registrations(executor, registrations, fetch_status, miss_streak, window))
+    return asked
+
+
+def test_probe_stops_after_miss_streak():
+    outcomes = [FOUND, MISSING, MISSING, FOUND] + [MISSING] * 10
+    assert probe(outcomes) == [1, 2, 3, 4, 5, 6, 7]  # a gap shorter than the streak is crossed
+
+
+def test_failures_neither_extend_nor_break_the_streak():
+    outcomes = [FOUND, MISSING, FAILED, MISSING, FAILED, MISSING, FOUND]
+    assert probe(outcomes) == [1, 2, 3, 4, 5, 6]
+
+
+def test_probe_finishes_the_current_window():
+    assert probe([FOUND] + [MISSING] * 20, miss_streak=3, window=8) == list(range(1, 9))
+
+
+def test_negative_cache_skips_known_missing_students(cache):
+    with MockBEUServer(latency=0, max_student=3) as server:
+        first = fetch_semester_results(1, 6, **COMMON, base_url=server.result_url)
+        assert len(first) == 3 and server.requests_served == 6
+        assert cache.stats()["missing"] == 3
+
+        second = fetch_semester_results(1, 6, **COMMON, base_url=server.result_url)
+        assert len(second) == 3 and server.requests_served == 6  # nothing was requested again
+
+
+def test_probed_fetch_stops_past_the_dense_range(cache):
+    with MockBEUServer(latency=0, max_student=3) as server:
+        results = fetch_semester_results(
+            1, 999, **COMMON, base_url=server.result_url, use_cache=False, probe=True, miss_streak=5
+        )
+        assert len(results) == 3
+        assert server.requests_served <= 16  # 3 found + 5 missing, rounded up to whole windows
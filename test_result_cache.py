@@ -0,0 +1,68 @@
+"""TTL expiry, size-based eviction and clearing of the on-disk result cache."""
+
+import time
+
+import pytest
+
+from result_cache import ResultCache
+
+PAYLOAD = {"redg_no": "23105110001", "name": "STUDENT 001", "sgpa": ["7.50"]}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controls time.time() as seen by the cache; advance with clock[0] += seconds."""
+    now = [time.time()]
+    monkeypatch.setattr(time, "time", lambda: now[0])
+    return now
+
+
+def open_cache(tmp_path, **options) -> ResultCache:
+    return ResultCache(str(tmp_path / "results.sqlite"), **options)
+
+
+def test_round_trip_and_persistence(tmp_path):
+    cache = open_cache(tmp_path)
+    cache.put("23105110001", "III", "July/2025", PAYLOAD)
+    assert cache.get("23105110001", "III", "July/2025") == PAYLOAD
+    assert cache.get("23105110001", "IV", "July/2025") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    reopened = open_cache(tmp_path)
+    assert reopened.get("23105110001", "III", "July/2025") == PAYLOAD
+    assert reopened.stats()["bytes"] == cache.stats()["bytes"] > 0
+
+
+def test_entries_expire_after_ttl(tmp_path, clock):
+    cache = open_cache(tmp_path, ttl=60)
+    cache.put("23105110001", "III", "July/2025", PAYLOAD)
+    clock[0] += 59
+    assert cache.get("23105110001", "III", "July/2025") == PAYLOAD
+    clock[0] += 2
+    assert cache.get("23105110001", "III", "July/2025") is None
+    assert cache.stats()["entries"] == 0 and cache.stats()["bytes"] == 0
+
+
+def test_oldest_entries_are_evicted_over_max_bytes(tmp_path, clock):
+    size = len('{"redg_no":"23105110001","name":"STUDENT 001","sgpa":["7.50"]}')
+    cache = open_cache(tmp_path, max_bytes=3 * size)
+    for n in range(1, 5):
+        clock[0] += 1
+        cache.put(f"2310511000{n}", "III", "July/2025", PAYLOAD)
+
+    assert cache.stats()["entries"] == 3 and cache.stats()["bytes"] <= 3 * size
+    assert cache.get("23105110001", "III", "July/2025") is None  # the oldest went first
+    assert cache.get("23105110004", "III", "July/2025") == PAYLOAD
+
+
+def test_clear_removes_everything(tmp_path):
+    cache = open_cache(tmp_path)
+    cache.put("23105110001", "III", "July/2025", PAYLOAD)
+    cache.mark_missing("23105110002", "III", "July/2025")
+    cache.set_le_bound(23, "105", "110", 930)
+
+    cache.clear()
+
+    assert cache.stats()["entries"] == 0 and cache.stats()["missing"] == 0 and cache.stats()["bytes"] == 0
+    assert cache.get_le_bound(23, "105", "110") is None
+    assert open_cache(tmp_path).get_le_bound(23, "105", "110") is None
@@ -0,0 +1,77 @@
+"""Save/find/load round-trips through the partitioned result store."""
+
+import pytest
+from pandas.testing import assert_frame_equal
+
+from benchmarks.synthetic import make_cohort
+from data_processor import build_subject_table, compact_results, normalize_results, subject_table_from_frame
+from result_store import ResultStore, slice_key
+
+SESSION = dict(batch=23, branch="105", semester=3, exam_month="July", exam_year=2025)
+
+
+def class_payloads(college: str, n: int = 30):
+    return make_cohort(n, college=college)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ResultStore(str(tmp_path))
+
+
+def test_round_trip(store):
+    payloads = class_payloads("110")
+    df = compact_results(normalize_results(payloads))
+    subjects = build_subject_table(payloads)
+    store.save(df, subjects, college="110", **SESSION)
+
+    keys = store.find(batch=23, college="110")
+    assert keys == [slice_key(college="110", **SESSION)]
+    assert_frame_equal(store.load_slices(keys), df)
+    assert_frame_equal(store.load_slices(keys, table="subjects"), subjects)
+    assert store.slices()["students"].tolist() == [len(df)]
+
+
+def test_find_filters_and_column_selection(store):
+    for college in ("110", "108"):
+        store.save(compact_results(normalize_results(class_payloads(college))), college=college, **SESSION)
+    assert [key["college"] for key in store.find()] == ["108", "110"]
+    assert [key["college"] for key in store.find(college=["108", "999"])] == ["108"]
+    assert store.find(semester=4) == []
+
+    loaded = store.load(columns=["Registration No.", "Current SGPA", "No Such Column"], batch=23)
+    assert list(loaded.columns) == ["Registration No.", "Current SGPA"]
+    assert len(loaded) == 60
+
+
+def test_slice_without_subjects_table(store):
+    plain = class_payloads("110")
+    plain_df = compact_results(normalize_results(plain))
+    store.save(plain_df, None, college="110", **SESSION)
+
+    subjects = store.load(table="subjects", college="110")
+    assert subjects is not None and len(subjects)
+    # Rebuilt from the wide frame; the all-missing Subject Code column may differ in category dtype
+    assert_frame_equal(subjects, subject_table_from_frame(plain_df), check_dtype=False, check_categorical=False)
+
+    # Mixed with a slice that has its table: every student keeps their subject rows
+    full = class_payloads("108", 20)
+    store.save(compact_results(normalize_results(full)), build_subject_table(full), college="108", **SESSION)
+    mixed = store.load(table="subjects")
+    assert mixed["Registration No."].nunique() == 50
+    assert len(mixed) == len(subjects) + len(build_subject_table(full))
+
+
+def test_saving_without_subjects_removes_a_stale_table(store):
+    payloads = class_payloads("110")
+    df = compact_results(normalize_results(payloads))
+    store.save(df, build_subject_table(payloads), college="110", **SESSION)
+    store.save(df.head(10), None, college="110", **SESSION)
+    assert store.load(table="subjects")["Registration No."].nunique() == 10
+
+
+def test_unknown_table_and_partition(store):
+    with pytest.raises(ValueError):
+        store.load_slices([], table="grades")
+    with pytest.raises(ValueError):
+        store.find(year=2025)
@@ -0,0 +1,128 @@
+"""State transitions of the circuit breaker and the retry budget, and how both engines retry."""
+
+import asyncio
+import time
+
+import aiohttp
+import pytest
+
+import api_scraper
+from benchmarks.mock_beu_api import MockBEUServer
+from retry_policy import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, RetryBudget, RetryPolicy, get_circuit_breaker
+
+
+def make_breaker(cooldown: float = 0.05) -> CircuitBreaker:
+    return CircuitBreaker(window=10, error_threshold=0.5, min_requests=4, cooldown=cooldown)
+
+
+def test_breaker_needs_min_requests():
+    breaker = make_breaker()
+    for _ in range(3):
+        breaker.record_failure()
+    assert breaker.state == CLOSED and breaker.wait_time() == 0.0
+
+
+def test_breaker_stays_closed_below_threshold():
+    breaker = make_breaker()
+    for _ in range(3):
+        breaker.record_success()
+        breaker.record_success()
+        breaker.record_failure()
+    assert breaker.state == CLOSED
+
+
+def test_breaker_opens_then_half_opens_then_closes():
+    breaker = make_breaker()
+    for _ in range(4):
+        breaker.record_failure()
+    assert breaker.state == OPEN and breaker.times_opened == 1
+    assert 0 < breaker.wait_time() <= 0.05
+
+    time.sleep(0.06)
+    assert breaker.wait_time() == 0.0  # this caller runs the trial request
+    assert breaker.state == HALF_OPEN
+    assert breaker.wait_time() > 0  # everyone else waits for its outcome
+
+    breaker.record_success()
+    assert breaker.state == CLOSED and breaker.error_rate() == 0.0
+    assert breaker.wait_time() == 0.0
+
+
+def test_failed_trial_reopens():
+    breaker = make_breaker()
+    for _ in range(4):
+        breaker.record_failure()
+    time.sleep(0.06)
+    assert breaker.wait_time() == 0.0
+    breaker.record_failure()
+    assert breaker.state == OPEN and breaker.times_opened == 2
+
+
+def test_abandoned_trial_is_handed_to_the_next_caller():
+    breaker = make_breaker(cooldown=0.02)
+    for _ in range(4):
+        breaker.record_failure()
+    time.sleep(0.03)
+    assert breaker.wait_time() == 0.0  # trial starts but never reports back
+    time.sleep(0.03)
+    assert breaker.wait_time() == 0.0
+
+
+def test_budget_floor_then_ratio():
+    budget = RetryBudget(ratio=0.2, min_retries=2)
+    assert budget.try_spend() and budget.try_spend()
+    assert not budget.try_spend()
+
+    for _ in range(10):
+        budget.record_request()  # 2 + 0.2 * 10 = 4 retries allowed in total
+    assert budget.try_spend() and budget.try_spend()
+    assert not budget.try_spend()
+    assert budget.retries == 4
+
+
+def test_policy_delay():
+    policy = RetryPolicy(base_delay=1.0, max_delay=5.0, jitter=False, max_retry_after=60.0)
+    assert [policy.delay(attempt) for attempt in range(4)] == [1.0, 2.0, 4.0, 5.0]
+    assert policy.delay(0, retry_after=10.0) == 10.0
+    assert policy.delay(0, retry_after=600.0) == 60.0
+
+    jittered = RetryPolicy(base_delay=1.0, max_delay=5.0)
+    assert all(0.0 <= jittered.delay(3) <= 5.0 for _ in range(100))
+
+
+@pytest.fixture
+def quick_retries(monkeypatch):
+    monkeypatch.setattr(api_scraper, "DEFAULT_RETRY_POLICY", RetryPolicy(base_delay=0.01, max_delay=0.01))
+
+
+def lookup_threaded(base_url: str):
+    return api_scraper.fetch_result_status(
+        "23105110001", "III", 23, "July", 2025, base_url=base_url, use_cache=False
+    )
+
+
+def lookup_async(base_url: str):
+    async def lookup():
+        async with aiohttp.ClientSession() as session:
+            return await api_scraper.fetch_result_status_async(
+                session, "23105110001", "III", 23, "July", 2025, base_url=base_url, use_cache=False
+            )
+
+    return asyncio.run(lookup())
+
+
+@pytest.mark.parametrize("lookup", [lookup_threaded, lookup_async])
+def test_client_error_fails_without_retry(quick_retries, lookup):
+    with MockBEUServer(latency=0) as server:
+        base_url = f"{server.base}/backend/v1/result/unknown"  # answered with 404
+        assert lookup(base_url) == (api_scraper.FAILED, None)
+        assert server.requests_served == 1
+    assert get_circuit_breaker(base_url).error_rate() == 0.0
+
+
+@pytest.mark.parametrize("lookup", [lookup_threaded, lookup_async])
+def test_server_error_is_retried(quick_retries, lookup):
+    with MockBEUServer(latency=0, error_rate=1.0) as server:  # every request gets a 503
+        assert lookup(server.result_url) == (api_scraper.FAILED, None)
+        assert server.requests_served == 3
+    assert get_circuit_breaker(server.result_url).error_rate() == 1.0
@@ -0,0 +1,88 @@
+"""Student x semester histories built from several semesters' payloads."""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from api_scraper import fetch_semesters_async
+from benchmarks.mock_beu_api import MockBEUServer
+from data_processor import STATUS_FAIL, STATUS_PASS, STATUS_UNKNOWN, build_student_history
+
+
+def payload(redg_no, semester, sgpa, cgpa, fail_any="PASS", name=None):
+    return {
+        "redg_no": redg_no, "name": name or f"STUDENT {redg_no[-3:]}", "college_code": 110,
+        "college_name": "GAYA COLLEGE OF ENGINEERING, GAYA", "course_code": 105, "course": "CSE",
+        "semester": semester, "sgpa": sgpa + [None] * (8 - len(sgpa)), "cgpa": cgpa, "fail_any": fail_any,
+    }
+
+
+@pytest.fixture
+def history():
+    return build_student_history({
+        1: [
+            payload("23105110001", "I", ["7.00"], "7.00", name="OLD NAME"),
+            payload("23105110003", "I", ["6.00"], "6.00", fail_any="FAIL"),  # left after semester I
+        ],
+        2: [],
+        3: [
+            payload("23105110001", "III", ["7.00", "8.00", "9.00"], "8.00"),
+            payload("24105110901", "III", ["NULL", "NULL", "8.50"], "NULL"),  # lateral entry
+        ],
+    })
+
+
+def test_one_row_per_student_with_latest_details(history):
+    students = history.students.set_index("Registration No.")
+    assert sorted(students.index) == ["23105110001", "23105110003", "24105110901"]
+    assert students.loc["23105110001", "Student Name"] == "STUDENT 001"  # from semester III
+    assert list(history.semesters) == [1, 2, 3]
+    assert history.sgpa.shape == history.cgpa.shape == history.status.shape == (3, 3)
+
+
+def test_matrices(history):
+    row = {reg: i for i, reg in enumerate(history.students["Registration No."])}
+    np.testing.assert_array_equal(history.sgpa[row["23105110001"]], [7.0, 8.0, 9.0])  # semester II from the array
+    np.testing.assert_array_equal(history.sgpa[row["24105110901"]], [np.nan, np.nan, 8.5])
+    np.testing.assert_array_equal(history.sgpa[row["23105110003"]], [6.0, np.nan, np.nan])
+    np.testing.assert_array_equal(history.cgpa[row["23105110001"]], [7.0, np.nan, 8.0])  # fetched semesters only
+    assert history.status[row["23105110003"]].tolist() == [STATUS_FAIL, STATUS_UNKNOWN, STATUS_UNKNOWN]
+    assert history.status[row["23105110001"]].tolist() == [STATUS_PASS, STATUS_UNKNOWN, STATUS_PASS]
+
+
+def test_trends(history):
+    trends = history.trends().set_index("Registration No.")
+    steady = trends.loc["23105110001"]
+    assert steady["Semesters"] == 3 and steady["SGPA Change"] == 2.0
+    assert steady["SGPA Trend"] == pytest.approx(np.polyfit([1, 2, 3], [7, 8, 9], 1)[0])
+    assert steady["Best Semester"] == 3 and steady["Latest CGPA"] == 8.0
+
+    assert np.isnan(trends.loc["24105110901", "SGPA Trend"])  # one semester has no slope
+    assert trends.loc["23105110003", "Failed Semesters"] == 1
+
+
+def test_semester_summary(history):
+    summary = history.semester_summary().set_index("Semester")
+    assert summary.loc[1, "Students"] == 2 and summary.loc[1, "Avg SGPA"] == 6.5
+    assert summary.loc[1, "Pass Rate %"] == 50.0
+    assert summary.loc[3, "Max SGPA"] == 9.0
+
+
+def test_empty_history():
+    history = build_student_history({3: []})
+    assert len(history) == 0 and history.sgpa.shape == (0, 0)
+    assert len(history.trends()) == 0
+
+
+def test_fetched_semesters_build_one_history():
+    sessions = {1: ("December", 2023), 2: ("July", 2024), 3: ("December", 2024)}
+    with MockBEUServer(latency=0, max_student=4) as server:
+        results = asyncio.run(fetch_semesters_async(
+            1, 5, "105", "110", 23, sessions, rate_per_host=500, base_url=server.result_url, use_cache=False
+        ))
+    assert sorted(results) == [1, 2, 3] and all(len(payloads) == 4 for payloads in results.values())
+
+    history = build_student_history(results)
+    assert len(history) == 4 and history.sgpa.shape == (4, 3)
+    assert (history.status != STATUS_UNKNOWN).all()
@@ -0,0 +1,64 @@
+"""The long subject table: one row per (student, subject), consistent with the wide columns."""
+
+import numpy as np
+import pandas as pd
+from pandas.testing import assert_frame_equal
+
+from benchmarks.synthetic import make_cohort, make_payload
+from data_processor import (
+    SUBJECT_TABLE_COLUMNS, build_subject_table, concat_subject_tables, normalize_results, subject_table_from_frame
+)
+
+KEY = ["Registration No.", "Type", "Slot"]
+
+
+def sorted_table(table):
+    return table.sort_values(KEY).reset_index(drop=True)
+
+
+def test_one_row_per_subject_with_compact_dtypes():
+    payloads = make_cohort(50)
+    table = build_subject_table(payloads)
+    wide = normalize_results(payloads)
+
+    assert list(table.columns) == SUBJECT_TABLE_COLUMNS
+    assert len(table) == wide["Total Subjects"].sum()
+    assert not table.duplicated(KEY).any()
+    assert table["Type"].dtype == pd.CategoricalDtype(["Theory", "Practical"])
+    assert all(table[column].dtype.name == "category" for column in ("Subject Code", "Subject", "Grade"))
+    assert table["Slot"].dtype == np.int8 and table["Credit"].dtype == np.float32
+    assert all(table[column].dtype.name == "Int16" for column in ("ESE", "IA", "Total"))
+
+
+def test_matches_the_wide_columns():
+    payloads = make_cohort(50)
+    from_payloads = sorted_table(build_subject_table(payloads))
+    from_wide = sorted_table(subject_table_from_frame(normalize_results(payloads)))
+
+    shared = ["Registration No.", "Type", "Slot", "Subject", "Total", "Grade", "Credit"]
+    assert_frame_equal(from_wide[shared], from_payloads[shared], check_categorical=False)
+    assert from_wide["Subject Code"].isna().all() and from_wide["ESE"].isna().all()
+
+
+def test_electives_in_the_same_slot_stay_apart():
+    first, second = make_payload("23105110001", "III"), make_payload("23105110002", "III")
+    first["theorySubjects"][0].update(code="ELEC1", name="ELECTIVE ONE", total="90")
+    second["theorySubjects"][0].update(code="ELEC2", name="ELECTIVE TWO", total="40")
+    table = build_subject_table([first, second])
+
+    by_subject = table.groupby("Subject", observed=True)["Total"].mean()
+    assert by_subject["ELECTIVE ONE"] == 90 and by_subject["ELECTIVE TWO"] == 40
+
+
+def test_null_marks_are_missing_not_zero():
+    payload = make_payload("23105110001", "III")
+    payload["theorySubjects"][0].update(ese="NE", ia="NULL", total=None)
+    row = build_subject_table([payload]).iloc[0]
+    assert row["ESE"] is pd.NA and row["IA"] is pd.NA and row["Total"] is pd.NA
+
+
+def test_concat_rederives_categories():
+    payloads = make_cohort(40)
+    parts = [build_subject_table(payloads[:15]), build_subject_table(payloads[15:])]
+    assert_frame_equal(concat_subject_tables(parts), build_subject_table(payloads))
+    assert_frame_equal(concat_subject_tables([]), build_subject_table([]))